@@ -2,13 +2,18 @@
 Analysis package
 """
 
-from .correlation_analysis import CorrelationAnalyzer, generate_correlation_report
-from .spike_detector import SpikeDetector, RealTimeSpikeMonitor
+from .correlation_analysis import CorrelationAnalyzer, generate_correlation_report, lag_cross_correlation, forward_extremes
+from .correlation_service import WindowCorrelationService
+from .spike_detector import SpikeDetector, RealTimeSpikeMonitor, StreamingSpikeDetector
 
 __all__ = [
     'CorrelationAnalyzer',
     'generate_correlation_report',
+    'lag_cross_correlation',
+    'forward_extremes',
+    'WindowCorrelationService',
     'SpikeDetector',
-    'RealTimeSpikeMonitor'
+    'RealTimeSpikeMonitor',
+    'StreamingSpikeDetector'
 ]
 
@@ -9,22 +9,176 @@
 
 import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from scipy import stats
 from statsmodels.tsa.stattools import grangercausalitytests
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
 import warnings
 
 warnings.filterwarnings('ignore')
 
 
+# 그랜저 검정 결과 캐시: (원인, 결과, 시차, 구간, 데이터 해시) -> 결과 행 리스트
+# 구간/데이터가 바뀔 때마다 키가 늘어나므로 최근 사용 순으로 _GRANGER_CACHE_SIZE개만 보관
+_GRANGER_CACHE = OrderedDict()
+_GRANGER_CACHE_SIZE = 512
+
+
+def _run_granger(cause, effect, values, lags):
+    """
+    그랜저 인과관계 검정 1건 실행 (프로세스 풀 작업 단위)
+    
+    Args:
+        cause: 원인 변수명
+        effect: 결과 변수명
+        values: (N, 2) 배열 [결과, 원인]
+        lags: 최대 시차(int) 또는 검정할 시차 리스트
+        
+    Returns:
+        list: 시차별 결과 딕셔너리
+    """
+    max_lag = lags if isinstance(lags, int) else max(lags)
+    
+    if len(values) < max_lag * 3:
+        return [{
+            'cause': cause, 'effect': effect, 'lag': np.nan,
+            'f_statistic': np.nan, 'p_value': np.nan, 'significant': False,
+            'n_obs': len(values),
+            'error': f'데이터가 충분하지 않습니다 (필요: {max_lag * 3}, 실제: {len(values)})'
+        }]
+    
+    try:
+        # H0: cause는 effect의 원인이 아니다
+        test_result = grangercausalitytests(values, lags, verbose=False)
+    except Exception as e:
+        return [{
+            'cause': cause, 'effect': effect, 'lag': np.nan,
+            'f_statistic': np.nan, 'p_value': np.nan, 'significant': False,
+            'n_obs': len(values), 'error': str(e)
+        }]
+    
+    rows = []
+    for lag in sorted(test_result):
+        ssr_ftest = test_result[lag][0]['ssr_ftest']
+        rows.append({
+            'cause': cause,
+            'effect': effect,
+            'lag': lag,
+            'f_statistic': ssr_ftest[0],
+            'p_value': ssr_ftest[1],
+            'significant': ssr_ftest[1] < 0.05,
+            'n_obs': len(values),
+            'error': None
+        })
+    
+    return rows
+
+
+def forward_extremes(values, horizon):
+    """
+    각 시점부터 horizon 시간 뒤까지(양 끝 포함)의 최대/최소값
+    
+    Args:
+        values: 1차원 배열
+        horizon: 전방 윈도우 크기 (시간)
+        
+    Returns:
+        tuple: (max, min) 배열 - 끝의 horizon개 시점은 윈도우가 모자라 NaN
+    """
+    values = np.asarray(values, dtype=np.float64)
+    forward_max = np.full(len(values), np.nan)
+    forward_min = np.full(len(values), np.nan)
+    
+    if len(values) > horizon:
+        windows = sliding_window_view(values, horizon + 1)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', category=RuntimeWarning)
+            forward_max[:len(windows)] = np.nanmax(windows, axis=1)
+            forward_min[:len(windows)] = np.nanmin(windows, axis=1)
+    
+    return forward_max, forward_min
+
+
+def lag_cross_correlation(x, y, max_lag):
+    """
+    시차 0..max_lag 의 피어슨 상관계수를 한 번에 계산
+    
+    lag L의 상관계수는 x[:-L]과 y[L:] (x가 L시간 선행)의 pearsonr과 같습니다.
+    교차곱 합은 FFT로, 구간 합/제곱합은 누적합으로 구하므로 시차 수와 무관하게
+    O(N log N)이며, 2차원 입력이면 같은 위치의 컬럼 쌍들을 한 번에 계산합니다.
+    
+    Args:
+        x: 선행 변수 배열 (N,) 또는 (N, k)
+        y: 후행 변수 배열 (x와 같은 shape)
+        max_lag: 최대 시차
+        
+    Returns:
+        tuple: (correlation, p_value, n) - 각각 (max_lag+1,) 또는 (max_lag+1, k)
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    squeeze = x.ndim == 1
+    if squeeze:
+        x = x[:, None]
+        y = y[:, None]
+    
+    length = x.shape[0]
+    lags = np.arange(max_lag + 1)
+    n = (length - lags)[:, None].astype(np.float64)
+    
+    # 전체 평균으로 중심화하여 합계의 자릿수 손실을 줄임 (상관계수는 변하지 않음)
+    x = x - x.mean(axis=0)
+    y = y - y.mean(axis=0)
+    
+    # cross[L] = sum_i x[i] * y[i + L]
+    size = 1 << int(np.ceil(np.log2(2 * length)))
+    cross = np.fft.irfft(np.conj(np.fft.rfft(x, size, axis=0)) * np.fft.rfft(y, size, axis=0), size, axis=0)
+    cross = cross[:max_lag + 1]
+    
+    # x는 앞쪽 n개, y는 L번째 이후 값을 사용
+    zeros = np.zeros((1, x.shape[1]))
+    cum_x = np.vstack([zeros, np.cumsum(x, axis=0)])
+    cum_xx = np.vstack([zeros, np.cumsum(x * x, axis=0)])
+    cum_y = np.vstack([zeros, np.cumsum(y, axis=0)])
+    cum_yy = np.vstack([zeros, np.cumsum(y * y, axis=0)])
+    
+    sum_x = cum_x[length - lags]
+    sum_xx = cum_xx[length - lags]
+    sum_y = cum_y[length] - cum_y[lags]
+    sum_yy = cum_yy[length] - cum_yy[lags]
+    
+    with np.errstate(invalid='ignore', divide='ignore'):
+        cov = cross - sum_x * sum_y / n
+        var_x = sum_xx - sum_x ** 2 / n
+        var_y = sum_yy - sum_y ** 2 / n
+        corr = np.clip(cov / np.sqrt(var_x * var_y), -1.0, 1.0)
+        
+        # 양측 t-검정 p-value (scipy.stats.pearsonr과 동일)
+        dof = n - 2
+        t_stat = corr * np.sqrt(dof / (1.0 - corr ** 2))
+        p_value = 2 * stats.t.sf(np.abs(t_stat), dof)
+    
+    n = np.broadcast_to(n, corr.shape)
+    if squeeze:
+        return corr[:, 0], p_value[:, 0], n[:, 0]
+    return corr, p_value, n
+
+
 class CorrelationAnalyzer:
-    """상관관계 분석 클래스"""
+    """
+    상관관계 분석 클래스
+    
+    입력 데이터프레임은 복사하거나 수정하지 않고 읽기만 합니다.
+    """
     
     def __init__(self, df):
         """
         Args:
-            df: 전처리된 데이터프레임
+            df: 전처리된 데이터프레임 (읽기 전용으로 사용)
         """
-        self.df = df.copy()
+        self.df = df
         
     def pearson_correlation(self, columns=None):
         """
@@ -74,10 +228,6 @@ class CorrelationAnalyzer:
         Returns:
             DataFrame: 시차별 상관계수
         """
-        lags = []
-        correlations = []
-        p_values = []
-        
         # 결측치 제거
         data = self.df[[col1, col2]].dropna()
         
@@ -85,29 +235,10 @@ class CorrelationAnalyzer:
             print(f"경고: 데이터가 충분하지 않습니다 (필요: {max_lag + 10}, 실제: {len(data)})")
             return pd.DataFrame()
         
-        for lag in range(0, max_lag + 1):
-            if lag == 0:
-                # lag 0: 동시 상관관계
-                corr, p_val = stats.pearsonr(data[col1], data[col2])
-            else:
-                # lag > 0: col1이 col2보다 lag 시간 앞서는 경우
-                if len(data) > lag:
-                    x = data[col1].iloc[:-lag].values
-                    y = data[col2].iloc[lag:].values
-                    
-                    if len(x) > 0 and len(y) > 0:
-                        corr, p_val = stats.pearsonr(x, y)
-                    else:
-                        corr, p_val = np.nan, np.nan
-                else:
-                    corr, p_val = np.nan, np.nan
-            
-            lags.append(lag)
-            correlations.append(corr)
-            p_values.append(p_val)
+        correlations, p_values, _ = lag_cross_correlation(data[col1], data[col2], max_lag)
         
         result = pd.DataFrame({
-            'lag': lags,
+            'lag': np.arange(max_lag + 1),
             'correlation': correlations,
             'p_value': p_values
         })
@@ -117,6 +248,46 @@ class CorrelationAnalyzer:
         
         return result
     
+    def lag_correlation_scan(self, sources, targets, max_lag=168):
+        """
+        여러 (선행, 후행) 변수 쌍의 시차 상관관계를 한 번에 계산
+        
+        Args:
+            sources: 선행 변수 리스트 (예: ['message_count', 'tx_frequency'])
+            targets: 후행 변수 리스트 (예: ['ETH_close', 'BTC_close'])
+            max_lag: 최대 시차 (기본: 168시간 = 1주)
+            
+        Returns:
+            DataFrame: source, target, lag, correlation, p_value, significant
+                       (사용한 컬럼 중 하나라도 결측인 행은 제외)
+        """
+        pairs = [(src, tgt) for src in sources for tgt in targets if src != tgt]
+        columns = list(dict.fromkeys([c for pair in pairs for c in pair]))
+        
+        data = self.df[columns].dropna()
+        
+        if not pairs or len(data) < max_lag + 10:
+            print(f"경고: 데이터가 충분하지 않습니다 (필요: {max_lag + 10}, 실제: {len(data)})")
+            return pd.DataFrame()
+        
+        correlations, p_values, _ = lag_cross_correlation(
+            data[[src for src, _ in pairs]].to_numpy(),
+            data[[tgt for _, tgt in pairs]].to_numpy(),
+            max_lag
+        )
+        
+        lag_count = max_lag + 1
+        result = pd.DataFrame({
+            'source': np.repeat([src for src, _ in pairs], lag_count),
+            'target': np.repeat([tgt for _, tgt in pairs], lag_count),
+            'lag': np.tile(np.arange(lag_count), len(pairs)),
+            'correlation': correlations.T.ravel(),
+            'p_value': p_values.T.ravel()
+        })
+        result['significant'] = result['p_value'] < 0.05
+        
+        return result
+    
     def granger_causality_test(self, col1, col2, max_lag=12):
         """
         그랜저 인과관계 검정
@@ -130,35 +301,137 @@ class CorrelationAnalyzer:
         Returns:
             dict: 검정 결과
         """
-        # 결측치 제거
-        data = self.df[[col1, col2]].dropna()
+        result = self.granger_causality_grid([(col1, col2)], lags=max_lag, max_workers=1)
         
-        if len(data) < max_lag * 3:
-            return {
-                'error': f'데이터가 충분하지 않습니다 (필요: {max_lag * 3}, 실제: {len(data)})'
-            }
+        if result['error'].notna().any():
+            return {'error': result['error'].dropna().iloc[0]}
+        
+        return result[['lag', 'f_statistic', 'p_value', 'significant']].reset_index(drop=True)
+    
+    def granger_causality_grid(self, pairs, lags=12, start=None, end=None, max_workers=None):
+        """
+        여러 (원인, 결과) 쌍의 그랜저 인과관계 검정을 프로세스 풀에서 병렬 실행
+        
+        결과는 (쌍, 시차, 구간, 데이터 해시) 기준으로 캐시되어 같은 데이터로
+        다시 호출하면 검정을 반복하지 않습니다. 캐시는 최근 사용한 _GRANGER_CACHE_SIZE건만 보관합니다.
+        
+        Args:
+            pairs: (원인, 결과) 튜플 리스트
+            lags: 최대 시차(int) 또는 검정할 시차 리스트
+            start: 분석 시작 시각 (None이면 처음부터)
+            end: 분석 종료 시각 (None이면 끝까지)
+            max_workers: 프로세스 수 (1이면 현재 프로세스에서 순차 실행)
+            
+        Returns:
+            DataFrame: cause, effect, lag, f_statistic, p_value, significant, n_obs, error
+        """
+        df = self.df
+        if start is not None:
+            df = df[df['timestamp'] >= pd.Timestamp(start)]
+        if end is not None:
+            df = df[df['timestamp'] <= pd.Timestamp(end)]
+        
+        lag_key = lags if isinstance(lags, int) else tuple(lags)
+        results = {}
+        jobs = {}
+        
+        for cause, effect in pairs:
+            values = df[[effect, cause]].dropna().to_numpy(dtype=np.float64)
+            data_hash = hashlib.sha1(np.ascontiguousarray(values).tobytes()).hexdigest()
+            key = (cause, effect, lag_key, start, end, data_hash)
+            
+            if key in _GRANGER_CACHE:
+                _GRANGER_CACHE.move_to_end(key)
+                results[(cause, effect)] = _GRANGER_CACHE[key]
+            else:
+                jobs[key] = (cause, effect, values, lags)
         
-        try:
-            # 그랜저 인과관계 검정
-            # H0: col1은 col2의 원인이 아니다
-            # p-value < 0.05이면 H0 기각 -> col1이 col2의 원인이다
-            test_result = grangercausalitytests(data[[col2, col1]], max_lag, verbose=False)
+        if jobs:
+            if max_workers == 1 or len(jobs) == 1:
+                outputs = {key: _run_granger(*args) for key, args in jobs.items()}
+            else:
+                with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                    futures = {key: executor.submit(_run_granger, *args) for key, args in jobs.items()}
+                    outputs = {key: future.result() for key, future in futures.items()}
             
-            # 결과 정리
-            results = []
-            for lag in range(1, max_lag + 1):
-                ssr_ftest = test_result[lag][0]['ssr_ftest']
-                results.append({
-                    'lag': lag,
-                    'f_statistic': ssr_ftest[0],
-                    'p_value': ssr_ftest[1],
-                    'significant': ssr_ftest[1] < 0.05
-                })
+            for key, rows in outputs.items():
+                _GRANGER_CACHE[key] = rows
+                results[(key[0], key[1])] = rows
+            
+            while len(_GRANGER_CACHE) > _GRANGER_CACHE_SIZE:
+                _GRANGER_CACHE.popitem(last=False)
+        
+        columns = ['cause', 'effect', 'lag', 'f_statistic', 'p_value', 'significant', 'n_obs', 'error']
+        rows = [row for pair in pairs for row in results[tuple(pair)]]
+        
+        return pd.DataFrame(rows, columns=columns)
+    
+    def event_study(self, events, targets, horizons=(1, 6, 24)):
+        """
+        이벤트 발생 후 타겟 변수의 변동성 분석 (벡터화)
+        
+        타겟/시차별 전방 최대·최소값을 한 번만 계산한 뒤 모든 이벤트에 대해
+        인덱싱으로 변동성을 구합니다.
+        
+        Args:
+            events: {이벤트명: 불리언 마스크} 딕셔너리 또는 단일 불리언 마스크
+            targets: 타겟 컬럼 리스트 (예: ['ETH_close', 'BTC_close'])
+            horizons: 이벤트 후 관찰 시간 리스트 (시간)
+            
+        Returns:
+            tuple: (이벤트별 결과 DataFrame, 이벤트/타겟/시차별 요약 DataFrame)
+        """
+        if not isinstance(events, dict):
+            events = {'event': events}
+        if isinstance(targets, str):
+            targets = [targets]
+        
+        timestamps = self.df['timestamp'].to_numpy() if 'timestamp' in self.df.columns else np.arange(len(self.df))
+        event_positions = {
+            name: np.flatnonzero(np.asarray(mask, dtype=bool)) for name, mask in events.items()
+        }
+        
+        pieces = []
+        for target in targets:
+            values = self.df[target].to_numpy(dtype=np.float64)
             
-            return pd.DataFrame(results)
+            for horizon in horizons:
+                forward_max, forward_min = forward_extremes(values, horizon)
+                
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    max_change = (forward_max - values) / values * 100
+                    min_change = (forward_min - values) / values * 100
+                
+                # 윈도우가 완전하고 기준값이 양수인 시점만 사용
+                usable = ~np.isnan(forward_max) & (values > 0)
+                
+                for name, positions in event_positions.items():
+                    positions = positions[usable[positions]]
+                    pieces.append(pd.DataFrame({
+                        'event': name,
+                        'timestamp': timestamps[positions],
+                        'position': positions,
+                        'target': target,
+                        'horizon': horizon,
+                        'base_value': values[positions],
+                        'max_change_pct': max_change[positions],
+                        'min_change_pct': min_change[positions],
+                        'volatility_pct': np.maximum(np.abs(max_change[positions]), np.abs(min_change[positions]))
+                    }))
+        
+        columns = ['event', 'timestamp', 'position', 'target', 'horizon', 'base_value',
+                   'max_change_pct', 'min_change_pct', 'volatility_pct']
+        per_event = pd.concat(pieces, ignore_index=True) if pieces else pd.DataFrame(columns=columns)
         
-        except Exception as e:
-            return {'error': str(e)}
+        summary = per_event.groupby(['event', 'target', 'horizon'], sort=False).agg(
+            event_count=('volatility_pct', 'size'),
+            avg_volatility=('volatility_pct', 'mean'),
+            max_volatility=('volatility_pct', 'max'),
+            avg_max_change=('max_change_pct', 'mean'),
+            avg_min_change=('min_change_pct', 'mean')
+        ).reset_index()
+        
+        return per_event, summary
     
     def volatility_analysis(self, trigger_col, target_col, threshold=2.0):
         """
@@ -172,61 +445,38 @@ class CorrelationAnalyzer:
         Returns:
             dict: 변동성 분석 결과
         """
+        trigger = np.abs(self.df[trigger_col].to_numpy(dtype=np.float64))
+        
         # 트리거 이벤트 식별 (Z-score > threshold)
-        trigger_events = self.df[self.df[trigger_col].abs() > threshold].copy()
+        trigger_mask = trigger > threshold
         
-        if len(trigger_events) == 0:
+        if not trigger_mask.any():
             return {
                 'error': f'{trigger_col}에서 임계값 {threshold}를 초과하는 이벤트가 없습니다.'
             }
         
-        # 타겟 변수의 변화율 계산
-        window = 6  # 이벤트 후 6시간 동안의 변화
+        # 평균 이벤트 없을 때의 변동성 (비교용, 24시간마다 샘플링)
+        normal_mask = np.zeros(len(trigger), dtype=bool)
+        normal_mask[np.flatnonzero(trigger <= 1.0)[::24]] = True
         
-        volatilities = []
-        for idx in trigger_events.index:
-            if idx + window < len(self.df):
-                # 이벤트 발생 시점의 값
-                base_value = self.df.loc[idx, target_col]
-                
-                # 이벤트 후 window 시간 동안의 최대/최소값
-                future_values = self.df.loc[idx:idx+window, target_col]
-                max_value = future_values.max()
-                min_value = future_values.min()
-                
-                # 변동성 계산 (%)
-                if base_value > 0:
-                    max_change = ((max_value - base_value) / base_value) * 100
-                    min_change = ((min_value - base_value) / base_value) * 100
-                    volatility = max(abs(max_change), abs(min_change))
-                    
-                    volatilities.append(volatility)
-        
-        # 평균 이벤트 없을 때의 변동성 계산 (비교용)
-        normal_periods = self.df[self.df[trigger_col].abs() <= 1.0].copy()
-        normal_volatilities = []
-        
-        for idx in normal_periods.index[::24]:  # 24시간마다 샘플링
-            if idx + window < len(self.df):
-                base_value = self.df.loc[idx, target_col]
-                future_values = self.df.loc[idx:idx+window, target_col]
-                max_value = future_values.max()
-                min_value = future_values.min()
-                
-                if base_value > 0:
-                    max_change = ((max_value - base_value) / base_value) * 100
-                    min_change = ((min_value - base_value) / base_value) * 100
-                    volatility = max(abs(max_change), abs(min_change))
-                    
-                    normal_volatilities.append(volatility)
+        # 이벤트 후 6시간 동안의 변화
+        window = 6
+        per_event, _ = self.event_study(
+            {'trigger': trigger_mask, 'normal': normal_mask}, [target_col], horizons=[window]
+        )
+        volatilities = per_event.loc[per_event['event'] == 'trigger', 'volatility_pct'].to_numpy()
+        normal_volatilities = per_event.loc[per_event['event'] == 'normal', 'volatility_pct'].to_numpy()
+        
+        avg_volatility = volatilities.mean() if len(volatilities) else 0
+        avg_normal = normal_volatilities.mean() if len(normal_volatilities) else 0
         
         result = {
-            'trigger_events_count': len(trigger_events),
-            'avg_volatility_during_events': np.mean(volatilities) if volatilities else 0,
-            'avg_volatility_normal': np.mean(normal_volatilities) if normal_volatilities else 0,
-            'volatility_ratio': (np.mean(volatilities) / np.mean(normal_volatilities)) 
-                                if volatilities and normal_volatilities and np.mean(normal_volatilities) > 0 else 0,
-            'max_volatility': np.max(volatilities) if volatilities else 0,
+            'trigger_events_count': int(trigger_mask.sum()),
+            'avg_volatility_during_events': avg_volatility,
+            'avg_volatility_normal': avg_normal,
+            'volatility_ratio': (avg_volatility / avg_normal)
+                                if len(volatilities) and len(normal_volatilities) and avg_normal > 0 else 0,
+            'max_volatility': volatilities.max() if len(volatilities) else 0,
         }
         
         return result
@@ -0,0 +1,369 @@
+"""
+기간별 상관계수 행렬 서비스
+
+날짜 슬라이더를 움직일 때마다 전체 행을 다시 읽지 않도록
+블록 단위 누적합(Σx, Σx², Σxy, 쌍별 유효 개수)을 미리 계산해 두고
+임의의 [시작, 종료] 구간의 피어슨 행렬을 누적합의 차이로 계산합니다.
+- 피어슨: 블록 경계 안쪽은 누적합 차이, 양 끝의 남는 행(블록 크기 미만)만 직접 합산
+  짧은 구간(direct_rows 이하)은 분산이 작아 누적합 차이의 자릿수 손실이 크므로 pandas와 같은
+  쌍별 2-pass 방식으로 직접 계산
+- 스피어만: 컬럼별 전체 정렬 순서를 한 번만 계산해 두고, 구간 순위는 정렬 순서에서
+  구간 행만 골라 얻음 (구간마다 다시 정렬하지 않음), 구간별 결과는 LRU 캐시
+"""
+
+from collections import OrderedDict
+from itertools import combinations
+import warnings
+
+import pandas as pd
+import numpy as np
+
+
+class WindowCorrelationService:
+    """기간별 상관계수 행렬 캐시"""
+    
+    # 상관 분석에서 제외하는 시간 특성 컬럼
+    EXCLUDED_COLUMNS = ['hour', 'day_of_week', 'day', 'month']
+    
+    def __init__(self, df, columns=None, block_size=24, spearman_cache_size=32, direct_rows=None):
+        """
+        Args:
+            df: 전처리된 데이터프레임 (timestamp 컬럼 필요)
+            columns: 상관 분석 대상 컬럼 (None이면 수치형 컬럼 전체)
+            block_size: 누적합 체크포인트 간격 (행 수)
+            spearman_cache_size: 스피어만 결과를 보관할 구간 수
+            direct_rows: 이 행 수 이하 구간은 누적합 없이 직접 계산 (기본: block_size * 2)
+        """
+        if columns is None:
+            columns = df.select_dtypes(include=[np.number]).columns.tolist()
+            columns = [c for c in columns if c not in self.EXCLUDED_COLUMNS]
+        
+        if not df['timestamp'].is_monotonic_increasing:
+            df = df.sort_values('timestamp')
+        
+        self.df = df
+        self.columns = list(columns)
+        self.block_size = block_size
+        self.direct_rows = block_size * 2 if direct_rows is None else direct_rows
+        self.timestamps = df['timestamp'].to_numpy()
+        
+        # 전체 평균/표준편차로 표준화하여 누적합의 자릿수 손실을 줄임 (상관계수는 변하지 않음)
+        block = df[self.columns].to_numpy(dtype=np.float64)
+        self._raw = block
+        self._valid = ~np.isnan(block)
+        with np.errstate(invalid='ignore'), warnings.catch_warnings():
+            warnings.simplefilter('ignore', category=RuntimeWarning)
+            mean = np.nan_to_num(np.nanmean(block, axis=0))
+            std = np.nanstd(block, axis=0)
+        std = np.where(std > 0, std, 1.0)
+        self._values = np.where(self._valid, (block - mean) / std, 0.0)
+        
+        # 블록별 합계 -> 누적합 (n_blocks + 1, 4, k, k)
+        n_blocks = len(block) // block_size
+        block_sums = [
+            self._sums(i * block_size, (i + 1) * block_size) for i in range(n_blocks)
+        ]
+        k = len(self.columns)
+        self._prefix = np.zeros((n_blocks + 1, 4, k, k))
+        if n_blocks:
+            self._prefix[1:] = np.cumsum(np.stack(block_sums), axis=0)
+        
+        # 상수 컬럼 판정용: 직전 유효 값과 달라진 행의 누적 개수, 각 위치 이후 첫 유효 행
+        previous = pd.DataFrame(block).ffill().shift(1).to_numpy()
+        changed = self._valid & ~np.isnan(previous) & (block != previous)
+        self._changes = np.zeros((len(block) + 1, k), dtype=np.int64)
+        self._changes[1:] = np.cumsum(changed, axis=0)
+        
+        positions = np.where(self._valid, np.arange(len(block))[:, None], len(block))
+        self._next_valid = np.full((len(block) + 1, k), len(block), dtype=np.int64)
+        if len(block):
+            self._next_valid[:-1] = np.minimum.accumulate(positions[::-1], axis=0)[::-1]
+        
+        # 스피어만용 순위 캐시: 컬럼별 전체 정렬 순서와 정렬된 값 (결측은 맨 뒤)
+        self._order = np.argsort(block, axis=0, kind='stable')
+        self._sorted = np.take_along_axis(block, self._order, axis=0)
+        
+        self._spearman_cache = OrderedDict()
+        self._spearman_cache_size = spearman_cache_size
+    
+    def _sums(self, start, end):
+        """
+        행 구간 [start, end)의 쌍별 합계
+        
+        Returns:
+            ndarray: (4, k, k) - [유효 개수, Σx_i, Σx_i², Σx_i·x_j] (i, j 모두 유효한 행 기준)
+        """
+        values = self._values[start:end]
+        valid = self._valid[start:end].astype(np.float64)
+        return np.stack([
+            valid.T @ valid,
+            values.T @ valid,
+            (values * values).T @ valid,
+            values.T @ values
+        ])
+    
+    def _row_range(self, start=None, end=None):
+        """타임스탬프 구간 [start, end] (양 끝 포함)을 행 위치 [i0, i1)로 변환"""
+        i0 = 0 if start is None else np.searchsorted(self.timestamps, np.datetime64(pd.Timestamp(start)), side='left')
+        i1 = len(self.timestamps) if end is None else np.searchsorted(self.timestamps, np.datetime64(pd.Timestamp(end)), side='right')
+        return int(i0), int(max(i0, i1))
+    
+    def _constant_columns(self, i0, i1):
+        """
+        행 구간 [i0, i1)에서 유효 값이 모두 같은 (또는 없는) 컬럼
+        
+        분산은 누적합 차이의 반올림 오차 때문에 상수 컬럼도 0보다 약간 클 수 있어
+        값이 바뀐 행의 누적 개수로 정확히 판정합니다.
+        
+        Returns:
+            ndarray: (k,) bool
+        """
+        first = self._next_valid[i0]
+        after_first = np.minimum(first + 1, len(self._changes) - 1)
+        changes = self._changes[i1] - self._changes[after_first, np.arange(len(self.columns))]
+        return (first >= i1) | (changes <= 0)
+    
+    def _window_sums(self, i0, i1):
+        """누적합 차이 + 양 끝 잔여 행으로 구간 합계 계산"""
+        b0 = -(-i0 // self.block_size)
+        b1 = i1 // self.block_size
+        
+        if b0 >= b1:
+            return self._sums(i0, i1)
+        
+        return (
+            self._prefix[b1] - self._prefix[b0]
+            + self._sums(i0, b0 * self.block_size)
+            + self._sums(b1 * self.block_size, i1)
+        )
+    
+    def _direct_pearson(self, i0, i1):
+        """
+        짧은 구간의 피어슨 행렬을 원본 값으로 직접 계산 (pandas corr와 같은 쌍별 2-pass)
+        
+        Returns:
+            ndarray: (k, k) 상관계수 (유효 쌍 2개 미만 또는 분산 0이면 NaN)
+        """
+        values = self._raw[i0:i1]
+        both = self._valid[i0:i1, :, None] & self._valid[i0:i1, None, :]
+        count = both.sum(axis=0)
+        
+        x = np.where(both, values[:, :, None], 0.0)
+        y = np.where(both, values[:, None, :], 0.0)
+        
+        # 공통 행에서 값이 모두 같으면 상수 (sum / count 평균은 상수여도 오차가 남음)
+        x_constant = (np.where(both, values[:, :, None], -np.inf).max(axis=0)
+                      == np.where(both, values[:, :, None], np.inf).min(axis=0))
+        
+        with np.errstate(invalid='ignore', divide='ignore'):
+            dx = np.where(both, x - x.sum(axis=0) / count, 0.0)
+            dy = np.where(both, y - y.sum(axis=0) / count, 0.0)
+            var = (dx * dx).sum(axis=0) * (dy * dy).sum(axis=0)
+            corr = np.clip((dx * dy).sum(axis=0) / np.sqrt(var), -1.0, 1.0)
+        
+        corr[(count < 2) | ~(var > 0) | x_constant | x_constant.T] = np.nan
+        return corr
+    
+    def pearson(self, start=None, end=None, columns=None):
+        """
+        구간 피어슨 상관계수 행렬 (pandas corr와 같이 쌍별 결측 제외)
+        
+        Args:
+            start: 시작 시각 (포함, None이면 처음부터)
+            end: 종료 시각 (포함, None이면 끝까지)
+            columns: 반환할 컬럼 (None이면 전체)
+        
+        Returns:
+            DataFrame: 상관계수 행렬
+        """
+        i0, i1 = self._row_range(start, end)
+        
+        if i1 - i0 <= self.direct_rows:
+            corr = self._direct_pearson(i0, i1)
+        else:
+            count, sum_x, sum_xx, sum_xy = self._window_sums(i0, i1)
+            sum_y = sum_x.T
+            sum_yy = sum_xx.T
+            
+            with np.errstate(invalid='ignore', divide='ignore'):
+                cov = count * sum_xy - sum_x * sum_y
+                var = (count * sum_xx - sum_x ** 2) * (count * sum_yy - sum_y ** 2)
+                corr = np.clip(cov / np.sqrt(var), -1.0, 1.0)
+            
+            # 구간에서 상수인 컬럼은 pandas와 같이 NaN (대각선은 그 외에는 정확히 1)
+            constant = self._constant_columns(i0, i1)
+            np.fill_diagonal(corr, 1.0)
+            corr[(count < 2) | ~(var > 0) | constant[:, None] | constant[None, :]] = np.nan
+        
+        result = pd.DataFrame(corr, index=self.columns, columns=self.columns)
+        if columns is not None:
+            columns = [c for c in columns if c in self.columns]
+            result = result.loc[columns, columns]
+        
+        return result
+    
+    @staticmethod
+    def _ranks(order, sorted_values, mask, cols):
+        """
+        mask 행만 골랐을 때의 컬럼별 평균 순위 (정렬 순서에서 추출, 다시 정렬하지 않음)
+        
+        Args:
+            order: (행 수, k) 컬럼별 오름차순 행 번호
+            sorted_values: (행 수, k) order 순서로 정렬된 값
+            mask: (행 수,) bool - 순위를 매길 행
+            cols: 컬럼 위치 배열 (mask 행에서 결측이 없어야 함)
+        
+        Returns:
+            ndarray: (mask 행 수, len(cols)) 순위 (동점은 pandas rank와 같이 평균 순위)
+        """
+        n = int(mask.sum())
+        order = order[:, cols]
+        keep = mask[order].T
+        
+        # 컬럼마다 mask 행을 값 오름차순으로 (n개씩)
+        rows = order.T[keep].reshape(len(cols), n)
+        values = sorted_values[:, cols].T[keep].reshape(len(cols), n)
+        
+        # 동점 구간의 첫 위치와 마지막 위치의 평균 = 평균 순위
+        index = np.broadcast_to(np.arange(n), values.shape)
+        starts = np.ones(values.shape, dtype=bool)
+        starts[:, 1:] = values[:, 1:] != values[:, :-1]
+        ends = np.ones(values.shape, dtype=bool)
+        ends[:, :-1] = starts[:, 1:]
+        first = np.maximum.accumulate(np.where(starts, index, 0), axis=1)
+        last = np.minimum.accumulate(np.where(ends, index, n - 1)[:, ::-1], axis=1)[:, ::-1]
+        
+        # 전체 행 번호 -> mask 행 안의 위치
+        position = np.cumsum(mask) - 1
+        ranks = np.empty((n, len(cols)))
+        ranks[position[rows], np.arange(len(cols))[:, None]] = (first + last) / 2 + 1
+        return ranks
+    
+    @staticmethod
+    def _rank_corr(ranks):
+        """
+        순위 행렬의 피어슨 상관계수 (= 스피어만)
+        
+        Returns:
+            ndarray: (k, k) 상관계수 (행 2개 미만 또는 순위가 모두 같은 컬럼은 NaN)
+        """
+        k = ranks.shape[1]
+        if len(ranks) < 2:
+            return np.full((k, k), np.nan)
+        
+        centered = ranks - ranks.mean(axis=0)
+        cov = centered.T @ centered
+        var = np.diag(cov).copy()
+        with np.errstate(invalid='ignore', divide='ignore'):
+            corr = np.clip(cov / np.sqrt(np.outer(var, var)), -1.0, 1.0)
+        
+        np.fill_diagonal(corr, 1.0)
+        corr[~(var > 0)] = np.nan
+        corr[:, ~(var > 0)] = np.nan
+        return corr
+    
+    def _spearman_matrix(self, i0, i1, cols):
+        """
+        행 구간 [i0, i1)의 스피어만 행렬 (pandas corr(method='spearman')와 같이 쌍별 결측 제외)
+        
+        구간에서 결측이 없는 컬럼은 한 번에 순위를 매기고, 결측이 있는 컬럼은
+        그 컬럼이 유효한 행(두 컬럼 모두 결측이 있으면 공통 유효 행)으로 다시 순위를 매깁니다.
+        순위는 캐시된 전체 정렬 순서에서 구간 행만 골라 얻고, 전체의 1/8보다 짧은 구간은
+        전체 순서를 훑는 것보다 구간 행만 정렬하는 편이 빨라 구간 안에서 정렬합니다.
+        
+        Returns:
+            ndarray: (len(cols), len(cols)) 상관계수
+        """
+        cols = np.asarray(cols, dtype=np.int64)
+        corr = np.full((len(cols), len(cols)), np.nan)
+        
+        if (i1 - i0) * 8 < len(self._raw):
+            block = self._raw[i0:i1]
+            order = np.argsort(block, axis=0, kind='stable')
+            sorted_values = np.take_along_axis(block, order, axis=0)
+            offset = i0
+        else:
+            order, sorted_values, offset = self._order, self._sorted, 0
+        
+        # 순위를 매길 행 (order의 행 번호 기준)
+        window = np.zeros(len(order), dtype=bool)
+        window[i0 - offset:i1 - offset] = True
+        valid = self._valid[i0:i1][:, cols]
+        complete = np.flatnonzero(valid.all(axis=0))
+        partial = np.flatnonzero(~valid.all(axis=0))
+        
+        def ranks(rows, members):
+            mask = window.copy()
+            mask[i0 - offset:i1 - offset] = rows
+            return self._ranks(order, sorted_values, mask, cols[members])
+        
+        if len(complete):
+            corr[np.ix_(complete, complete)] = self._rank_corr(ranks(True, complete))
+        
+        for m in partial:
+            members = np.r_[m, complete]
+            block = self._rank_corr(ranks(valid[:, m], members))
+            corr[m, members] = block[0]
+            corr[members, m] = block[0]
+        
+        for a, b in combinations(partial, 2):
+            corr[a, b] = corr[b, a] = self._rank_corr(ranks(valid[:, a] & valid[:, b], [a, b]))[0, 1]
+        
+        return corr
+    
+    def spearman(self, start=None, end=None, columns=None):
+        """
+        구간 스피어만 상관계수 행렬 (캐시된 정렬 순서로 순위 계산, 구간별 결과 캐시)
+        
+        Args:
+            start: 시작 시각 (포함)
+            end: 종료 시각 (포함)
+            columns: 반환할 컬럼 (None이면 전체)
+        
+        Returns:
+            DataFrame: 상관계수 행렬
+        """
+        columns = self.columns if columns is None else [c for c in columns if c in self.columns]
+        i0, i1 = self._row_range(start, end)
+        key = (i0, i1, tuple(columns))
+        
+        # 캐시된 결과는 호출자가 수정해도 캐시가 바뀌지 않도록 복사본을 반환
+        if key in self._spearman_cache:
+            self._spearman_cache.move_to_end(key)
+            return self._spearman_cache[key].copy()
+        
+        cols = [self.columns.index(col) for col in columns]
+        result = pd.DataFrame(self._spearman_matrix(i0, i1, cols), index=columns, columns=columns)
+        
+        self._spearman_cache[key] = result
+        if len(self._spearman_cache) > self._spearman_cache_size:
+            self._spearman_cache.popitem(last=False)
+        
+        return result.copy()
+    
+    def get_top_correlations(self, target_col, start=None, end=None, n=10, method='pearson'):
+        """
+        구간 내에서 특정 컬럼과 가장 상관관계가 높은 변수들 반환
+        
+        Args:
+            target_col: 타겟 컬럼
+            start: 시작 시각
+            end: 종료 시각
+            n: 상위 n개
+            method: 'pearson' 또는 'spearman'
+        
+        Returns:
+            Series: 상위 n개 상관관계
+        """
+        if method == 'pearson':
+            corr_matrix = self.pearson(start, end)
+        else:
+            corr_matrix = self.spearman(start, end)
+        
+        if target_col not in corr_matrix.columns:
+            return pd.Series()
+        
+        correlations = corr_matrix[target_col].drop(target_col, errors='ignore')
+        top_corr = correlations.abs().sort_values(ascending=False).head(n)
+        
+        return correlations[top_corr.index]
@@ -5,25 +5,94 @@
 - Z-score 기반 이상치 탐지
 - 이동평균 기반 급등/급락 감지
 - 다중 지표 통합 스파이크 점수 계산
+- 새 시간 데이터마다 O(1)로 갱신되는 스트리밍 감지
 """
 
 import pandas as pd
 import numpy as np
+import math
+import threading
+from collections import deque
 from datetime import datetime, timedelta
 
+from utils.feature_engine import RollingFeatureEngine
+
+
+# 배치 감지 결과의 spike_type 카테고리
+SPIKE_TYPES = [
+    'positive_spike', 'negative_spike',
+    'surge', 'drop',
+    'rapid_increase', 'rapid_decrease'
+]
+
 
 class SpikeDetector:
-    """스파이크 감지 클래스"""
+    """
+    스파이크 감지 클래스
+    
+    입력 데이터프레임은 복사하거나 수정하지 않고 읽기만 합니다.
+    감지 중 계산한 Z-score/이동평균/변화율 컬럼은 내부 파생 테이블(_derived)에 보관합니다.
+    """
     
     def __init__(self, df, window=24):
         """
         Args:
-            df: 전처리된 데이터프레임
+            df: 전처리된 데이터프레임 (읽기 전용으로 사용)
             window: 이동평균 윈도우 크기 (기본: 24시간)
         """
-        self.df = df.copy()
+        self.df = df
         self.window = window
+        self._derived = pd.DataFrame(index=pd.RangeIndex(len(df)))
+    
+    def _store(self, name, values):
+        """파생 컬럼을 내부 테이블에 저장 (위치 기준)"""
+        self._derived[name] = np.asarray(values)
+    
+    def _has_column(self, name):
+        return name in self._derived.columns or name in self.df.columns
+    
+    def _column(self, name):
+        """파생 테이블 또는 원본에서 컬럼 조회"""
+        if name in self._derived.columns:
+            return self._derived[name].set_axis(self.df.index)
+        return self.df[name]
+    
+    def _rows(self, mask, columns=None):
+        """
+        조건에 맞는 행만 원본 + 파생 컬럼으로 구성 (선택된 행만 복사)
+        
+        Args:
+            mask: 불리언 배열 또는 Series
+            columns: 포함할 컬럼 (None이면 원본 전체 + 파생 전체)
+            
+        Returns:
+            DataFrame: 선택된 행
+        """
+        mask = np.asarray(mask, dtype=bool)
+        
+        if columns is None:
+            base_cols = [col for col in self.df.columns if col not in self._derived.columns]
+            derived = self._derived[mask].set_axis(self.df.index[mask])
+            return pd.concat([self.df.loc[mask, base_cols], derived], axis=1)
+        
+        return pd.DataFrame({col: self._column(col)[mask] for col in columns})
+    
+    def _ensure_zscore(self, column):
+        """
+        Z-score 컬럼이 없으면 직접 계산하여 파생 테이블에 추가
         
+        Returns:
+            str: Z-score 컬럼명
+        """
+        zscore_col = f'{column}_zscore'
+        
+        if not self._has_column(zscore_col):
+            mean = self.df[column].rolling(window=self.window, min_periods=1).mean()
+            std = self.df[column].rolling(window=self.window, min_periods=1).std()
+            self._store(zscore_col, (self.df[column] - mean) / (std + 1e-10))
+        
+        return zscore_col
+    
     def detect_zscore_spike(self, column, threshold=2.5):
         """
         Z-score 기반 스파이크 감지
@@ -36,21 +105,13 @@ class SpikeDetector:
             DataFrame: 스파이크가 감지된 행들
         """
         # Z-score 계산
-        zscore_col = f'{column}_zscore'
-        
-        if zscore_col not in self.df.columns:
-            # Z-score가 없으면 직접 계산
-            mean = self.df[column].rolling(window=self.window, min_periods=1).mean()
-            std = self.df[column].rolling(window=self.window, min_periods=1).std()
-            self.df[zscore_col] = (self.df[column] - mean) / (std + 1e-10)
+        zscore_col = self._ensure_zscore(column)
         
         # 임계값을 초과하는 스파이크 감지
-        spikes = self.df[self.df[zscore_col].abs() > threshold].copy()
+        spikes = self._rows(self._column(zscore_col).abs() > threshold, ['timestamp', column, zscore_col])
         
         # 스파이크 정보 추가
-        spikes['spike_type'] = spikes[zscore_col].apply(
-            lambda x: 'positive_spike' if x > 0 else 'negative_spike'
-        )
+        spikes['spike_type'] = np.where(spikes[zscore_col] > 0, 'positive_spike', 'negative_spike')
         spikes['spike_magnitude'] = spikes[zscore_col].abs()
         spikes['spike_column'] = column
         
@@ -70,19 +131,21 @@ class SpikeDetector:
         ma_col = f'{column}_ma{self.window}'
         
         # 이동평균 계산 (없으면)
-        if ma_col not in self.df.columns:
-            self.df[ma_col] = self.df[column].rolling(window=self.window, min_periods=1).mean()
+        if not self._has_column(ma_col):
+            self._store(ma_col, self.df[column].rolling(window=self.window, min_periods=1).mean())
         
         # 이동평균 대비 변화율 계산
-        self.df['pct_from_ma'] = ((self.df[column] - self.df[ma_col]) / (self.df[ma_col] + 1e-10)) * 100
+        ma = self._column(ma_col)
+        self._store('pct_from_ma', ((self.df[column] - ma) / (ma + 1e-10)) * 100)
         
         # 임계값을 초과하는 스파이크 감지
-        spikes = self.df[self.df['pct_from_ma'].abs() > threshold_pct].copy()
+        spikes = self._rows(
+            self._column('pct_from_ma').abs() > threshold_pct,
+            ['timestamp', column, ma_col, 'pct_from_ma']
+        )
         
         # 스파이크 정보 추가
-        spikes['spike_type'] = spikes['pct_from_ma'].apply(
-            lambda x: 'surge' if x > 0 else 'drop'
-        )
+        spikes['spike_type'] = np.where(spikes['pct_from_ma'] > 0, 'surge', 'drop')
         spikes['spike_magnitude'] = spikes['pct_from_ma'].abs()
         spikes['spike_column'] = column
         
@@ -101,20 +164,96 @@ class SpikeDetector:
             DataFrame: 스파이크가 감지된 행들
         """
         # window 시간 전 대비 변화율
-        self.df[f'{column}_roc'] = self.df[column].pct_change(periods=window) * 100
+        self._store(f'{column}_roc', self.df[column].pct_change(periods=window) * 100)
         
         # 임계값 초과 감지
-        spikes = self.df[self.df[f'{column}_roc'].abs() > threshold_pct].copy()
+        spikes = self._rows(
+            self._column(f'{column}_roc').abs() > threshold_pct,
+            ['timestamp', column, f'{column}_roc']
+        )
         
         # 스파이크 정보
-        spikes['spike_type'] = spikes[f'{column}_roc'].apply(
-            lambda x: 'rapid_increase' if x > 0 else 'rapid_decrease'
-        )
+        spikes['spike_type'] = np.where(spikes[f'{column}_roc'] > 0, 'rapid_increase', 'rapid_decrease')
         spikes['spike_magnitude'] = spikes[f'{column}_roc'].abs()
         spikes['spike_column'] = column
         
         return spikes[['timestamp', 'spike_column', 'spike_type', 'spike_magnitude', column, f'{column}_roc']]
     
+    def detect_all_spikes(self, columns, zscore_threshold=2.5, ma_threshold_pct=50,
+                          roc_window=3, roc_threshold_pct=30):
+        """
+        여러 컬럼에 대해 Z-score/이동평균/변화율 스파이크를 한 번에 감지
+        
+        모든 컬럼을 하나의 2차원 NumPy 블록으로 만들어 감지기별로 한 번씩만
+        계산하며, 결과는 하나의 long-format 테이블로 반환합니다.
+        
+        Args:
+            columns: 감지할 컬럼 리스트
+            zscore_threshold: Z-score 임계값
+            ma_threshold_pct: 이동평균 대비 변화율 임계값 (%)
+            roc_window: 변화율 계산 윈도우 (시간)
+            roc_threshold_pct: 변화율 임계값 (%)
+            
+        Returns:
+            DataFrame: timestamp, spike_column, detector, spike_type(category),
+                       spike_magnitude, value, baseline, indicator
+                       (baseline: zscore/ma는 이동평균, roc는 roc_window 시간 전 값)
+        """
+        columns = [col for col in columns if col in self.df.columns]
+        result_columns = ['timestamp', 'spike_column', 'detector', 'spike_type',
+                          'spike_magnitude', 'value', 'baseline', 'indicator']
+        if not columns or self.df.empty:
+            return pd.DataFrame(columns=result_columns)
+        
+        block = self.df[columns].to_numpy(dtype=np.float64)
+        mean, std = RollingFeatureEngine(window=self.window).rolling_moments(block)
+        
+        # 이미 계산된 Z-score/이동평균 컬럼이 있으면 개별 감지 메서드와 같이 그 값을 사용
+        zscore = (block - mean) / (std + 1e-10)
+        ma = mean
+        for i, col in enumerate(columns):
+            if self._has_column(f'{col}_zscore'):
+                zscore[:, i] = self._column(f'{col}_zscore').to_numpy(dtype=np.float64)
+            if self._has_column(f'{col}_ma{self.window}'):
+                ma[:, i] = self._column(f'{col}_ma{self.window}').to_numpy(dtype=np.float64)
+        
+        with np.errstate(invalid='ignore', divide='ignore'):
+            pct_from_ma = (block - ma) / (ma + 1e-10) * 100
+            # pct_change와 같이 결측은 직전 유효 값으로 채운 뒤 roc_window 시간 전과 비교
+            filled = pd.DataFrame(block).ffill().to_numpy()
+            previous = np.full(block.shape, np.nan)
+            previous[roc_window:] = filled[:-roc_window]
+            roc = (filled / previous - 1) * 100
+        
+        detectors = [
+            ('zscore', zscore, mean, zscore_threshold, 'positive_spike', 'negative_spike'),
+            ('ma', pct_from_ma, ma, ma_threshold_pct, 'surge', 'drop'),
+            ('roc', roc, previous, roc_threshold_pct, 'rapid_increase', 'rapid_decrease'),
+        ]
+        
+        timestamps = self.df['timestamp'].to_numpy()
+        pieces = []
+        for name, indicator, baseline, threshold, up_label, down_label in detectors:
+            rows, cols = np.nonzero(np.abs(np.nan_to_num(indicator, nan=0.0)) > threshold)
+            values = indicator[rows, cols]
+            pieces.append(pd.DataFrame({
+                'timestamp': timestamps[rows],
+                'spike_column': np.asarray(columns, dtype=object)[cols],
+                'detector': name,
+                'spike_type': np.where(values > 0, up_label, down_label),
+                'spike_magnitude': np.abs(values),
+                'value': block[rows, cols],
+                'baseline': baseline[rows, cols],
+                'indicator': values
+            }))
+        
+        spikes = pd.concat(pieces, ignore_index=True)
+        spikes['spike_column'] = spikes['spike_column'].astype('category')
+        spikes['detector'] = spikes['detector'].astype('category')
+        spikes['spike_type'] = pd.Categorical(spikes['spike_type'], categories=SPIKE_TYPES)
+        
+        return spikes[result_columns]
+    
     def detect_multi_indicator_spike(self, columns, weights=None, threshold=0.7):
         """
         다중 지표 통합 스파이크 감지
@@ -136,10 +275,10 @@ class SpikeDetector:
         spike_scores['timestamp'] = self.df['timestamp']
         
         for col in columns:
-            zscore_col = f'{col}_zscore'
-            if zscore_col in self.df.columns:
+            if col in self.df.columns:
+                zscore_col = self._ensure_zscore(col)
                 # Z-score를 0~1로 정규화 (sigmoid 함수)
-                normalized = 1 / (1 + np.exp(-self.df[zscore_col]))
+                normalized = 1 / (1 + np.exp(-self._column(zscore_col)))
                 # 중립(0.5)에서 벗어난 정도를 점수로 사용
                 spike_scores[f'{col}_score'] = (normalized - 0.5).abs() * 2
             else:
@@ -153,9 +292,10 @@ class SpikeDetector:
         # 임계값 초과 감지
         spikes = spike_scores[spike_scores['combined_score'] > threshold].copy()
         
-        # 원본 데이터 병합
+        # 원본 데이터 병합 (스파이크 시점의 행만)
         if not spikes.empty:
-            spikes = spikes.merge(self.df, on='timestamp', how='left')
+            rows = self._rows(self.df['timestamp'].isin(spikes['timestamp']))
+            spikes = spikes.merge(rows, on='timestamp', how='left')
             spikes['spike_type'] = 'multi_indicator'
             spikes['spike_magnitude'] = spikes['combined_score']
         
@@ -174,12 +314,12 @@ class SpikeDetector:
         Returns:
             DataFrame: 두 변수가 동시에 스파이크를 보이는 시점
         """
-        zscore1 = f'{col1}_zscore'
-        zscore2 = f'{col2}_zscore'
+        zscore1 = self._ensure_zscore(col1)
+        zscore2 = self._ensure_zscore(col2)
         
         # 두 변수 모두 임계값 초과
-        condition = (self.df[zscore1].abs() > threshold) & (self.df[zscore2].abs() > threshold)
-        spikes = self.df[condition].copy()
+        condition = (self._column(zscore1).abs() > threshold) & (self._column(zscore2).abs() > threshold)
+        spikes = self._rows(condition)
         
         if not spikes.empty:
             spikes['spike_type'] = 'correlated_spike'
@@ -200,27 +340,17 @@ class SpikeDetector:
         Returns:
             DataFrame: 텔레그램 & 고래 거래가 동시에 스파이크를 보이는 시점
         """
-        telegram_zscore = f'{telegram_col}_zscore'
-        whale_zscore = f'{whale_col}_zscore'
-        
         # 둘 다 존재하는지 확인
         if telegram_col not in self.df.columns or whale_col not in self.df.columns:
             return pd.DataFrame()
         
         # Z-score 컬럼이 없으면 계산
-        if telegram_zscore not in self.df.columns:
-            mean = self.df[telegram_col].rolling(window=self.window, min_periods=1).mean()
-            std = self.df[telegram_col].rolling(window=self.window, min_periods=1).std()
-            self.df[telegram_zscore] = (self.df[telegram_col] - mean) / (std + 1e-10)
-        
-        if whale_zscore not in self.df.columns:
-            mean = self.df[whale_col].rolling(window=self.window, min_periods=1).mean()
-            std = self.df[whale_col].rolling(window=self.window, min_periods=1).std()
-            self.df[whale_zscore] = (self.df[whale_col] - mean) / (std + 1e-10)
+        telegram_zscore = self._ensure_zscore(telegram_col)
+        whale_zscore = self._ensure_zscore(whale_col)
         
         # 둘 다 양의 방향으로 임계값 초과 (동시 급증)
-        condition = (self.df[telegram_zscore] > threshold) & (self.df[whale_zscore] > threshold)
-        spikes = self.df[condition].copy()
+        condition = (self._column(telegram_zscore) > threshold) & (self._column(whale_zscore) > threshold)
+        spikes = self._rows(condition)
         
         if not spikes.empty:
             spikes['spike_type'] = 'critical_telegram_whale_spike'
@@ -279,9 +409,6 @@ class RealTimeSpikeMonitor:
             df: 데이터프레임
             config: 감지 설정 딕셔너리
         """
-        self.df = df
-        self.detector = SpikeDetector(df)
-        
         # 기본 설정
         self.config = config or {
             'zscore_threshold': 2.5,
@@ -292,38 +419,144 @@ class RealTimeSpikeMonitor:
         }
         
         self.alert_history = []
+        self._lock = threading.Lock()
+        self._reset(df)
+    
+    def _reset(self, df):
+        """
+        전체 이력으로 다시 시작 (일괄 감지는 다음 check_all_spikes에서 한 번 실행)
+        
+        Args:
+            df: 데이터프레임
+        """
+        self.df = df
+        self.detector = SpikeDetector(df)
+        self.streaming = StreamingSpikeDetector(self.config, window=self.detector.window)
+        self.streaming.warm_up(df)
+        self._results = None
+    
+    def _detector_frame(self, spikes, column, detector):
+        """
+        detect_all_spikes의 long-format 결과 한 조각을 개별 감지 메서드와 같은 컬럼 구성으로 변환
+        
+        Args:
+            spikes: 한 컬럼 x 한 감지기의 스파이크 행
+            column: 감지 대상 컬럼명
+            detector: 'zscore', 'ma', 'roc'
+            
+        Returns:
+            DataFrame: detect_zscore_spike / detect_moving_average_spike /
+                       detect_rate_of_change_spike와 같은 컬럼의 스파이크 데이터
+        """
+        names = {
+            'zscore': {'value': column, 'indicator': f'{column}_zscore'},
+            'ma': {'value': column, 'baseline': f'{column}_ma{self.detector.window}', 'indicator': 'pct_from_ma'},
+            'roc': {'value': column, 'indicator': f'{column}_roc'},
+        }[detector]
+        
+        frame = spikes.rename(columns=names)
+        frame['spike_column'] = column
+        frame['spike_type'] = frame['spike_type'].astype(str)
+        
+        return frame[['timestamp', 'spike_column', 'spike_type', 'spike_magnitude', *names.values()]].reset_index(drop=True)
     
     def check_all_spikes(self):
         """
-        모든 스파이크 감지 메서드를 실행하고 결과 반환
+        모든 스파이크 감지 결과 반환
+        
+        전체 이력은 처음 호출할 때 한 번만 일괄 감지하고, 이후 update()로 들어온
+        새 행의 스파이크는 StreamingSpikeDetector 결과를 이어 붙입니다.
+        
+        Returns:
+            dict: 각 감지 유형별 스파이크 데이터
+        """
+        with self._lock:
+            if self._results is None:
+                self._results = self._batch_spikes()
+            return dict(self._results)
+    
+    def update(self, df):
+        """
+        마지막으로 본 시각 이후의 새 행만 StreamingSpikeDetector로 감지해 결과에 추가
+        
+        롤링 통계를 전체 이력에서 다시 계산하지 않으므로 비용은 새 행 수에 비례합니다.
+        df의 첫 시각이 바뀌었거나 마지막 시각이 앞당겨졌으면 처음부터 다시 감지합니다.
+        
+        Args:
+            df: 기존 이력에 새 시간 행이 추가된 전체 데이터프레임 (timestamp 기준 정렬)
+            
+        Returns:
+            DataFrame: 새로 감지된 스파이크 (detector 컬럼으로 감지 유형 구분, 없으면 빈 DataFrame)
+        """
+        if self._results is None:
+            self.check_all_spikes()
+        
+        with self._lock:
+            if self.df.empty or df.empty:
+                self._reset(df)
+                return pd.DataFrame()
+            
+            first, last = self.df['timestamp'].iloc[0], self.df['timestamp'].iloc[-1]
+            if df['timestamp'].iloc[0] != first or df['timestamp'].iloc[-1] < last:
+                self._reset(df)
+                return pd.DataFrame()
+            
+            new_rows = df.iloc[int(df['timestamp'].searchsorted(last, side='right')):]
+            self.df = df
+            if new_rows.empty:
+                return pd.DataFrame()
+            
+            alerts = []
+            column_alerts = []
+            row_alerts = {'multi': [], 'correlation': [], 'combined': []}
+            for row in new_rows.to_dict('records'):
+                for alert in self.streaming.update(row):
+                    alerts.append(alert)
+                    if alert['detector'] in row_alerts:
+                        # 일괄 감지 결과와 같이 스파이크 시점의 원본 행 값을 함께 보관
+                        row_alerts[alert['detector']].append({**row, **alert})
+                    else:
+                        column_alerts.append(alert)
+            
+            if column_alerts:
+                for (col, detector), spikes in pd.DataFrame(column_alerts).groupby(['spike_column', 'detector'], sort=False):
+                    self._append_result(f'{col}_{detector}', self._detector_frame(spikes, col, detector))
+            
+            for detector, key in [('multi', 'multi_indicator'), ('correlation', 'correlation'),
+                                  ('combined', 'telegram_whale_critical')]:
+                if row_alerts[detector]:
+                    self._append_result(key, pd.DataFrame(row_alerts[detector]).drop(columns='detector'))
+            
+            return pd.DataFrame(alerts)
+    
+    def _append_result(self, key, spikes):
+        """감지 결과 테이블 끝에 새 스파이크 추가"""
+        if key in self._results:
+            spikes = pd.concat([self._results[key], spikes], ignore_index=True)
+        self._results[key] = spikes
+    
+    def _batch_spikes(self):
+        """
+        전체 이력에 대해 모든 스파이크 감지 메서드를 일괄 실행 (update 전 초기 감지)
         
         Returns:
             dict: 각 감지 유형별 스파이크 데이터
         """
         results = {}
         
+        # Z-score / 이동평균 / 변화율 스파이크 (모든 컬럼 일괄 감지)
+        all_spikes = self.detector.detect_all_spikes(
+            self.config['monitor_columns'],
+            zscore_threshold=self.config['zscore_threshold'],
+            ma_threshold_pct=self.config['ma_threshold_pct'],
+            roc_window=3,
+            roc_threshold_pct=self.config['roc_threshold_pct']
+        )
+        grouped = all_spikes.groupby(['spike_column', 'detector'], observed=True)
         for col in self.config['monitor_columns']:
-            if col in self.df.columns:
-                # Z-score 스파이크
-                zscore_spikes = self.detector.detect_zscore_spike(
-                    col, self.config['zscore_threshold']
-                )
-                if not zscore_spikes.empty:
-                    results[f'{col}_zscore'] = zscore_spikes
-                
-                # 이동평균 스파이크
-                ma_spikes = self.detector.detect_moving_average_spike(
-                    col, self.config['ma_threshold_pct']
-                )
-                if not ma_spikes.empty:
-                    results[f'{col}_ma'] = ma_spikes
-                
-                # 변화율 스파이크
-                roc_spikes = self.detector.detect_rate_of_change_spike(
-                    col, window=3, threshold_pct=self.config['roc_threshold_pct']
-                )
-                if not roc_spikes.empty:
-                    results[f'{col}_roc'] = roc_spikes
+            for detector in ['zscore', 'ma', 'roc']:
+                if (col, detector) in grouped.groups:
+                    results[f'{col}_{detector}'] = self._detector_frame(grouped.get_group((col, detector)), col, detector)
         
         # 다중 지표 스파이크
         multi_spikes = self.detector.detect_multi_indicator_spike(
@@ -384,6 +617,238 @@ class RealTimeSpikeMonitor:
             return pd.DataFrame()
 
 
+class RollingWindowState:
+    """단일 컬럼의 슬라이딩 윈도우 상태 (링 버퍼 + Welford 누적값)"""
+    
+    def __init__(self, window=24, history=None):
+        """
+        Args:
+            window: 롤링 통계 윈도우 크기
+            history: 링 버퍼 크기 (변화율 계산용으로 window보다 길 수 있음)
+        """
+        self.window = window
+        self.size = max(window, history or window)
+        self.buffer = [math.nan] * self.size
+        self.pos = 0          # 다음에 기록할 위치
+        self.seen = 0         # 지금까지 들어온 값의 개수
+        self.count = 0        # 윈도우 안의 유효값(NaN 제외) 개수
+        self.mean = 0.0
+        self.m2 = 0.0
+    
+    def _add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+    
+    def _remove(self, value):
+        self.count -= 1
+        if self.count == 0:
+            self.mean = 0.0
+            self.m2 = 0.0
+            return
+        delta = value - self.mean
+        self.mean -= delta / self.count
+        self.m2 = max(self.m2 - delta * (value - self.mean), 0.0)
+    
+    def push(self, value):
+        """새 값 추가 (윈도우를 벗어나는 값은 제거)"""
+        value = float(value) if value is not None else math.nan
+        
+        if self.seen >= self.window:
+            leaving = self.buffer[(self.pos - self.window) % self.size]
+            if not math.isnan(leaving):
+                self._remove(leaving)
+        
+        if not math.isnan(value):
+            self._add(value)
+        
+        self.buffer[self.pos] = value
+        self.pos = (self.pos + 1) % self.size
+        self.seen += 1
+    
+    def value_ago(self, periods):
+        """periods 시간 전의 값 (없으면 NaN)"""
+        if periods >= self.size or periods >= self.seen:
+            return math.nan
+        return self.buffer[(self.pos - 1 - periods) % self.size]
+    
+    @property
+    def std(self):
+        """윈도우 표본 표준편차 (값이 2개 미만이면 NaN)"""
+        if self.count < 2:
+            return math.nan
+        return math.sqrt(self.m2 / (self.count - 1))
+
+
+class StreamingSpikeDetector:
+    """
+    스트리밍 스파이크 감지
+    
+    컬럼별 롤링 상태를 유지하여 새 시간 데이터가 들어올 때마다
+    전체 이력을 다시 계산하지 않고 상수 시간에 스파이크를 감지합니다.
+    감지 기준은 SpikeDetector의 Z-score/이동평균/변화율/다중 지표/상관관계/텔레그램+고래 감지와 같습니다.
+    """
+    
+    def __init__(self, config=None, window=24):
+        """
+        Args:
+            config: 감지 설정 딕셔너리 (RealTimeSpikeMonitor와 같은 키 + roc_window, combined_threshold)
+            window: 이동평균 윈도우 크기 (기본: 24시간)
+        """
+        self.config = {
+            'zscore_threshold': 2.5,
+            'ma_threshold_pct': 50,
+            'roc_threshold_pct': 30,
+            'roc_window': 3,
+            'multi_threshold': 0.7,
+            'combined_threshold': 2.0,
+            'telegram_col': 'message_count',
+            'whale_col': 'tx_frequency',
+            'correlation_columns': ['message_count', 'ETH_close'],
+            'monitor_columns': ['message_count', 'ETH_close', 'tx_frequency']
+        }
+        self.config.update(config or {})
+        self.window = window
+        
+        # 모니터링 컬럼 + 조합 감지에 쓰는 컬럼의 롤링 상태
+        columns = list(self.config['monitor_columns'])
+        for col in [self.config['telegram_col'], self.config['whale_col'], *self.config['correlation_columns']]:
+            if col not in columns:
+                columns.append(col)
+        
+        self.states = {
+            col: RollingWindowState(window, history=self.config['roc_window'] + 1)
+            for col in columns
+        }
+        # 변화율용 직전 유효 값으로 채운 최근 값 (pct_change와 같은 결측 처리)
+        self.filled = {col: deque(maxlen=self.config['roc_window'] + 1) for col in columns}
+    
+    def warm_up(self, df):
+        """
+        과거 데이터로 롤링 상태 초기화 (알람은 생성하지 않음)
+        
+        Args:
+            df: 시간순으로 정렬된 데이터프레임
+        """
+        columns = [col for col in self.states if col in df.columns]
+        for col in columns:
+            values = df[col].to_numpy(dtype=np.float64)
+            for value in values[-self.states[col].size:]:
+                self.states[col].push(value)
+            self.filled[col].extend(pd.Series(values).ffill().to_numpy()[-self.filled[col].maxlen:])
+    
+    @staticmethod
+    def _pct_change(current, previous):
+        """pandas pct_change와 같은 변화율(%) (0에서의 증가는 ±inf, 0에서 0은 NaN)"""
+        if previous == 0:
+            return math.copysign(math.inf, current) if current != 0 and not math.isnan(current) else math.nan
+        return (current / previous - 1) * 100
+    
+    def update(self, row):
+        """
+        새 시간 데이터 한 행을 반영하고 감지된 스파이크 반환
+        
+        Args:
+            row: dict 또는 Series (timestamp와 모니터링 컬럼 포함)
+            
+        Returns:
+            list: 스파이크 정보 딕셔너리 리스트
+                  (zscore/ma/roc는 detect_all_spikes와 같은 value, baseline, indicator 포함,
+                   multi/correlation/combined는 RealTimeSpikeMonitor의 조합 감지와 같은 기준)
+        """
+        timestamp = row.get('timestamp')
+        roc_window = self.config['roc_window']
+        alerts = []
+        zscores = {}
+        
+        for col, state in self.states.items():
+            value = row.get(col)
+            value = math.nan if value is None or pd.isna(value) else float(value)
+            state.push(value)
+            
+            filled = self.filled[col]
+            filled.append(value if not math.isnan(value) or not filled else filled[-1])
+            
+            zscores[col] = (value - state.mean) / (state.std + 1e-10)
+            if col not in self.config['monitor_columns']:
+                continue
+            
+            # 이동평균 대비 변화율, roc_window 시간 전 대비 변화율
+            pct_from_ma = (value - state.mean) / (state.mean + 1e-10) * 100
+            previous = filled[0] if len(filled) > roc_window else math.nan
+            roc = self._pct_change(filled[-1], previous)
+            
+            detectors = [
+                ('zscore', zscores[col], state.mean, self.config['zscore_threshold'], 'positive_spike', 'negative_spike'),
+                ('ma', pct_from_ma, state.mean, self.config['ma_threshold_pct'], 'surge', 'drop'),
+                ('roc', roc, previous, self.config['roc_threshold_pct'], 'rapid_increase', 'rapid_decrease'),
+            ]
+            for name, indicator, baseline, threshold, up_label, down_label in detectors:
+                if abs(indicator) > threshold:
+                    alerts.append({
+                        'timestamp': timestamp,
+                        'spike_column': col,
+                        'detector': name,
+                        'spike_type': up_label if indicator > 0 else down_label,
+                        'spike_magnitude': abs(indicator),
+                        'value': value,
+                        'baseline': baseline,
+                        'indicator': indicator
+                    })
+        
+        # 다중 지표 스파이크 (sigmoid(z)에서 0.5를 벗어난 정도 = |tanh(z/2)|의 평균, 행에 없는 컬럼은 0점)
+        monitor_columns = self.config['monitor_columns']
+        scores = {
+            f'{col}_score': abs(math.tanh(zscores[col] / 2)) if col in row else 0.0
+            for col in monitor_columns
+        }
+        combined_score = sum(scores.values()) / len(monitor_columns) if monitor_columns else math.nan
+        if combined_score > self.config['multi_threshold']:
+            alerts.append({
+                'timestamp': timestamp,
+                **scores,
+                'combined_score': combined_score,
+                'spike_type': 'multi_indicator',
+                'spike_magnitude': combined_score,
+                'detector': 'multi'
+            })
+        
+        # 상관관계 스파이크 (두 컬럼이 동시에 |Z| 초과)
+        col1, col2 = self.config['correlation_columns']
+        z1, z2 = zscores.get(col1, math.nan), zscores.get(col2, math.nan)
+        threshold = self.config['zscore_threshold']
+        if abs(z1) > threshold and abs(z2) > threshold:
+            alerts.append({
+                'timestamp': timestamp,
+                'spike_type': 'correlated_spike',
+                'spike_magnitude': (abs(z1) + abs(z2)) / 2,
+                'spike_columns': f'{col1} & {col2}',
+                'detector': 'correlation'
+            })
+        
+        # 텔레그램 & 고래 거래 동시 스파이크 (CRITICAL)
+        telegram_col, whale_col = self.config['telegram_col'], self.config['whale_col']
+        telegram_z = zscores.get(telegram_col, math.nan)
+        whale_z = zscores.get(whale_col, math.nan)
+        threshold = self.config['combined_threshold']
+        if telegram_z > threshold and whale_z > threshold:
+            alerts.append({
+                'timestamp': timestamp,
+                'spike_type': 'critical_telegram_whale_spike',
+                'spike_magnitude': (telegram_z + whale_z) / 2,
+                'spike_columns': f'{telegram_col} & {whale_col}',
+                'alert_level': 'critical',
+                'telegram_zscore_value': telegram_z,
+                'whale_zscore_value': whale_z,
+                'telegram_value': row.get(telegram_col),
+                'whale_value': row.get(whale_col),
+                'detector': 'combined'
+            })
+        
+        return alerts
+
+
 if __name__ == '__main__':
     # 테스트
     import sys
@@ -15,6 +15,7 @@ sys.path.append('/Volumes/T7/class/2025-FALL/big_data')
 
 from utils.data_loader import DataLoader
 from analysis.correlation_analysis import CorrelationAnalyzer
+from analysis.correlation_service import WindowCorrelationService
 from analysis.spike_detector import RealTimeSpikeMonitor
 from utils.alert_system import AlertSystem
 from components import charts, metrics, filters, alerts
@@ -45,6 +46,18 @@ def load_data():
         return pd.DataFrame()
 
 
+@st.cache_resource
+def get_correlation_service(df):
+    """기간별 상관계수 서비스 (데이터가 바뀔 때만 누적합 재계산)"""
+    return WindowCorrelationService(df)
+
+
+@st.cache_resource(max_entries=8)
+def get_spike_monitor(_df, alert_settings):
+    """알람 설정별 스파이크 모니터 (전체 이력은 처음 한 번만 일괄 감지, 이후 새 행은 update로 스트리밍 감지)"""
+    return RealTimeSpikeMonitor(_df, config=alert_settings)
+
+
 def overview_page(df):
     """Overview 페이지"""
     if df.empty:
@@ -249,6 +262,11 @@ def correlation_page(df):
     
     analyzer = CorrelationAnalyzer(filtered_df)
     
+    # 슬라이더 구간의 상관계수는 전체 데이터의 누적합으로 계산
+    corr_service = get_correlation_service(df)
+    window_start = pd.to_datetime(start_date) if start_date else None
+    window_end = pd.to_datetime(end_date) + timedelta(days=1) - timedelta(seconds=1) if end_date else None
+    
     # 상관계수 히트맵
     st.markdown('### 🔥 상관계수 히트맵', unsafe_allow_html=True)
     
@@ -262,7 +280,7 @@ def correlation_page(df):
             if col in filtered_df.columns:
                 key_columns.append(col)
         
-        pearson_corr = analyzer.pearson_correlation(key_columns)
+        pearson_corr = corr_service.pearson(window_start, window_end, key_columns)
         fig_pearson = charts.create_correlation_heatmap(
             pearson_corr,
             title="Pearson 상관계수 (선형 관계)",
@@ -271,7 +289,7 @@ def correlation_page(df):
         st.plotly_chart(fig_pearson, use_container_width=True)
     
     with tab2:
-        spearman_corr = analyzer.spearman_correlation(key_columns)
+        spearman_corr = corr_service.spearman(window_start, window_end, key_columns)
         fig_spearman = charts.create_correlation_heatmap(
             spearman_corr,
             title="Spearman 상관계수 (순위 기반)",
@@ -282,7 +300,7 @@ def correlation_page(df):
     # ETH 가격과의 상관관계 Top 10
     st.markdown('### 🏆 ETH 가격과 상관관계 Top 10', unsafe_allow_html=True)
     
-    top_corr = analyzer.get_top_correlations('ETH_close', n=10, method='pearson')
+    top_corr = corr_service.get_top_correlations('ETH_close', window_start, window_end, n=10, method='pearson')
     
     if not top_corr.empty:
         corr_df = pd.DataFrame({
@@ -317,7 +335,7 @@ def correlation_page(df):
                 key="lag_var2"
             )
             
-            max_lag = st.slider("최대 시차 (시간)", 1, 48, 24)
+            max_lag = st.slider("최대 시차 (시간)", 1, 168, 24)
         
         with col1:
             if lag_var1 and lag_var2:
@@ -409,11 +427,12 @@ def alerts_page(df):
     
     st.markdown("---")
     
-    # 스파이크 모니터 초기화
-    monitor = RealTimeSpikeMonitor(df, config=alert_settings)
+    # 스파이크 모니터 (새로 로드된 시간 행만 반영)
+    monitor = get_spike_monitor(df, alert_settings)
     
     # 스파이크 감지 실행
     with st.spinner("스파이크 감지 중..."):
+        monitor.update(df)
         spike_results = monitor.check_all_spikes()
     
     # 결과 요약
@@ -16,7 +16,7 @@ from datetime import datetime, timedelta
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from utils.data_loader import DataLoader
-from utils.composite_score import CompositeScoreCalculator
+from utils.composite_score import IncrementalCompositeScorer
 from analysis.spike_detector import SpikeDetector
 
 # 페이지 설정
@@ -228,12 +228,18 @@ def load_all_data():
         st.error(f"데이터 로드 실패: {e}")
         df_main = pd.DataFrame()
     
-    # 개별 소스 데이터
-    data = loader.load_all_data()
+    # 개별 소스 데이터 (병렬 로드, 트위터는 종합 점수에 쓰는 컬럼만)
+    data = loader.load_all_data(parallel=True, projections={'twitter': ['likes', 'sentiment_score']})
     
     return df_main, data
 
 
+@st.cache_resource
+def get_composite_scorer():
+    """종합 점수기 (세션 간 공유, 롤링 상태는 data/.cache에 저장되어 재시작 후에도 이어서 계산)"""
+    return IncrementalCompositeScorer()
+
+
 def create_signal_box_html(source_name, score, arrow="→", color="#00d4ff"):
     """신호 박스 HTML 생성"""
     return f"""
@@ -266,35 +272,34 @@ def render_signal_boxes(df_main, data):
         st.warning("데이터가 없습니다. data/processed_data.csv 파일을 확인해주세요.")
         return df_main
     
-    # 종합 점수 계산
-    calculator = CompositeScoreCalculator()
+    # 종합 점수 계산 (새로 들어온 시간만 계산)
+    scorer = get_composite_scorer()
     try:
-        df_scored = calculator.calculate_composite_score(
+        scorer.update(
             df_main, 
             df_news=data.get('coinness', pd.DataFrame()), 
             df_twitter=data.get('twitter', pd.DataFrame())
         )
+        df_scored = scorer.history()
     except Exception as e:
         st.error(f"종합 점수 계산 실패: {e}")
         import traceback
         st.code(traceback.format_exc())
-        df_scored = df_main.copy()
+        df_scored = df_main[['timestamp']].copy()
         df_scored['composite_score'] = 50
         df_scored['telegram_score'] = 50
         df_scored['news_score'] = 50
         df_scored['twitter_score'] = 50
     
     # 최근 점수
-    if not df_scored.empty:
-        telegram_score = df_scored['telegram_score'].iloc[-1]
-        news_score = df_scored['news_score'].iloc[-1]
-        twitter_score = df_scored['twitter_score'].iloc[-1]
-        composite_score = df_scored['composite_score'].iloc[-1]
-    else:
-        telegram_score = news_score = twitter_score = composite_score = 50
+    latest = scorer.latest()
+    telegram_score = latest['telegram_score']
+    news_score = latest['news_score']
+    twitter_score = latest['twitter_score']
+    composite_score = latest['composite_score']
     
     # 종합 점수 카드 (상단)
-    signal_summary = calculator.get_signal_summary(df_scored)
+    signal_summary = scorer.calculator.get_signal_summary(df_scored)
     
     st.markdown(f"""
     <div class="score-card">
@@ -445,7 +450,7 @@ def main():
             st.plotly_chart(fig, use_container_width=True)
         
         # 스파이크 알람
-        render_spike_table(df_scored)
+        render_spike_table(df_main)
     
     with tab2:
         st.markdown("### 텔레그램 분석")
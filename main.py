@@ -16,7 +16,7 @@ from datetime import datetime, timedelta
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from utils.data_loader import DataLoader
-from utils.composite_score import CompositeScoreCalculator
+from utils.composite_score import IncrementalCompositeScorer
 from analysis.spike_detector import SpikeDetector
 
 # 페이지 설정
@@ -367,12 +367,18 @@ def load_all_data():
         st.error(f"데이터 로드 실패: {e}")
         df_main = pd.DataFrame()
     
-    # 개별 소스 데이터
-    data = loader.load_all_data()
+    # 개별 소스 데이터 (병렬 로드, 트위터는 종합 점수에 쓰는 컬럼만)
+    data = loader.load_all_data(parallel=True, projections={'twitter': ['likes', 'sentiment_score']})
     
     return df_main, data
 
 
+@st.cache_resource
+def get_composite_scorer():
+    """종합 점수기 (세션 간 공유, 롤링 상태는 data/.cache에 저장되어 재시작 후에도 이어서 계산)"""
+    return IncrementalCompositeScorer()
+
+
 def render_top_navigation():
     """상단 네비게이션 렌더링"""
     st.markdown("""
@@ -588,34 +594,29 @@ def main():
         st.error("데이터를 로드할 수 없습니다. 먼저 python scripts/preprocess_data.py를 실행하세요.")
         return
     
-    # 신호 점수 계산 (화면에는 표시 안 함)
-    calculator = CompositeScoreCalculator()
+    # 신호 점수 계산 (새로 들어온 시간만 계산, 화면에는 표시 안 함)
+    scorer = get_composite_scorer()
     try:
-        df_scored = calculator.calculate_composite_score(
+        scorer.update(
             df_main, 
             df_news=data.get('coinness', pd.DataFrame()), 
             df_twitter=data.get('twitter', pd.DataFrame())
         )
         
-        # 최근 점수
-        telegram_score = df_scored['telegram_score'].iloc[-1] if not df_scored.empty else 50
-        news_score = df_scored['news_score'].iloc[-1] if not df_scored.empty else 50
-        twitter_score = df_scored['twitter_score'].iloc[-1] if not df_scored.empty else 50
-        composite_score = df_scored['composite_score'].iloc[-1] if not df_scored.empty else 50
-        
-        # 24시간 변화
-        if len(df_scored) > 24:
-            composite_score_24h = df_scored['composite_score'].iloc[-25]
-            score_change = composite_score - composite_score_24h
-            score_change_pct = (score_change / composite_score_24h) * 100 if composite_score_24h != 0 else 0
-        else:
-            score_change = 0
-            score_change_pct = 0
+        # 최근 점수 + 24시간 변화
+        latest = scorer.latest()
+        telegram_score = latest['telegram_score']
+        news_score = latest['news_score']
+        twitter_score = latest['twitter_score']
+        composite_score = latest['composite_score']
+        score_change = latest['change_24h']
+        score_change_pct = latest['change_24h_pct']
         
-        signal_summary = calculator.get_signal_summary(df_scored)
+        df_scored = scorer.history()
+        signal_summary = scorer.calculator.get_signal_summary(df_scored)
     except Exception as e:
         st.error(f"점수 계산 실패: {e}")
-        df_scored = df_main
+        df_scored = pd.DataFrame()
         telegram_score = news_score = twitter_score = composite_score = 50
         score_change = 0
         score_change_pct = 0
@@ -731,12 +732,12 @@ def main():
         
         with tab1:
             # 코인가격과의 상관관계 계산
-            correlations_price = calculate_correlations_with_price(df_scored)
+            correlations_price = calculate_correlations_with_price(df_main)
             render_correlation_indicators(correlations_price, "코인 가격")
         
         with tab2:
             # 고래지갑과의 상관관계 계산
-            correlations_whale = calculate_correlations_with_whale(df_scored)
+            correlations_whale = calculate_correlations_with_whale(df_main)
             render_correlation_indicators(correlations_whale, "고래 거래")
         
         with tab3:
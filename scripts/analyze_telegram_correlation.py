@@ -7,7 +7,6 @@
 import pandas as pd
 import numpy as np
 from scipy import stats
-from statsmodels.tsa.stattools import grangercausalitytests
 import warnings
 import sys
 import os
@@ -17,6 +16,8 @@ warnings.filterwarnings('ignore')
 # 경로 추가
 sys.path.append('/Volumes/T7/class/2025-FALL/big_data')
 
+from analysis.correlation_analysis import CorrelationAnalyzer, lag_cross_correlation
+
 def load_data():
     """전처리된 데이터 로드"""
     try:
@@ -110,21 +111,16 @@ def analyze_lag_correlation(df):
     print("   (텔레그램 활동 후 몇 시간 뒤에 가격이 변하는가?)")
     
     lag_results_eth = []
-    for lag in range(0, max_lag + 1):
-        if len(df_clean) > lag:
-            x = df_clean['message_count'].iloc[:-lag] if lag > 0 else df_clean['message_count']
-            y = df_clean['ETH_close'].iloc[lag:] if lag > 0 else df_clean['ETH_close']
-            
-            if len(x) > 0 and len(y) > 0 and len(x) == len(y):
-                corr, p_val = stats.pearsonr(x, y)
-                lag_results_eth.append({
-                    'lag': lag,
-                    'correlation': corr,
-                    'p_value': p_val,
-                    'significant': p_val < 0.05
-                })
-                sig_marker = '✅' if p_val < 0.05 else '  '
-                print(f"   Lag {lag:2d}시간: r={corr:+.4f}, p={p_val:.4f} {sig_marker}")
+    correlations, p_values, _ = lag_cross_correlation(df_clean['message_count'], df_clean['ETH_close'], max_lag)
+    for lag, (corr, p_val) in enumerate(zip(correlations, p_values)):
+        lag_results_eth.append({
+            'lag': lag,
+            'correlation': corr,
+            'p_value': p_val,
+            'significant': p_val < 0.05
+        })
+        sig_marker = '✅' if p_val < 0.05 else '  '
+        print(f"   Lag {lag:2d}시간: r={corr:+.4f}, p={p_val:.4f} {sig_marker}")
     
     if lag_results_eth:
         max_corr_eth = max(lag_results_eth, key=lambda x: abs(x['correlation']))
@@ -136,21 +132,16 @@ def analyze_lag_correlation(df):
     print("   (텔레그램 활동 후 몇 시간 뒤에 고래가 움직이는가?)")
     
     lag_results_whale = []
-    for lag in range(0, max_lag + 1):
-        if len(df_clean) > lag:
-            x = df_clean['message_count'].iloc[:-lag] if lag > 0 else df_clean['message_count']
-            y = df_clean['tx_frequency'].iloc[lag:] if lag > 0 else df_clean['tx_frequency']
-            
-            if len(x) > 0 and len(y) > 0 and len(x) == len(y):
-                corr, p_val = stats.pearsonr(x, y)
-                lag_results_whale.append({
-                    'lag': lag,
-                    'correlation': corr,
-                    'p_value': p_val,
-                    'significant': p_val < 0.05
-                })
-                sig_marker = '✅' if p_val < 0.05 else '  '
-                print(f"   Lag {lag:2d}시간: r={corr:+.4f}, p={p_val:.4f} {sig_marker}")
+    correlations, p_values, _ = lag_cross_correlation(df_clean['message_count'], df_clean['tx_frequency'], max_lag)
+    for lag, (corr, p_val) in enumerate(zip(correlations, p_values)):
+        lag_results_whale.append({
+            'lag': lag,
+            'correlation': corr,
+            'p_value': p_val,
+            'significant': p_val < 0.05
+        })
+        sig_marker = '✅' if p_val < 0.05 else '  '
+        print(f"   Lag {lag:2d}시간: r={corr:+.4f}, p={p_val:.4f} {sig_marker}")
     
     if lag_results_whale:
         max_corr_whale = max(lag_results_whale, key=lambda x: abs(x['correlation']))
@@ -223,51 +214,33 @@ def analyze_granger_causality(df):
     
     max_lag = min(8, len(df_clean) // 20)
     
-    try:
-        # 1. 텔레그램 → ETH 가격
-        print(f"\n🔍 텔레그램 메시지 수 → ETH 가격 (최대 {max_lag}시간 lag)")
-        test_data = df_clean[['ETH_close', 'message_count']].copy()
-        test_result = grangercausalitytests(test_data, max_lag, verbose=False)
-        
-        significant_lags = []
-        for lag in range(1, max_lag + 1):
-            p_value = test_result[lag][0]['ssr_ftest'][1]
-            if p_value < 0.05:
-                significant_lags.append(lag)
-                print(f"   Lag {lag}: p={p_value:.4f} ✅ 유의함!")
-            else:
-                print(f"   Lag {lag}: p={p_value:.4f}")
-        
-        if significant_lags:
-            print(f"\n   ✅ 텔레그램 활동이 ETH 가격에 영향을 줌! (Lag: {significant_lags})")
-        else:
-            print(f"\n   ❌ 텔레그램 활동이 ETH 가격에 유의미한 영향을 주지 않음")
-        
-    except Exception as e:
-        print(f"   ⚠️ 그랜저 인과관계 검정 실패: {e}")
+    # 두 검정을 프로세스 풀에서 동시에 실행
+    targets = [('ETH_close', 'ETH 가격'), ('tx_frequency', '고래 거래 빈도')]
+    analyzer = CorrelationAnalyzer(df_clean)
+    grid = analyzer.granger_causality_grid(
+        [('message_count', target) for target, _ in targets], lags=max_lag
+    )
     
-    try:
-        # 2. 텔레그램 → 고래 거래
-        print(f"\n🔍 텔레그램 메시지 수 → 고래 거래 빈도 (최대 {max_lag}시간 lag)")
-        test_data = df_clean[['tx_frequency', 'message_count']].copy()
-        test_result = grangercausalitytests(test_data, max_lag, verbose=False)
+    for target, label in targets:
+        print(f"\n🔍 텔레그램 메시지 수 → {label} (최대 {max_lag}시간 lag)")
+        result = grid[grid['effect'] == target]
+        
+        if result['error'].notna().any():
+            print(f"   ⚠️ 그랜저 인과관계 검정 실패: {result['error'].dropna().iloc[0]}")
+            continue
         
         significant_lags = []
-        for lag in range(1, max_lag + 1):
-            p_value = test_result[lag][0]['ssr_ftest'][1]
-            if p_value < 0.05:
-                significant_lags.append(lag)
-                print(f"   Lag {lag}: p={p_value:.4f} ✅ 유의함!")
+        for _, row in result.iterrows():
+            if row['p_value'] < 0.05:
+                significant_lags.append(int(row['lag']))
+                print(f"   Lag {int(row['lag'])}: p={row['p_value']:.4f} ✅ 유의함!")
             else:
-                print(f"   Lag {lag}: p={p_value:.4f}")
+                print(f"   Lag {int(row['lag'])}: p={row['p_value']:.4f}")
         
         if significant_lags:
-            print(f"\n   ✅ 텔레그램 활동이 고래 거래에 영향을 줌! (Lag: {significant_lags})")
+            print(f"\n   ✅ 텔레그램 활동이 {label}에 영향을 줌! (Lag: {significant_lags})")
         else:
-            print(f"\n   ❌ 텔레그램 활동이 고래 거래에 유의미한 영향을 주지 않음")
-        
-    except Exception as e:
-        print(f"   ⚠️ 그랜저 인과관계 검정 실패: {e}")
+            print(f"\n   ❌ 텔레그램 활동이 {label}에 유의미한 영향을 주지 않음")
 
 
 def generate_summary(df, basic_results):
@@ -0,0 +1,142 @@
+"""
+비동기 요청기(AsyncFetcher) 오프라인 벤치마크
+
+로컬 스텁 HTTP 서버를 띄워 실제 사이트에 요청하지 않고 처리량을 측정합니다.
+- 스텁 서버: 페이지마다 응답 지연, ETag/Last-Modified, 일정 비율의 429 (Retry-After)
+- 순차 요청(동시 1개)과 동시 요청의 초당 페이지 수 비교
+- 두 번째 실행에서 조건부 요청(304) 비율 확인
+
+사용법:
+    python scripts/benchmark_fetcher.py
+"""
+
+import os
+import sys
+import asyncio
+import hashlib
+import random
+import tempfile
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 프로젝트 루트 (utils 패키지 import용)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.http_fetcher import AsyncFetcher
+
+
+# 스텁 페이지 수정 시각 (조건부 요청용)
+STUB_LAST_MODIFIED = formatdate(time.time(), usegmt=True)
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """코인니스/코인판 목록 페이지를 흉내 내는 스텁 핸들러"""
+    
+    latency = 0.05
+    error_rate = 0.0
+    
+    def do_GET(self):
+        time.sleep(self.latency)
+        
+        # Rate limit 흉내
+        if random.random() < self.error_rate:
+            self.send_response(429)
+            self.send_header('Retry-After', '1')
+            self.end_headers()
+            return
+        
+        body = ''.join(
+            f'<a class="ArticleWrapper"><h3 class="ArticleTitle">{self.path} #{i}</h3></a>'
+            for i in range(20)
+        ).encode('utf-8')
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', etag)
+        self.send_header('Last-Modified', STUB_LAST_MODIFIED)
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_server(latency=0.05, error_rate=0.0):
+    """
+    스텁 서버를 백그라운드 스레드에서 시작
+    
+    Args:
+        latency: 요청당 응답 지연 (초)
+        error_rate: 429를 돌려줄 확률
+    
+    Returns:
+        tuple: (server, base_url) - 종료 시 server.shutdown() 호출
+    """
+    handler = type('ConfiguredStubHandler', (StubHandler,), {'latency': latency, 'error_rate': error_rate})
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    
+    host, port = server.server_address
+    return server, f'http://{host}:{port}'
+
+
+async def run_fetch(base_url, pages, concurrency, rate, cache_path=None):
+    """
+    페이지 목록을 요청하고 처리량 측정
+    
+    Returns:
+        tuple: (초당 페이지 수, 요청 통계)
+    """
+    fetcher = AsyncFetcher(
+        max_connections=concurrency,
+        per_host_rate=rate,
+        burst=concurrency,
+        backoff_base=0.5,
+        cache_path=cache_path
+    )
+    urls = [f'{base_url}/article?page={page}' for page in range(1, pages + 1)]
+    
+    async with fetcher:
+        started = time.perf_counter()
+        
+        if concurrency == 1:
+            results = [await fetcher.fetch(url) for url in urls]
+        else:
+            results = await fetcher.fetch_all(urls)
+        
+        elapsed = time.perf_counter() - started
+    
+    fetched = sum(result is not None for result in results)
+    return fetched / elapsed, fetcher.stats
+
+
+def main(pages=200, latency=0.05, error_rate=0.02, rate=100.0):
+    """벤치마크 실행"""
+    server, base_url = start_stub_server(latency=latency, error_rate=error_rate)
+    cache_path = os.path.join(tempfile.mkdtemp(), 'http_cache.sqlite')
+    
+    print("=== AsyncFetcher 벤치마크 ===")
+    print(f"스텁 서버: {base_url} (지연 {latency * 1000:.0f}ms, 429 비율 {error_rate:.0%})")
+    print(f"페이지 수: {pages}, 호스트별 속도 제한: {rate}/s\n")
+    
+    try:
+        throughput, stats = asyncio.run(run_fetch(base_url, pages, 1, rate))
+        print(f"순차 (동시 1개): {throughput:.1f} pages/s  {stats}")
+        
+        for concurrency in [4, 8, 16]:
+            throughput, stats = asyncio.run(run_fetch(base_url, pages, concurrency, rate, cache_path))
+            print(f"동시 {concurrency}개: {throughput:.1f} pages/s  {stats}")
+    finally:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
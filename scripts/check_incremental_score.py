@@ -0,0 +1,142 @@
+"""
+증분 종합 점수 검증 스크립트
+
+IncrementalCompositeScorer를 여러 번 나눠 갱신한 결과가 한 번에 갱신한 결과와 같은지,
+마지막 점수가 CompositeScoreCalculator 전체 계산과 같은지 확인합니다.
+- 기본: 저장소의 전처리 데이터 + 뉴스/트위터
+- 소스 중단: 뉴스/트위터가 메인 데이터 끝보다 100시간 먼저 끊긴 경우
+  (마지막 갱신 구간에 기사가 없어도 중립 50이 아니라 0건으로 계산되어야 함)
+- 백필: 이미 계산한 48시간 구간의 뉴스/트윗이 마지막 갱신 때 들어온 경우
+  (다시 계산되어 한 번에 갱신한 결과와 같아야 하고, 백필 전 데이터로만 계산한 결과와는 달라야 함)
+
+사용법:
+    python scripts/check_incremental_score.py
+"""
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트 (utils 패키지 import용)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.composite_score import CompositeScoreCalculator, IncrementalCompositeScorer
+from utils.data_loader import DataLoader
+
+
+SCORE_COLUMNS = ['telegram_score', 'news_score', 'twitter_score', 'composite_score']
+
+
+def run_scorer(state_path, chunks, df, df_news, df_twitter, early_sources=None):
+    """
+    메인 데이터를 chunks 경계까지 나눠 차례로 갱신 (갱신마다 저장된 상태에서 다시 시작)
+    
+    Args:
+        early_sources: 마지막 갱신 전까지 쓸 (뉴스, 트위터) - None이면 처음부터 df_news/df_twitter
+    
+    Returns:
+        IncrementalCompositeScorer: 마지막 갱신 후 점수기
+    """
+    scorer = None
+    for i, end in enumerate(chunks):
+        news, twitter = df_news, df_twitter
+        if early_sources is not None and i < len(chunks) - 1:
+            news, twitter = early_sources
+        
+        scorer = IncrementalCompositeScorer(state_path=state_path)
+        scorer.update(df.iloc[:end], news, twitter)
+    return scorer
+
+
+def history_diff(a, b):
+    """두 점수기의 점수 시계열 최대 차이"""
+    return max(
+        np.abs(a.history()[col].to_numpy() - b.history()[col].to_numpy()).max()
+        for col in SCORE_COLUMNS
+    )
+
+
+def check_case(name, df, df_news, df_twitter, early_sources=None, tolerance=1e-9):
+    """
+    나눠 갱신 == 한 번에 갱신, 마지막 점수 == 전체 계산 여부 확인
+    
+    Args:
+        early_sources: 마지막 갱신 전까지 쓸 (뉴스, 트위터) - 백필 검사용
+    
+    Returns:
+        bool: 통과 여부
+    """
+    chunks = [len(df) // 2, len(df) - 50, len(df) - 1, len(df)]
+    
+    with tempfile.TemporaryDirectory() as state_dir:
+        one_shot = run_scorer(os.path.join(state_dir, 'one_shot.npz'), [len(df)], df, df_news, df_twitter)
+        chunked = run_scorer(os.path.join(state_dir, 'chunked.npz'), chunks, df, df_news, df_twitter,
+                             early_sources)
+        stale = None
+        if early_sources is not None:
+            stale = run_scorer(os.path.join(state_dir, 'stale.npz'), [len(df)], df, *early_sources)
+    full = CompositeScoreCalculator().calculate_composite_score(df, df_news, df_twitter)
+    
+    chunked_diff = history_diff(chunked, one_shot)
+    latest = chunked.latest()
+    latest_diff = abs(latest['composite_score'] - full['composite_score'].iloc[-1])
+    
+    passed = chunked_diff <= tolerance and latest_diff <= tolerance
+    if stale is not None:
+        # 백필 데이터가 점수를 실제로 바꿔야 검사 의미가 있음
+        stale_diff = history_diff(stale, one_shot)
+        passed &= stale_diff > tolerance
+    
+    print(f"{'✅' if passed else '❌'} {name}")
+    print(f"   나눠 갱신 vs 한 번에 갱신 최대 차이: {chunked_diff:.2e}")
+    if stale is not None:
+        print(f"   백필 전 데이터로만 계산한 결과와의 최대 차이: {stale_diff:.2e}")
+    print(f"   마지막 점수: 증분 {latest['composite_score']:.4f} ({latest['signal_level']}), "
+          f"전체 계산 {full['composite_score'].iloc[-1]:.4f}")
+    
+    return passed
+
+
+def main():
+    """검증 실행"""
+    df = pd.read_csv(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                  'data', 'processed_data.csv'))
+    df['timestamp'] = pd.to_datetime(df['timestamp'])
+    
+    data = DataLoader().load_all_data(projections={'twitter': ['likes', 'sentiment_score']})
+    df_news, df_twitter = data['coinness'], data['twitter']
+    
+    print("=== 증분 종합 점수 검증 ===\n")
+    results = [check_case("기본 데이터", df, df_news, df_twitter)]
+    
+    cut = df['timestamp'].iloc[-1] - pd.Timedelta(hours=100)
+    results.append(check_case(
+        "소스 중단 (메인 데이터 끝 100시간 전)",
+        df,
+        df_news[df_news['timestamp'] < cut],
+        df_twitter[df_twitter['timestamp'] < cut]
+    ))
+    
+    results.append(check_case("뉴스/트위터 없음", df, pd.DataFrame(), pd.DataFrame()))
+    
+    # 메인 데이터 끝 150~102시간 전 구간 (첫 갱신들에서 이미 계산하는 구간)
+    hole_end = df['timestamp'].iloc[-1] - pd.Timedelta(hours=102)
+    hole_start = hole_end - pd.Timedelta(hours=48)
+    results.append(check_case(
+        "백필 (이미 계산한 48시간 구간의 뉴스/트윗이 나중에 들어옴)",
+        df,
+        df_news,
+        df_twitter,
+        early_sources=(
+            df_news[(df_news['timestamp'] < hole_start) | (df_news['timestamp'] >= hole_end)],
+            df_twitter[(df_twitter['timestamp'] < hole_start) | (df_twitter['timestamp'] >= hole_end)]
+        )
+    ))
+    
+    return all(results)
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
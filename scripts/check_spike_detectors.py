@@ -0,0 +1,132 @@
+"""
+스파이크 감지 일관성 검증 스크립트
+
+같은 데이터에 대해 감지 경로별 결과가 같은지 확인합니다.
+- 일괄 감지(detect_all_spikes) == 컬럼별 감지(detect_zscore_spike / detect_moving_average_spike /
+  detect_rate_of_change_spike)
+- 스트리밍 갱신(RealTimeSpikeMonitor.update) == 전체 이력 일괄 감지(check_all_spikes)
+결측이 없는 저장소 데이터와, 모니터링 컬럼에 결측 구간(1시간/5시간)을 넣은 데이터를 모두 검사합니다.
+
+사용법:
+    python scripts/check_spike_detectors.py
+"""
+
+import os
+import sys
+import warnings
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트 (analysis 패키지 import용)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from analysis.spike_detector import RealTimeSpikeMonitor, SpikeDetector
+
+
+MONITOR_COLUMNS = ['message_count', 'ETH_close', 'tx_frequency']
+
+
+def with_gaps(df, seed=0):
+    """
+    모니터링 컬럼에 결측 구간 추가 (미리 계산된 Z-score/이동평균 컬럼은 제거)
+    
+    Returns:
+        DataFrame: 결측이 들어간 복사본
+    """
+    rng = np.random.default_rng(seed)
+    gapped = df.drop(columns=[col for col in df.columns if col.endswith(('_zscore', '_ma24'))])
+    
+    for col in MONITOR_COLUMNS:
+        # 1시간 결측 200개 + 5시간 연속 결측 20개
+        gapped.loc[rng.choice(len(gapped), 200, replace=False), col] = np.nan
+        for start in rng.choice(len(gapped) - 5, 20, replace=False):
+            gapped.loc[start:start + 4, col] = np.nan
+    
+    return gapped
+
+
+def same_spikes(expected, actual):
+    """시각과 크기가 같은 스파이크인지 비교"""
+    if len(expected) != len(actual):
+        return False
+    if expected.empty:
+        return True
+    return (
+        (expected['timestamp'].to_numpy() == actual['timestamp'].to_numpy()).all()
+        and np.allclose(expected['spike_magnitude'].to_numpy(dtype=np.float64),
+                        actual['spike_magnitude'].to_numpy(dtype=np.float64), rtol=1e-6, equal_nan=True)
+    )
+
+
+def check_batch_vs_single(df):
+    """
+    detect_all_spikes와 컬럼별 감지 메서드 비교
+    
+    Returns:
+        list: 결과가 다른 (컬럼, 감지기) 목록
+    """
+    detector = SpikeDetector(df)
+    batch = detector.detect_all_spikes(MONITOR_COLUMNS)
+    grouped = batch.groupby(['spike_column', 'detector'], observed=True)
+    
+    mismatches = []
+    for col in MONITOR_COLUMNS:
+        single = {
+            'zscore': detector.detect_zscore_spike(col),
+            'ma': detector.detect_moving_average_spike(col),
+            'roc': detector.detect_rate_of_change_spike(col),
+        }
+        for name, expected in single.items():
+            actual = grouped.get_group((col, name)) if (col, name) in grouped.groups else batch.iloc[:0]
+            if not same_spikes(expected, actual):
+                mismatches.append(f'{col}_{name} ({len(expected)} vs {len(actual)})')
+    
+    return mismatches
+
+
+def check_streaming_vs_batch(df, new_hours=300):
+    """
+    마지막 new_hours 시간을 update()로 스트리밍한 결과와 전체 일괄 감지 비교
+    
+    Returns:
+        list: 결과가 다른 감지 유형 목록
+    """
+    expected = RealTimeSpikeMonitor(df).check_all_spikes()
+    
+    monitor = RealTimeSpikeMonitor(df.iloc[:-new_hours])
+    monitor.check_all_spikes()
+    monitor.update(df)
+    actual = monitor.check_all_spikes()
+    
+    return [
+        f'{key} ({len(expected.get(key, []))} vs {len(actual.get(key, []))})'
+        for key in sorted(set(expected) | set(actual))
+        if not same_spikes(expected.get(key, pd.DataFrame()), actual.get(key, pd.DataFrame()))
+    ]
+
+
+def main():
+    """검증 실행"""
+    warnings.simplefilter('ignore', category=FutureWarning)
+    
+    df = pd.read_csv(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                  'data', 'processed_data.csv'))
+    df['timestamp'] = pd.to_datetime(df['timestamp'])
+    
+    print("=== 스파이크 감지 일관성 검증 ===\n")
+    
+    passed = True
+    for name, data in [("기본 데이터", df), ("결측 구간 포함", with_gaps(df))]:
+        for check_name, check in [("일괄 vs 컬럼별", check_batch_vs_single),
+                                  ("스트리밍 vs 일괄", check_streaming_vs_batch)]:
+            mismatches = check(data)
+            passed &= not mismatches
+            print(f"{'✅' if not mismatches else '❌'} {name} - {check_name}")
+            for mismatch in mismatches:
+                print(f"   다름: {mismatch}")
+    
+    return passed
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
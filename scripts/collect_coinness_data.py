@@ -2,19 +2,26 @@
 코인니스(Coinness) 뉴스 데이터 수집 스크립트
 
 암호화폐 뉴스 사이트에서 기사 데이터를 수집합니다.
+페이지는 공유 비동기 요청기(AsyncFetcher)로 여러 개씩 동시에 요청하며,
+호스트별 속도 제한과 재시도, 조건부 요청은 요청기가 처리합니다.
 """
 
 import os
-import time
+import sys
+import asyncio
 import random
 from datetime import datetime, timedelta
 import pandas as pd
-import requests
 from bs4 import BeautifulSoup
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
-# 감정 분석기 초기화
-sentiment_analyzer = SentimentIntensityAnalyzer()
+# 프로젝트 루트 (utils 패키지 import용)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.sentiment_store import SentimentStore
+from utils.http_fetcher import AsyncFetcher
+from utils.news_dedup import NewsDedupIndex, NEAR_DUPLICATE_MINUTES
+
+# 감정 분석기 초기화 (이미 분석한 텍스트는 공유 디스크 캐시에서 재사용)
+sentiment_store = SentimentStore()
 
 # User-Agent 리스트 (웹 스크래핑 방지 우회)
 USER_AGENTS = [
@@ -28,14 +35,21 @@ USER_AGENTS = [
 class CoinnessCollector:
     """코인니스 뉴스 수집기"""
     
-    def __init__(self):
-        """초기화"""
-        self.session = requests.Session()
+    def __init__(self, concurrency=4, requests_per_second=0.5):
+        """
+        초기화
+        
+        Args:
+            concurrency: 동시에 요청할 페이지 수
+            requests_per_second: 초당 요청 수 (기존 요청 간 1.5~3.5초 지연과 비슷한 수준)
+        """
         self.base_url = 'https://coinness.com'
+        self.concurrency = concurrency
+        self.requests_per_second = requests_per_second
         self.headers = {
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
-            'Accept-Encoding': 'gzip, deflate, br',
+            'Accept-Encoding': 'gzip, deflate',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
             'Sec-Fetch-Dest': 'document',
@@ -44,56 +58,30 @@ class CoinnessCollector:
             'Cache-Control': 'max-age=0',
         }
         self.retry_count = 3
+        self.cache_path = 'data/.cache/http_coinness.sqlite'
+        self.fetch_stats = {}
         self.news_data = []
     
     def get_random_user_agent(self):
         """랜덤 User-Agent 반환"""
         return random.choice(USER_AGENTS)
     
-    def fetch_page(self, url, page_num=1):
-        """
-        페이지를 가져옵니다.
-        
-        Args:
-            url: 요청할 URL
-            page_num: 페이지 번호
-            
-        Returns:
-            BeautifulSoup 객체 또는 None
-        """
-        for attempt in range(self.retry_count):
-            try:
-                # User-Agent 랜덤 변경
-                self.headers['User-Agent'] = self.get_random_user_agent()
-                
-                # 요청 전 지연 (1.5~3.5초)
-                delay = random.uniform(1.5, 3.5)
-                time.sleep(delay)
-                
-                response = self.session.get(
-                    url,
-                    headers=self.headers,
-                    timeout=15
-                )
-                
-                if response.status_code == 200:
-                    return BeautifulSoup(response.text, 'html.parser')
-                elif response.status_code == 429:
-                    # Rate limiting - 더 긴 지연
-                    wait_time = random.uniform(10, 30)
-                    print(f"  ⚠️  Rate limit 감지. {wait_time:.1f}초 대기 중...")
-                    time.sleep(wait_time)
-                else:
-                    print(f"  ⚠️  페이지 {page_num} 요청 실패: {response.status_code}")
-                    
-            except Exception as e:
-                print(f"  ✗ 페이지 {page_num} 요청 오류 (시도 {attempt + 1}/{self.retry_count}): {e}")
-                
-                if attempt < self.retry_count - 1:
-                    wait_time = random.uniform(3, 8)
-                    time.sleep(wait_time)
-        
-        return None
+    def get_request_headers(self):
+        """요청 헤더 (User-Agent 랜덤 변경)"""
+        headers = dict(self.headers)
+        headers['User-Agent'] = self.get_random_user_agent()
+        return headers
+    
+    def create_fetcher(self):
+        """공유 비동기 요청기 생성"""
+        return AsyncFetcher(
+            max_connections=self.concurrency,
+            per_host_rate=self.requests_per_second,
+            burst=2,
+            max_retries=self.retry_count,
+            headers=self.get_request_headers,
+            cache_path=self.cache_path
+        )
     
     def parse_news_article(self, article_elem):
         """
@@ -139,7 +127,7 @@ class CoinnessCollector:
             
             # 감정 분석 (제목 + 내용)
             text_for_sentiment = f"{title} {content}"
-            sentiment = sentiment_analyzer.polarity_scores(text_for_sentiment)
+            sentiment = sentiment_store.polarity_scores(text_for_sentiment)
             
             return {
                 'timestamp': pub_time,
@@ -199,6 +187,68 @@ class CoinnessCollector:
             print(f"  ⚠️  시간 파싱 오류: time={time_str}, date={date_str} - {e}")
             return now
     
+    async def _collect_pages(self, max_pages, start_date):
+        """
+        페이지를 concurrency개씩 동시에 요청하고 페이지 순서대로 파싱
+        
+        Args:
+            max_pages: 수집할 최대 페이지 수
+            start_date: 이 날짜보다 오래된 기사가 나오면 중단
+        """
+        collected_count = 0
+        
+        async with self.create_fetcher() as fetcher:
+            self.fetch_stats = fetcher.stats
+            
+            for first_page in range(1, max_pages + 1, self.concurrency):
+                pages = list(range(first_page, min(first_page + self.concurrency, max_pages + 1)))
+                print(f"\n페이지 {pages[0]}~{pages[-1]}/{max_pages} 수집 중...")
+                
+                # 페이지 URL 구성 후 동시에 가져오기
+                results = await fetcher.fetch_all([f"{self.base_url}/article?page={page}" for page in pages])
+                
+                for page, result in zip(pages, results):
+                    if result is None:
+                        print(f"  ✗ 페이지 {page} 로딩 실패")
+                        continue
+                    
+                    soup = BeautifulSoup(result.text, 'html.parser')
+                    
+                    # 뉴스 기사 찾기 (코인니스 구조)
+                    # ArticleWrapper 클래스를 가진 a 태그들
+                    articles = soup.find_all('a', class_=lambda x: x and 'ArticleWrapper' in x)
+                    
+                    if not articles:
+                        print(f"  ⚠️  페이지 {page}에서 기사를 찾을 수 없습니다.")
+                        # 첫 페이지에서도 찾지 못하면 중단
+                        if page == 1:
+                            print(f"  💡 HTML 구조 확인이 필요할 수 있습니다.")
+                            return
+                        continue
+                    
+                    page_count = 0
+                    stop_collecting = False
+                    
+                    for article in articles:
+                        news_data = self.parse_news_article(article)
+                        
+                        if news_data:
+                            # 날짜 필터링
+                            if news_data['timestamp'] < start_date:
+                                stop_collecting = True
+                                break
+                            
+                            self.news_data.append(news_data)
+                            page_count += 1
+                            collected_count += 1
+                    
+                    print(f"  ✓ 페이지 {page}에서 {page_count}개 기사 수집 (총 {collected_count}개)")
+                    
+                    # 날짜 범위를 벗어나면 중단
+                    if stop_collecting:
+                        print(f"  ✓ 목표 날짜 범위 도달. 수집 중단.")
+                        return
+    
     def collect_news(self, max_pages=50, start_date=None):
         """
         뉴스를 수집합니다.
@@ -217,54 +267,8 @@ class CoinnessCollector:
         print(f"  수집 기간: {start_date.date()} ~ 현재")
         print(f"  최대 페이지: {max_pages}")
         
-        collected_count = 0
-        
-        for page in range(1, max_pages + 1):
-            print(f"\n페이지 {page}/{max_pages} 수집 중...")
-            
-            # 페이지 URL 구성
-            url = f"{self.base_url}/article?page={page}"
-            
-            # 페이지 가져오기
-            soup = self.fetch_page(url, page)
-            if not soup:
-                print(f"  ✗ 페이지 {page} 로딩 실패")
-                continue
-            
-            # 뉴스 기사 찾기 (코인니스 구조)
-            # ArticleWrapper 클래스를 가진 a 태그들
-            articles = soup.find_all('a', class_=lambda x: x and 'ArticleWrapper' in x)
-            
-            if not articles:
-                print(f"  ⚠️  페이지 {page}에서 기사를 찾을 수 없습니다.")
-                # 첫 페이지에서도 찾지 못하면 중단
-                if page == 1:
-                    print(f"  💡 HTML 구조 확인이 필요할 수 있습니다.")
-                    break
-                continue
-            
-            page_count = 0
-            stop_collecting = False
-            
-            for article in articles:
-                news_data = self.parse_news_article(article)
-                
-                if news_data:
-                    # 날짜 필터링
-                    if news_data['timestamp'] < start_date:
-                        stop_collecting = True
-                        break
-                    
-                    self.news_data.append(news_data)
-                    page_count += 1
-                    collected_count += 1
-            
-            print(f"  ✓ 페이지 {page}에서 {page_count}개 기사 수집 (총 {collected_count}개)")
-            
-            # 날짜 범위를 벗어나면 중단
-            if stop_collecting:
-                print(f"  ✓ 목표 날짜 범위 도달. 수집 중단.")
-                break
+        asyncio.run(self._collect_pages(max_pages, start_date))
+        print(f"\n요청 통계: {self.fetch_stats}")
         
         print(f"\n✓ 총 {len(self.news_data)}개의 뉴스 기사를 수집했습니다.")
         
@@ -287,6 +291,7 @@ def main():
     start_date = datetime(2025, 1, 1)
     max_pages = 100  # 최대 100페이지
     output_file = 'data/coinness_data.csv'
+    near_minutes = NEAR_DUPLICATE_MINUTES if '--near-duplicates' in sys.argv else None
     
     # 수집기 초기화
     collector = CoinnessCollector()
@@ -299,10 +304,12 @@ def main():
         # 데이터 디렉토리 생성
         os.makedirs('data', exist_ok=True)
         
-        # CSV 저장
-        df.to_csv(output_file, index=False, encoding='utf-8-sig')
+        # 이미 저장된 기사는 제외하고 추가 (--near-duplicates: 같은 제목이 NEAR_DUPLICATE_MINUTES분 안에 있어도 중복)
+        dedup_index = NewsDedupIndex(output_file, near_minutes=near_minutes)
+        added = dedup_index.append(df)
+        dedup_index.close()
         print(f"\n✅ 데이터 저장 완료: {output_file}")
-        print(f"   총 {len(df)}개 뉴스 기사")
+        print(f"   총 {len(df)}개 뉴스 기사 (새 기사 {len(added)}개, 중복 {len(df) - len(added)}개 제외)")
         print(f"   기간: {df['timestamp'].min()} ~ {df['timestamp'].max()}")
         
         # 통계 출력
@@ -2,6 +2,9 @@
 코인니스 뉴스 수집 (무한 스크롤 방식)
 
 무한 스크롤로 구현된 코인니스에서 데이터를 수집합니다.
+- '더보기' 클릭마다 새로 추가된 기사 노드만 가져와 파싱 (클릭당 파싱량 일정)
+- 파싱은 프로세스 풀에서 실행되어 다음 클릭의 로딩 대기와 겹침
+- 수집 진행은 체크포인트에 기록되어 중단 후 다시 실행하면 이어서 수집
 """
 
 import os
@@ -15,11 +18,21 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-import re
 
-sentiment_analyzer = SentimentIntensityAnalyzer()
+# 프로젝트 루트 (utils 패키지 import용)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.sentiment_store import SentimentStore
+from utils.news_dedup import NewsDedupIndex, NEAR_DUPLICATE_MINUTES
+from utils.coinness_parser import (
+    ARTICLE_SELECTOR, COUNT_ARTICLES_JS, NEW_ARTICLES_JS,
+    ArticleParserPool, ArticleCheckpoint
+)
+
+# 감정 분석기 초기화 (이미 분석한 텍스트는 공유 디스크 캐시에서 재사용)
+sentiment_store = SentimentStore()
+
+# 수집 진행 체크포인트
+CHECKPOINT_PATH = 'data/.cache/coinness_infinite_scroll'
 
 
 def find_chromedriver():
@@ -35,81 +48,39 @@ def find_chromedriver():
     return None
 
 
-def parse_time_with_date(time_str, date_str):
-    """시간 파싱"""
-    now = datetime.now()
-    try:
-        if '년' in date_str and '월' in date_str and '일' in date_str:
-            numbers = re.findall(r'\d+', date_str)
-            if len(numbers) >= 3:
-                year = int(numbers[0])
-                month = int(numbers[1])
-                day = int(numbers[2])
-                
-                if ':' in time_str:
-                    time_parts = time_str.split(':')
-                    hour = int(time_parts[0])
-                    minute = int(time_parts[1]) if len(time_parts) > 1 else 0
-                else:
-                    hour = 0
-                    minute = 0
-                
-                return datetime(year, month, day, hour, minute)
-        return now
-    except:
-        return now
+def add_sentiment(articles):
+    """파싱된 기사에 감정 점수 추가 (공유 캐시 사용)"""
+    for article in articles:
+        sentiment = sentiment_store.polarity_scores(f"{article['title']} {article['content']}")
+        article['sentiment_compound'] = sentiment['compound']
+        article['sentiment_positive'] = sentiment['pos']
+        article['sentiment_negative'] = sentiment['neg']
+        article['sentiment_neutral'] = sentiment['neu']
+    return articles
 
 
-def parse_articles(html):
-    """HTML에서 기사 파싱"""
-    soup = BeautifulSoup(html, 'html.parser')
-    articles_data = []
-    
-    articles = soup.find_all('a', class_=lambda x: x and 'ArticleWrapper' in x)
+def find_more_button(driver):
+    """'더보기' 버튼 찾기 (여러 방법 시도)"""
+    # 방법 1: 클래스 이름으로 찾기
+    try:
+        return driver.find_element(By.CLASS_NAME, "ButtonWrapper-sc-w6h248-0")
+    except:
+        pass
     
-    for article in articles:
-        try:
-            link = article.get('href', '')
-            
-            title_elem = article.find('h3', class_=lambda x: x and 'ArticleTitle' in x)
-            if not title_elem:
-                continue
-            title = title_elem.get_text(strip=True)
-            
-            time_wrap = article.find('div', class_=lambda x: x and 'TimeWrap' in x)
-            if time_wrap:
-                time_badge = time_wrap.find('span', class_='time-badge')
-                time_str = time_badge.get_text(strip=True) if time_badge else ''
-                date_text = time_wrap.get_text(strip=True).replace(time_str, '').strip()
-            else:
-                time_str = ''
-                date_text = ''
-            
-            pub_time = parse_time_with_date(time_str, date_text)
-            
-            content_elem = article.find('p', class_=lambda x: x and 'ArticleDesc' in x)
-            content = content_elem.get_text(strip=True) if content_elem else ''
-            
-            text = f"{title} {content}"
-            sentiment = sentiment_analyzer.polarity_scores(text)
-            
-            articles_data.append({
-                'timestamp': pub_time,
-                'title': title,
-                'content': content,
-                'link': link,
-                'sentiment_compound': sentiment['compound'],
-                'sentiment_positive': sentiment['pos'],
-                'sentiment_negative': sentiment['neg'],
-                'sentiment_neutral': sentiment['neu'],
-            })
-        except:
-            continue
+    # 방법 2: 버튼 텍스트로 찾기
+    try:
+        return driver.find_element(By.XPATH, "//button[contains(text(), '더보기')]")
+    except:
+        pass
     
-    return articles_data
+    # 방법 3: CSS 선택자
+    try:
+        return driver.find_element(By.CSS_SELECTOR, "button.ButtonWrapper-sc-w6h248-0")
+    except:
+        return None
 
 
-def collect_with_infinite_scroll(chromedriver_path, start_date, max_articles=20000):
+def collect_with_infinite_scroll(chromedriver_path, start_date, max_articles=20000, max_workers=2):
     """
     무한 스크롤로 뉴스 수집
     
@@ -117,11 +88,21 @@ def collect_with_infinite_scroll(chromedriver_path, start_date, max_articles=200
         chromedriver_path: ChromeDriver 경로
         start_date: 수집 시작 날짜
         max_articles: 최대 수집 기사 수 (안전장치)
+        max_workers: 파싱 워커 프로세스 수
     """
     print(f"ChromeDriver: {chromedriver_path}")
     print(f"수집 목표: {start_date.date()} ~ 현재")
     print(f"최대 기사 수: {max_articles:,}개\n")
     
+    # 이전 체크포인트 (있으면 이어서 수집)
+    checkpoint = ArticleCheckpoint(CHECKPOINT_PATH)
+    state, all_articles = checkpoint.load()
+    seen_articles = {(article['title'], article['timestamp']) for article in all_articles}  # 중복 체크
+    nodes_parsed = state.get('nodes_parsed', 0)
+    
+    if state:
+        print(f"♻️  체크포인트에서 재개: 기사 {len(all_articles):,}개, 노드 {nodes_parsed:,}개까지 파싱됨\n")
+    
     # Chrome 설정
     chrome_options = Options()
     chrome_options.add_argument('--headless=new')
@@ -137,9 +118,6 @@ def collect_with_infinite_scroll(chromedriver_path, start_date, max_articles=200
     service = Service(executable_path=chromedriver_path)
     driver = webdriver.Chrome(service=service, options=chrome_options)
     
-    all_articles = []
-    seen_articles = set()  # 중복 체크
-    
     try:
         print("📱 코인니스 접속 중...")
         driver.get('https://coinness.com/article')
@@ -157,123 +135,117 @@ def collect_with_infinite_scroll(chromedriver_path, start_date, max_articles=200
         click_count = 0
         button_not_found_count = 0
         
-        while True:
-            click_count += 1
-            
-            # 현재 HTML 파싱
-            html = driver.page_source
-            articles = parse_articles(html)
-            
-            # 새로운 기사만 추가
-            new_count = 0
-            stop_collecting = False
-            
-            for article in articles:
-                article_key = (article['title'], article['timestamp'])
+        with ArticleParserPool(max_workers=max_workers) as pool:
+            while True:
+                click_count += 1
                 
-                # 날짜 체크
-                if article['timestamp'] < start_date:
-                    stop_collecting = True
-                    break
+                # 새로 추가된 기사 노드만 가져와 파싱 요청 (체크포인트 위치까지는 건너뜀)
+                futures = []
+                total_nodes = driver.execute_script(COUNT_ARTICLES_JS, ARTICLE_SELECTOR)
+                fast_forward = total_nodes <= nodes_parsed
                 
-                # 중복 체크
-                if article_key not in seen_articles:
-                    seen_articles.add(article_key)
-                    all_articles.append(article)
-                    new_count += 1
-            
-            total_collected = len(all_articles)
-            total_duplicates = len(seen_articles) - total_collected
-            
-            print(f"클릭 {click_count:3d}: 신규 {new_count:3d}개 | "
-                  f"총 {total_collected:5d}개 | 중복 {total_duplicates:5d}개", end='')
-            
-            # 종료 조건
-            if stop_collecting:
-                print(f" → ✓ 목표 날짜 도달!")
-                break
-            
-            if total_collected >= max_articles:
-                print(f" → ✓ 최대 기사 수 도달!")
-                break
-            
-            if new_count == 0:
-                no_new_articles_count += 1
-                print(f" → ⚠️  신규 없음 ({no_new_articles_count}/5)")
-                
-                if no_new_articles_count >= 5:
-                    print(f"\n⚠️  5번 연속 신규 기사 없음. 종료.")
-                    break
-            else:
-                no_new_articles_count = 0
-                print()
-            
-            # "더보기" 버튼 찾기 및 클릭
-            try:
-                # 버튼 찾기 (여러 방법 시도)
-                more_button = None
+                if not fast_forward:
+                    fragments = driver.execute_script(NEW_ARTICLES_JS, ARTICLE_SELECTOR, nodes_parsed)
+                    nodes_parsed += len(fragments)
+                    futures = pool.submit(fragments)
                 
-                # 방법 1: 클래스 이름으로 찾기
+                # "더보기" 클릭 (파싱은 워커에서 진행)
+                clicked = False
                 try:
-                    more_button = driver.find_element(By.CLASS_NAME, "ButtonWrapper-sc-w6h248-0")
-                except:
-                    pass
+                    more_button = find_more_button(driver)
+                    
+                    if more_button and more_button.is_displayed():
+                        # 버튼이 보이는 위치로 스크롤 후 클릭
+                        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", more_button)
+                        time.sleep(0.5)
+                        more_button.click()
+                        clicked = True
+                        button_not_found_count = 0
+                    else:
+                        button_not_found_count += 1
+                        
+                except Exception as e:
+                    button_not_found_count += 1
+                    print(f"   ❌ 버튼 클릭 오류: {e}")
+                
+                # 체크포인트 위치까지 이동 중이면 파싱 없이 계속 클릭
+                if fast_forward and clicked:
+                    if click_count % 10 == 0:
+                        print(f"클릭 {click_count:3d}: 체크포인트 위치로 이동 중 ({total_nodes:,}/{nodes_parsed:,}개 노드)")
+                    time.sleep(2)
+                    continue
                 
-                # 방법 2: 버튼 텍스트로 찾기
-                if not more_button:
-                    try:
-                        more_button = driver.find_element(By.XPATH, "//button[contains(text(), '더보기')]")
-                    except:
-                        pass
+                # 파싱 결과 처리
+                articles = add_sentiment(ArticleParserPool.collect(futures))
                 
-                # 방법 3: CSS 선택자
-                if not more_button:
-                    try:
-                        more_button = driver.find_element(By.CSS_SELECTOR, "button.ButtonWrapper-sc-w6h248-0")
-                    except:
-                        pass
+                new_articles = []
+                stop_collecting = False
                 
-                if more_button and more_button.is_displayed():
-                    # 버튼이 보이는 위치로 스크롤
-                    driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", more_button)
-                    time.sleep(0.5)
+                for article in articles:
+                    article_key = (article['title'], article['timestamp'])
                     
-                    # 클릭
-                    more_button.click()
-                    button_not_found_count = 0
+                    # 날짜 체크
+                    if article['timestamp'] < start_date:
+                        stop_collecting = True
+                        break
                     
-                    # 로딩 대기
-                    time.sleep(2 + (click_count % 3))
+                    # 중복 체크
+                    if article_key not in seen_articles:
+                        seen_articles.add(article_key)
+                        new_articles.append(article)
+                
+                all_articles.extend(new_articles)
+                checkpoint.save(new_articles, nodes_parsed=nodes_parsed, click_count=click_count)
+                
+                new_count = len(new_articles)
+                total_collected = len(all_articles)
+                
+                print(f"클릭 {click_count:3d}: 신규 {new_count:3d}개 | "
+                      f"총 {total_collected:5d}개 | 파싱 노드 {nodes_parsed:5d}개", end='')
+                
+                # 종료 조건
+                if stop_collecting:
+                    print(f" → ✓ 목표 날짜 도달!")
+                    break
+                
+                if total_collected >= max_articles:
+                    print(f" → ✓ 최대 기사 수 도달!")
+                    break
+                
+                if new_count == 0:
+                    no_new_articles_count += 1
+                    print(f" → ⚠️  신규 없음 ({no_new_articles_count}/5)")
                     
-                    # 10번마다 휴식
-                    if click_count % 10 == 0:
-                        print(f"   💤 휴식 (5초)...")
-                        time.sleep(5)
+                    if no_new_articles_count >= 5:
+                        print(f"\n⚠️  5번 연속 신규 기사 없음. 종료.")
+                        break
                 else:
-                    button_not_found_count += 1
-                    print(f" → ⚠️  '더보기' 버튼 없음 ({button_not_found_count}/3)")
+                    no_new_articles_count = 0
+                    print()
+                
+                if not clicked:
+                    print(f"   ⚠️  '더보기' 버튼 없음 ({button_not_found_count}/3)")
                     
                     if button_not_found_count >= 3:
                         print(f"\n⚠️  '더보기' 버튼을 찾을 수 없음. 종료.")
                         break
                     
                     time.sleep(2)
-                    
-            except Exception as e:
-                button_not_found_count += 1
-                print(f" → ❌ 버튼 클릭 오류: {e}")
+                    continue
                 
-                if button_not_found_count >= 3:
-                    print(f"\n⚠️  버튼 클릭 실패 3회. 종료.")
-                    break
+                # 로딩 대기
+                time.sleep(2 + (click_count % 3))
                 
-                time.sleep(2)
+                # 10번마다 휴식
+                if click_count % 10 == 0:
+                    print(f"   💤 휴식 (5초)...")
+                    time.sleep(5)
         
         print(f"\n{'='*70}")
         print(f"수집 완료!")
         print(f"총 클릭: {click_count}회")
         print(f"총 기사: {len(all_articles):,}개")
-        print(f"중복 제외: {len(seen_articles) - len(all_articles):,}개")
+        print(f"파싱한 노드: {nodes_parsed:,}개")
         print('='*70)
         
     finally:
@@ -300,6 +272,7 @@ def main():
     
     # 수집
     start_date = datetime(2025, 1, 1)
+    near_minutes = NEAR_DUPLICATE_MINUTES if '--near-duplicates' in sys.argv else None
     articles = collect_with_infinite_scroll(
         chromedriver_path=chromedriver_path,
         start_date=start_date,
@@ -313,10 +286,16 @@ def main():
         
         os.makedirs('data', exist_ok=True)
         output_file = 'data/coinness_data2.csv'
-        df.to_csv(output_file, index=False, encoding='utf-8-sig')
+        # 이미 저장된 기사는 제외하고 추가 (--near-duplicates: 같은 제목이 NEAR_DUPLICATE_MINUTES분 안에 있어도 중복)
+        dedup_index = NewsDedupIndex(output_file, near_minutes=near_minutes)
+        added = dedup_index.append(df)
+        dedup_index.close()
+        
+        # 저장까지 끝났으면 체크포인트 삭제
+        ArticleCheckpoint(CHECKPOINT_PATH).clear()
         
         print(f"\n✅ 저장: {output_file}")
-        print(f"   총 {len(df):,}개 기사")
+        print(f"   총 {len(df):,}개 기사 (새 기사 {len(added):,}개, 중복 {len(df) - len(added):,}개 제외)")
         print(f"   기간: {df['timestamp'].min()} ~ {df['timestamp'].max()}")
         
         # 월별 통계
@@ -17,11 +17,15 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from bs4 import BeautifulSoup
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 import re
 
-# 감정 분석기
-sentiment_analyzer = SentimentIntensityAnalyzer()
+# 프로젝트 루트 (utils 패키지 import용)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.sentiment_store import SentimentStore
+from utils.news_dedup import NewsDedupIndex, NEAR_DUPLICATE_MINUTES
+
+# 감정 분석기 초기화 (이미 분석한 텍스트는 공유 디스크 캐시에서 재사용)
+sentiment_store = SentimentStore()
 
 
 def find_chromedriver():
@@ -166,7 +170,7 @@ class CoinnessCollector:
                 content = content_elem.get_text(strip=True) if content_elem else ''
                 
                 text = f"{title} {content}"
-                sentiment = sentiment_analyzer.polarity_scores(text)
+                sentiment = sentiment_store.polarity_scores(text)
                 
                 articles_data.append({
                     'timestamp': pub_time,
@@ -306,6 +310,8 @@ def main():
         print("  xattr -d com.apple.quarantine /opt/homebrew/bin/chromedriver")
         return
     
+    near_minutes = NEAR_DUPLICATE_MINUTES if '--near-duplicates' in sys.argv else None
+    
     # 수집 (2025년 전체 커버, 자동 중단 기능 있음)
     collector = CoinnessCollector(chromedriver_path=chromedriver_path, headless=True)
     df = collector.collect_news(max_pages=2000, start_date=datetime(2025, 1, 1))
@@ -314,10 +320,13 @@ def main():
     if not df.empty:
         os.makedirs('data', exist_ok=True)
         output_file = 'data/coinness_data.csv'
-        df.to_csv(output_file, index=False, encoding='utf-8-sig')
+        # 이미 저장된 기사는 제외하고 추가 (--near-duplicates: 같은 제목이 NEAR_DUPLICATE_MINUTES분 안에 있어도 중복)
+        dedup_index = NewsDedupIndex(output_file, near_minutes=near_minutes)
+        added = dedup_index.append(df)
+        dedup_index.close()
         
         print(f"✅ 저장 완료: {output_file}")
-        print(f"   총 {len(df)}개 기사")
+        print(f"   총 {len(df)}개 기사 (새 기사 {len(added)}개, 중복 {len(df) - len(added)}개 제외)")
         print(f"   기간: {df['timestamp'].min()} ~ {df['timestamp'].max()}")
         print(f"\n📊 감정 분석:")
         print(f"   평균: {df['sentiment_compound'].mean():.3f}")
@@ -2,9 +2,12 @@
 코인니스(Coinness) 뉴스 데이터 수집 스크립트 (Selenium 버전)
 
 JavaScript로 렌더링되는 React 기반 사이트를 Selenium으로 수집합니다.
+- 페이지 전체 HTML 대신 기사 노드만 가져와 프로세스 풀에서 파싱 (다음 페이지 로딩과 겹침)
+- 페이지마다 체크포인트를 기록하여 중단 후 다시 실행하면 다음 페이지부터 이어서 수집
 """
 
 import os
+import sys
 import time
 import random
 from datetime import datetime, timedelta
@@ -14,27 +17,34 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-import re
 
-# 감정 분석기 초기화
-sentiment_analyzer = SentimentIntensityAnalyzer()
+# 프로젝트 루트 (utils 패키지 import용)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.sentiment_store import SentimentStore
+from utils.coinness_parser import ARTICLE_SELECTOR, NEW_ARTICLES_JS, ArticleParserPool, ArticleCheckpoint
+from utils.news_dedup import NewsDedupIndex, NEAR_DUPLICATE_MINUTES
+
+# 감정 분석기 초기화 (이미 분석한 텍스트는 공유 디스크 캐시에서 재사용)
+sentiment_store = SentimentStore()
 
 
 class CoinnessSeleniumCollector:
     """Selenium을 사용한 코인니스 뉴스 수집기"""
     
-    def __init__(self, headless=True):
+    def __init__(self, headless=True, max_workers=2, checkpoint_path='data/.cache/coinness_selenium'):
         """
         초기화
         
         Args:
             headless: 브라우저를 숨김 모드로 실행할지 여부
+            max_workers: 기사 파싱 워커 프로세스 수
+            checkpoint_path: 수집 진행 체크포인트 경로 (확장자 제외)
         """
         self.base_url = 'https://coinness.com'
         self.driver = None
         self.headless = headless
+        self.max_workers = max_workers
+        self.checkpoint = ArticleCheckpoint(checkpoint_path)
         self.news_data = []
         
     def setup_driver(self):
@@ -119,110 +129,48 @@ class CoinnessSeleniumCollector:
             
             last_height = new_height
     
-    def parse_time_with_date(self, time_str, date_str):
+    def add_sentiment(self, articles):
         """
-        시간과 날짜 문자열을 datetime으로 변환
+        파싱된 기사에 감정 점수 추가 (공유 캐시 사용)
         
         Args:
-            time_str: 시간 문자열 (예: "13:30")
-            date_str: 날짜 문자열 (예: "2025년 11월 30일 일요일")
+            articles: parse_article_fragments 결과
             
         Returns:
-            datetime: 파싱된 시간
+            list: 감정 점수가 추가된 기사 리스트
         """
-        now = datetime.now()
-        
-        try:
-            # 날짜 파싱
-            if '년' in date_str and '월' in date_str and '일' in date_str:
-                numbers = re.findall(r'\d+', date_str)
-                
-                if len(numbers) >= 3:
-                    year = int(numbers[0])
-                    month = int(numbers[1])
-                    day = int(numbers[2])
-                    
-                    # 시간 파싱
-                    if ':' in time_str:
-                        time_parts = time_str.split(':')
-                        hour = int(time_parts[0])
-                        minute = int(time_parts[1]) if len(time_parts) > 1 else 0
-                    else:
-                        hour = 0
-                        minute = 0
-                    
-                    return datetime(year, month, day, hour, minute)
-            
-            return now
-                
-        except Exception as e:
-            print(f"  ⚠️  시간 파싱 오류: time={time_str}, date={date_str} - {e}")
-            return now
+        for article in articles:
+            sentiment = sentiment_store.polarity_scores(f"{article['title']} {article['content']}")
+            article['sentiment_compound'] = sentiment['compound']
+            article['sentiment_positive'] = sentiment['pos']
+            article['sentiment_negative'] = sentiment['neg']
+            article['sentiment_neutral'] = sentiment['neu']
+        return articles
     
-    def parse_news_articles(self, html_content):
+    def load_page(self, page):
         """
-        HTML에서 뉴스 기사 파싱
+        페이지를 로드하고 기사 노드 outerHTML만 가져옴
         
-        Args:
-            html_content: HTML 문자열
-            
         Returns:
-            list: 파싱된 뉴스 데이터 리스트
+            list: 기사 노드 outerHTML 리스트
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
-        articles_data = []
+        # 페이지 로드
+        self.driver.get(f"{self.base_url}/article?page={page}")
         
-        # ArticleWrapper 클래스를 가진 a 태그 찾기
-        articles = soup.find_all('a', class_=lambda x: x and 'ArticleWrapper' in x)
+        # 페이지 로딩 대기 (ArticleWrapper가 나타날 때까지)
+        wait = WebDriverWait(self.driver, 15)
+        wait.until(
+            EC.presence_of_element_located((By.CLASS_NAME, "ArticleWrapper-sc-42qvi5-0"))
+        )
         
-        for article in articles:
-            try:
-                # 링크
-                link = article.get('href', '')
-                
-                # 제목
-                title_elem = article.find('h3', class_=lambda x: x and 'ArticleTitle' in x)
-                if not title_elem:
-                    continue
-                title = title_elem.get_text(strip=True)
-                
-                # 시간 정보
-                time_wrap = article.find('div', class_=lambda x: x and 'TimeWrap' in x)
-                if time_wrap:
-                    time_badge = time_wrap.find('span', class_='time-badge')
-                    time_str = time_badge.get_text(strip=True) if time_badge else ''
-                    date_text = time_wrap.get_text(strip=True).replace(time_str, '').strip()
-                else:
-                    time_str = ''
-                    date_text = ''
-                
-                # 시간 파싱
-                pub_time = self.parse_time_with_date(time_str, date_text)
-                
-                # 내용 미리보기
-                content_elem = article.find('p', class_=lambda x: x and 'ArticleDesc' in x)
-                content = content_elem.get_text(strip=True) if content_elem else ''
-                
-                # 감정 분석
-                text_for_sentiment = f"{title} {content}"
-                sentiment = sentiment_analyzer.polarity_scores(text_for_sentiment)
-                
-                articles_data.append({
-                    'timestamp': pub_time,
-                    'title': title,
-                    'content': content,
-                    'link': link,
-                    'sentiment_compound': sentiment['compound'],
-                    'sentiment_positive': sentiment['pos'],
-                    'sentiment_negative': sentiment['neg'],
-                    'sentiment_neutral': sentiment['neu'],
-                })
-                
-            except Exception as e:
-                print(f"  ⚠️  기사 파싱 오류: {e}")
-                continue
+        # 스크롤하여 동적 콘텐츠 로딩
+        self.scroll_page(scroll_pause_time=1.5)
         
-        return articles_data
+        # 랜덤 지연 (1~3초)
+        time.sleep(random.uniform(1, 3))
+        
+        # 전체 page_source 대신 기사 노드만
+        return self.driver.execute_script(NEW_ARTICLES_JS, ARTICLE_SELECTOR, 0)
     
     def collect_news(self, max_pages=50, start_date=None):
         """
@@ -242,70 +190,38 @@ class CoinnessSeleniumCollector:
         print(f"  수집 기간: {start_date.date()} ~ 현재")
         print(f"  최대 페이지: {max_pages}")
         
+        # 이전 체크포인트 (있으면 다음 페이지부터 이어서 수집)
+        state, self.news_data = self.checkpoint.load()
+        first_page = state.get('page', 0) + 1
+        if state:
+            print(f"  ♻️  체크포인트에서 재개: 기사 {len(self.news_data)}개, 페이지 {first_page}부터")
+        
         # WebDriver 설정
         self.setup_driver()
         
         try:
-            collected_count = 0
+            # 직전 페이지의 파싱 작업 (다음 페이지를 로드하는 동안 워커에서 파싱)
+            pending = None
             
-            for page in range(1, max_pages + 1):
-                print(f"\n페이지 {page}/{max_pages} 수집 중...")
-                
-                # 페이지 URL
-                url = f"{self.base_url}/article?page={page}"
-                
-                try:
-                    # 페이지 로드
-                    self.driver.get(url)
-                    
-                    # 페이지 로딩 대기 (ArticleWrapper가 나타날 때까지)
-                    wait = WebDriverWait(self.driver, 15)
-                    wait.until(
-                        EC.presence_of_element_located((By.CLASS_NAME, "ArticleWrapper-sc-42qvi5-0"))
-                    )
-                    
-                    # 스크롤하여 동적 콘텐츠 로딩
-                    self.scroll_page(scroll_pause_time=1.5)
+            with ArticleParserPool(max_workers=self.max_workers) as pool:
+                for page in range(first_page, max_pages + 2):
+                    futures = None
                     
-                    # 랜덤 지연 (1~3초)
-                    time.sleep(random.uniform(1, 3))
+                    if page <= max_pages:
+                        print(f"\n페이지 {page}/{max_pages} 수집 중...")
+                        try:
+                            futures = pool.submit(self.load_page(page))
+                        except Exception as e:
+                            print(f"  ✗ 페이지 {page} 처리 오류: {e}")
                     
-                    # HTML 가져오기
-                    html_content = self.driver.page_source
-                    
-                    # 기사 파싱
-                    articles = self.parse_news_articles(html_content)
-                    
-                    if not articles:
-                        print(f"  ⚠️  페이지 {page}에서 기사를 찾을 수 없습니다.")
-                        if page == 1:
-                            print(f"  💡 첫 페이지에서 기사를 찾지 못했습니다. 중단합니다.")
-                            break
-                        continue
-                    
-                    # 날짜 필터링 및 저장
-                    page_count = 0
-                    stop_collecting = False
-                    
-                    for article in articles:
-                        if article['timestamp'] < start_date:
-                            stop_collecting = True
-                            break
+                    if pending is not None:
+                        done_page, done_futures = pending
+                        status = self.process_page(done_page, done_futures, start_date)
                         
-                        self.news_data.append(article)
-                        page_count += 1
-                        collected_count += 1
-                    
-                    print(f"  ✓ 페이지 {page}에서 {page_count}개 기사 수집 (총 {collected_count}개)")
-                    
-                    # 날짜 범위를 벗어나면 중단
-                    if stop_collecting:
-                        print(f"  ✓ 목표 날짜 범위 도달. 수집 중단.")
-                        break
+                        if status == 'stop':
+                            break
                     
-                except Exception as e:
-                    print(f"  ✗ 페이지 {page} 처리 오류: {e}")
-                    continue
+                    pending = (page, futures) if futures is not None else None
             
             print(f"\n✓ 총 {len(self.news_data)}개의 뉴스 기사를 수집했습니다.")
             
@@ -319,6 +235,46 @@ class CoinnessSeleniumCollector:
         finally:
             # WebDriver 종료
             self.close_driver()
+    
+    def process_page(self, page, futures, start_date):
+        """
+        한 페이지의 파싱 결과를 날짜 필터링 후 저장하고 체크포인트 기록
+        
+        Returns:
+            str: 'stop' (수집 중단) 또는 'continue'
+        """
+        articles = self.add_sentiment(ArticleParserPool.collect(futures))
+        
+        if not articles:
+            print(f"  ⚠️  페이지 {page}에서 기사를 찾을 수 없습니다.")
+            if page == 1:
+                print(f"  💡 첫 페이지에서 기사를 찾지 못했습니다. 중단합니다.")
+                return 'stop'
+            self.checkpoint.save([], page=page)
+            return 'continue'
+        
+        # 날짜 필터링 및 저장
+        page_articles = []
+        stop_collecting = False
+        
+        for article in articles:
+            if article['timestamp'] < start_date:
+                stop_collecting = True
+                break
+            
+            page_articles.append(article)
+        
+        self.news_data.extend(page_articles)
+        self.checkpoint.save(page_articles, page=page)
+        
+        print(f"  ✓ 페이지 {page}에서 {len(page_articles)}개 기사 수집 (총 {len(self.news_data)}개)")
+        
+        # 날짜 범위를 벗어나면 중단
+        if stop_collecting:
+            print(f"  ✓ 목표 날짜 범위 도달. 수집 중단.")
+            return 'stop'
+        
+        return 'continue'
 
 
 def main():
@@ -331,6 +287,7 @@ def main():
     start_date = datetime(2025, 1, 1)
     max_pages = 100
     output_file = 'data/coinness_data.csv'
+    near_minutes = NEAR_DUPLICATE_MINUTES if '--near-duplicates' in sys.argv else None
     
     # 수집기 초기화 (headless=True: 브라우저 숨김)
     collector = CoinnessSeleniumCollector(headless=True)
@@ -343,10 +300,16 @@ def main():
         # 데이터 디렉토리 생성
         os.makedirs('data', exist_ok=True)
         
-        # CSV 저장
-        df.to_csv(output_file, index=False, encoding='utf-8-sig')
+        # 이미 저장된 기사는 제외하고 추가 (--near-duplicates: 같은 제목이 NEAR_DUPLICATE_MINUTES분 안에 있어도 중복)
+        dedup_index = NewsDedupIndex(output_file, near_minutes=near_minutes)
+        added = dedup_index.append(df)
+        dedup_index.close()
+        
+        # 저장까지 끝났으면 체크포인트 삭제
+        collector.checkpoint.clear()
+        
         print(f"\n✅ 데이터 저장 완료: {output_file}")
-        print(f"   총 {len(df)}개 뉴스 기사")
+        print(f"   총 {len(df)}개 뉴스 기사 (새 기사 {len(added)}개, 중복 {len(df) - len(added)}개 제외)")
         print(f"   기간: {df['timestamp'].min()} ~ {df['timestamp'].max()}")
         
         # 통계 출력
@@ -9,25 +9,38 @@
 - 감정 분석
 """
 
-import requests
+import os
+import sys
+import asyncio
 from bs4 import BeautifulSoup
 import pandas as pd
 from datetime import datetime, timedelta
-import time
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 import re
 import random
 
-# 감정 분석기 초기화
-sentiment_analyzer = SentimentIntensityAnalyzer()
+# 프로젝트 루트 (utils 패키지 import용)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.sentiment_store import SentimentStore
+from utils.http_fetcher import AsyncFetcher
+
+# 감정 분석기 초기화 (이미 분석한 텍스트는 공유 디스크 캐시에서 재사용)
+sentiment_store = SentimentStore()
 
 
 class CoinpanScraper:
     """코인판 데이터 수집기 (Rate Limiting 우회)"""
     
-    def __init__(self):
-        """초기화"""
+    def __init__(self, concurrency=4, requests_per_second=0.5):
+        """
+        초기화
+        
+        Args:
+            concurrency: 동시에 요청할 페이지 수
+            requests_per_second: 초당 요청 수 (기존 요청 간 1.5~3.5초 지연과 비슷한 수준)
+        """
         self.base_url = "https://www.coinpan.com"
+        self.concurrency = concurrency
+        self.requests_per_second = requests_per_second
         
         # User-Agent 로테이션 (다양한 브라우저로 위장)
         self.user_agents = [
@@ -38,8 +51,8 @@ class CoinpanScraper:
             'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
         ]
         
-        # 세션 사용 (쿠키 유지)
-        self.session = requests.Session()
+        # 조건부 요청용 ETag/Last-Modified 저장 파일
+        self.cache_path = 'data/.cache/http_coinpan.sqlite'
         
     def _get_headers(self):
         """랜덤 헤더 생성"""
@@ -47,7 +60,7 @@ class CoinpanScraper:
             'User-Agent': random.choice(self.user_agents),
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
-            'Accept-Encoding': 'gzip, deflate, br',
+            'Accept-Encoding': 'gzip, deflate',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
             'Sec-Fetch-Dest': 'document',
@@ -58,7 +71,7 @@ class CoinpanScraper:
         
     def get_board_posts(self, board='free', pages=50):
         """
-        게시판의 게시글 목록 가져오기 (Rate Limiting 우회)
+        게시판의 게시글 목록 가져오기 (여러 페이지 동시 요청, 호스트별 속도 제한)
         
         Args:
             board: 게시판 이름 (free, coin, humor 등)
@@ -67,85 +80,64 @@ class CoinpanScraper:
         Returns:
             list: 게시글 정보 리스트
         """
+        return asyncio.run(self._get_board_posts(board, pages))
+    
+    async def _get_board_posts(self, board, pages):
+        """페이지를 concurrency개씩 동시에 요청하고 페이지 순서대로 파싱"""
         posts = []
         retry_count = 0
-        max_retries = 3
         
         print(f"코인판 {board} 게시판에서 {pages}페이지 수집 중...")
         
-        for page in range(1, pages + 1):
-            success = False
-            
-            for attempt in range(max_retries):
-                try:
-                    # 랜덤 지연 시간 (1~3초)
-                    delay = random.uniform(1.5, 3.5)
-                    time.sleep(delay)
-                    
-                    # URL 구성
-                    url = f"{self.base_url}/{board}?page={page}"
-                    
-                    # 랜덤 헤더 사용
-                    headers = self._get_headers()
-                    
-                    # 요청
-                    response = self.session.get(url, headers=headers, timeout=15)
-                    
-                    # 성공
-                    if response.status_code == 200:
-                        soup = BeautifulSoup(response.content, 'html.parser')
-                        
-                        # 게시글 목록 파싱 (코인판 실제 구조)
-                        # <tbody> 안의 <tr> 중 공지가 아닌 것들
-                        tbody = soup.find('tbody')
-                        if tbody:
-                            # bg1, bg2 클래스를 가진 tr (일반 게시글)
-                            articles = tbody.find_all('tr', class_=['bg1', 'bg2'])
-                        else:
-                            articles = []
-                        
-                        for article in articles:
-                            try:
-                                post_data = self._parse_post(article, board)
-                                if post_data:
-                                    posts.append(post_data)
-                            except Exception as e:
-                                continue
-                        
-                        print(f"  ✓ 페이지 {page}/{pages} 완료 (총 {len(posts)}개 게시글)")
-                        success = True
-                        break
-                    
-                    # Rate Limiting (429)
-                    elif response.status_code == 429:
-                        wait_time = (attempt + 1) * 10  # 10초, 20초, 30초
-                        print(f"  ⚠ Rate Limit 감지. {wait_time}초 대기 후 재시도...")
-                        time.sleep(wait_time)
+        fetcher = AsyncFetcher(
+            max_connections=self.concurrency,
+            per_host_rate=self.requests_per_second,
+            burst=2,
+            max_retries=3,
+            headers=self._get_headers,
+            cache_path=self.cache_path
+        )
+        
+        async with fetcher:
+            for first_page in range(1, pages + 1, self.concurrency):
+                page_numbers = list(range(first_page, min(first_page + self.concurrency, pages + 1)))
+                
+                # URL 구성 후 동시에 요청 (재시도/Rate Limit 대기는 요청기가 처리)
+                results = await fetcher.fetch_all([f"{self.base_url}/{board}?page={page}" for page in page_numbers])
+                
+                for page, result in zip(page_numbers, results):
+                    if result is None:
+                        retry_count += 1
+                        # 연속 실패가 5번 이상이면 중단
+                        if retry_count >= 5:
+                            print(f"\n연속 실패 {retry_count}회. 수집을 중단합니다.")
+                            print(f"총 {len(posts)}개 게시글 수집 완료\n")
+                            return posts
                         continue
                     
-                    # 기타 에러
+                    retry_count = 0  # 성공하면 리셋
+                    soup = BeautifulSoup(result.text, 'html.parser')
+                    
+                    # 게시글 목록 파싱 (코인판 실제 구조)
+                    # <tbody> 안의 <tr> 중 공지가 아닌 것들
+                    tbody = soup.find('tbody')
+                    if tbody:
+                        # bg1, bg2 클래스를 가진 tr (일반 게시글)
+                        articles = tbody.find_all('tr', class_=['bg1', 'bg2'])
                     else:
-                        print(f"  ✗ 페이지 {page} 요청 실패: {response.status_code}")
-                        if attempt < max_retries - 1:
-                            time.sleep(5)
+                        articles = []
+                    
+                    for article in articles:
+                        try:
+                            post_data = self._parse_post(article, board)
+                            if post_data:
+                                posts.append(post_data)
+                        except Exception as e:
                             continue
-                        break
-                        
-                except Exception as e:
-                    print(f"  ✗ 페이지 {page} 처리 중 오류: {e}")
-                    if attempt < max_retries - 1:
-                        time.sleep(5)
-                        continue
-                    break
+                    
+                    print(f"  ✓ 페이지 {page}/{pages} 완료 (총 {len(posts)}개 게시글)")
             
-            if not success:
-                retry_count += 1
-                # 연속 실패가 5번 이상이면 중단
-                if retry_count >= 5:
-                    print(f"\n연속 실패 {retry_count}회. 수집을 중단합니다.")
-                    break
-            else:
-                retry_count = 0  # 성공하면 리셋
+            print(f"  요청 통계: {fetcher.stats}")
         
         print(f"총 {len(posts)}개 게시글 수집 완료\n")
         return posts
@@ -217,7 +209,7 @@ class CoinpanScraper:
             post_time = self._parse_time(time_str)
             
             # 감정 분석
-            sentiment_score = sentiment_analyzer.polarity_scores(title)
+            sentiment_score = sentiment_store.polarity_scores(title)
             
             return {
                 'timestamp': post_time,
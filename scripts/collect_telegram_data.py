@@ -7,15 +7,31 @@
 - 반응/이모티콘 수
 - 전달 횟수 (forwards)
 - 감정 분석 점수
+
+여러 채널을 동시에 수집합니다 (동시 수집 수 제한, FloodWait 시 모든 채널 대기).
+감정 분석은 이벤트 루프 밖의 스레드 풀에서 배치로 실행합니다.
+
+증분 수집 (--incremental):
+- 채널별 마지막 message_id를 상태 파일에 저장하고 그 이후 메시지만 가져옴 (min_id)
+- 새 메시지를 채널별 원본 저장소(data/temp_{채널}_data.csv)에 병합
+- 새 메시지가 속한 시간대만 기존 집계와 합쳐서 출력 파일에 반영
+
+메시지는 리스트에 모으지 않고 도착하는 대로 채널/시간대별 누적값에 더하며,
+닫힌 시간대와 원본 메시지는 묶음 단위로 디스크에 기록합니다 (채널 이력 길이와 무관한 메모리).
 """
 
 import os
+import sys
 import asyncio
+import json
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import pandas as pd
 from telethon import TelegramClient
+from telethon.errors import FloodWaitError
 from telethon.tl.types import Message
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 from dotenv import load_dotenv
 import pytz
 
@@ -27,25 +43,247 @@ API_ID = os.getenv('TELEGRAM_API_ID')
 API_HASH = os.getenv('TELEGRAM_API_HASH')
 PHONE = os.getenv('TELEGRAM_PHONE')
 CHANNELS = os.getenv('TELEGRAM_CHANNELS', '@Ethereum,@Bitcoin').split(',')
+MAX_CONCURRENCY = int(os.getenv('TELEGRAM_MAX_CONCURRENCY', '4'))
+
+# 채널별 마지막 수집 message_id 저장 파일
+STATE_FILE = 'data/telegram_state.json'
+
+# 수집 중 닫힌 시간대 집계를 임시로 기록하는 디렉토리
+HOURLY_SPOOL_DIR = 'data/.cache/telegram_hourly'
+
+# 시간당 집계 컬럼 (합계로 누적하는 컬럼 / 평균으로 내보내는 컬럼)
+TOTAL_COLUMNS = ['message_count', 'total_forwards', 'total_reactions']
+AVG_COLUMNS = ['avg_views', 'avg_sentiment', 'avg_positive', 'avg_negative', 'avg_neutral', 'avg_msg_length']
+HOURLY_COLUMNS = [
+    'channel', 'timestamp', 'message_count', 'avg_views',
+    'total_forwards', 'total_reactions', 'avg_sentiment',
+    'avg_positive', 'avg_negative', 'avg_neutral', 'avg_msg_length'
+]
+
+# 프로젝트 루트 (utils 패키지 import용)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.sentiment_store import SentimentStore
 
-# 감정 분석기 초기화
-sentiment_analyzer = SentimentIntensityAnalyzer()
+# 감정 분석기 초기화 (이미 분석한 텍스트는 공유 디스크 캐시에서 재사용)
+sentiment_store = SentimentStore()
+
+# 텍스트 없는 메시지 (사진, 동영상 등)의 감정 점수
+EMPTY_SENTIMENT = {'compound': 0, 'pos': 0, 'neg': 0, 'neu': 1.0}
+
+
+class HourlyAccumulator:
+    """
+    채널 하나의 시간대별 스트리밍 집계
+    
+    메시지가 최신순으로 들어오므로, 더 이전 시간대의 메시지가 도착하면
+    그보다 뒤의 시간대는 닫힌 것으로 보고 flush_size개씩 디스크에 기록합니다.
+    """
+    
+    # 누적할 원본 컬럼 (message_count 다음 순서대로)
+    SUM_FIELDS = [
+        'views', 'forwards', 'reactions', 'sentiment_compound',
+        'sentiment_positive', 'sentiment_negative', 'sentiment_neutral', 'message_length'
+    ]
+    
+    def __init__(self, channel, path, flush_size=500):
+        """
+        Args:
+            channel: 채널 사용자명
+            path: 닫힌 시간대 집계를 기록할 CSV 경로 (기존 파일은 덮어씀)
+            flush_size: 한 번에 기록할 시간대 수
+        """
+        self.channel = channel
+        self.path = path
+        self.flush_size = flush_size
+        
+        # {시간대: [메시지 수, SUM_FIELDS 합계...]}
+        self.open_hours = {}
+        self.closed_rows = []
+        self.hours_written = 0
+        
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        if os.path.exists(path):
+            os.remove(path)
+    
+    def add(self, row):
+        """메시지 하나를 해당 시간대 누적값에 더함"""
+        hour = row['timestamp'].replace(minute=0, second=0, microsecond=0)
+        
+        # 더 이전 시간대가 시작되면 뒤의 시간대는 닫힘
+        for open_hour in [h for h in self.open_hours if h > hour]:
+            self._close(open_hour)
+        
+        acc = self.open_hours.get(hour)
+        if acc is None:
+            acc = self.open_hours[hour] = [0] * (len(self.SUM_FIELDS) + 1)
+        
+        acc[0] += 1
+        for i, field in enumerate(self.SUM_FIELDS, start=1):
+            acc[i] += row[field]
+    
+    def _close(self, hour):
+        """시간대를 닫고 집계 행으로 변환"""
+        count, views, forwards, reactions, compound, positive, negative, neutral, length = self.open_hours.pop(hour)
+        self.closed_rows.append({
+            'channel': self.channel,
+            'timestamp': hour,
+            'message_count': count,
+            'avg_views': views / count,
+            'total_forwards': forwards,
+            'total_reactions': reactions,
+            'avg_sentiment': compound / count,
+            'avg_positive': positive / count,
+            'avg_negative': negative / count,
+            'avg_neutral': neutral / count,
+            'avg_msg_length': length / count
+        })
+        
+        if len(self.closed_rows) >= self.flush_size:
+            self.flush()
+    
+    def flush(self):
+        """닫힌 시간대를 디스크에 기록"""
+        if not self.closed_rows:
+            return
+        
+        pd.DataFrame(self.closed_rows, columns=HOURLY_COLUMNS).to_csv(
+            self.path, mode='a', header=self.hours_written == 0, index=False
+        )
+        self.hours_written += len(self.closed_rows)
+        self.closed_rows = []
+    
+    def finish(self):
+        """
+        남은 시간대를 모두 닫고 기록한 집계를 반환
+        
+        Returns:
+            DataFrame: 시간당 집계 (시간순)
+        """
+        for hour in list(self.open_hours):
+            self._close(hour)
+        self.flush()
+        
+        if not self.hours_written:
+            return pd.DataFrame(columns=HOURLY_COLUMNS)
+        
+        hourly = pd.read_csv(self.path)
+        os.remove(self.path)
+        hourly['timestamp'] = pd.to_datetime(hourly['timestamp'], utc=True, format='mixed')
+        return hourly.sort_values('timestamp').reset_index(drop=True)
 
 
 class TelegramDataCollector:
     """텔레그램 데이터 수집기"""
     
-    def __init__(self, api_id, api_hash, phone):
+    def __init__(self, api_id, api_hash, phone, max_concurrency=MAX_CONCURRENCY,
+                 score_batch_size=500, score_workers=2):
         """
         Args:
             api_id: Telegram API ID
             api_hash: Telegram API Hash
             phone: 전화번호
+            max_concurrency: 동시에 수집할 채널 수
+            score_batch_size: 감정 분석을 한 번에 넘기는 메시지 수
+            score_workers: 감정 분석 스레드 수
         """
         self.client = TelegramClient('session_name', api_id, api_hash)
         self.phone = phone
+        self.max_concurrency = max_concurrency
+        self.score_batch_size = score_batch_size
+        self.score_workers = score_workers
+        self.executor = ThreadPoolExecutor(max_workers=score_workers)
+        
+        # FloodWait 해제 시각 (event loop 시간, 모든 채널이 공유)
+        self._flood_until = 0.0
+        
+        # 채널별 수집 통계
+        self.channel_stats = {}
+        
+        # 채널별 마지막 수집 message_id
+        self.state = self.load_state()
+    
+    @staticmethod
+    def channel_store_path(channel_username):
+        """채널별 원본 메시지 저장소 경로"""
+        return f'data/temp_{channel_username.replace("@", "")}_data.csv'
+    
+    def load_state(self):
+        """상태 파일 로드 ({채널: 마지막 message_id})"""
+        if os.path.exists(STATE_FILE):
+            with open(STATE_FILE, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        return {}
+    
+    def save_state(self):
+        """상태 파일 저장"""
+        os.makedirs(os.path.dirname(STATE_FILE), exist_ok=True)
+        with open(STATE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, ensure_ascii=False, indent=2)
+    
+    def last_message_id(self, channel_username):
+        """
+        채널의 마지막 수집 message_id
+        
+        상태 파일에 없으면 기존 원본 저장소의 최대 message_id를 사용합니다.
+        """
+        if channel_username in self.state:
+            return int(self.state[channel_username])
+        
+        path = self.channel_store_path(channel_username)
+        if not os.path.exists(path):
+            return 0
+        
+        message_ids = pd.read_csv(path, encoding='utf-8-sig', usecols=['message_id'])['message_id']
+        return int(message_ids.max()) if not message_ids.empty else 0
+    
+    def finalize_channel_store(self, channel_username, part_path, oldest_new_id):
+        """
+        새로 기록한 메시지(part_path, 최신순) 뒤에 기존 저장소의 더 오래된 메시지를 이어 붙여 교체
+        
+        기존 저장소는 묶음 단위로 읽으므로 저장소 크기와 무관하게 메모리를 적게 사용합니다.
+        
+        Args:
+            channel_username: 채널 사용자명
+            part_path: 이번 실행에서 기록한 메시지 파일
+            oldest_new_id: 이번 실행에서 수집한 가장 오래된 message_id
+        """
+        path = self.channel_store_path(channel_username)
+        kept = 0
         
-    async def collect_channel_data(self, channel_username, start_date, end_date):
+        if os.path.exists(path):
+            for chunk in pd.read_csv(path, encoding='utf-8-sig', chunksize=50000):
+                chunk = chunk[chunk['message_id'] < oldest_new_id]
+                chunk.to_csv(part_path, mode='a', header=False, index=False, encoding='utf-8')
+                kept += len(chunk)
+        
+        os.replace(part_path, path)
+        print(f"  💾 원본 저장소 병합: {path} (기존 {kept}개 유지)")
+    
+    async def _wait_flood(self):
+        """FloodWait 중이면 해제될 때까지 대기"""
+        delay = self._flood_until - asyncio.get_running_loop().time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+    
+    def _set_flood_wait(self, seconds):
+        """FloodWait 해제 시각 갱신 (모든 채널이 이 시각까지 요청을 멈춤)"""
+        until = asyncio.get_running_loop().time() + seconds + 1
+        self._flood_until = max(self._flood_until, until)
+    
+    @staticmethod
+    def _score_texts(texts):
+        """
+        메시지 텍스트 묶음의 감정 점수 계산 (스레드 풀에서 실행)
+        
+        Returns:
+            list: 감정 점수 dict 리스트
+        """
+        return [
+            sentiment_store.polarity_scores(text) if text else EMPTY_SENTIMENT
+            for text in texts
+        ]
+    
+    async def collect_channel_data(self, channel_username, start_date, end_date, min_id=0):
         """
         특정 채널의 데이터를 수집합니다.
         
@@ -53,134 +291,173 @@ class TelegramDataCollector:
             channel_username: 채널 사용자명 (예: @Ethereum)
             start_date: 수집 시작 날짜
             end_date: 수집 종료 날짜
-            
+            min_id: 이 message_id보다 새로운 메시지만 수집 (0이면 전체)
+        
         Returns:
-            DataFrame: 수집된 데이터
+            DataFrame: 새로 수집된 메시지의 시간당 집계
         """
         print(f"\n채널 {channel_username} 데이터 수집 중...")
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
         
         # 채널 엔티티 가져오기
-        try:
-            channel = await self.client.get_entity(channel_username)
-            print(f"  ✓ 채널 찾음: {channel.title if hasattr(channel, 'title') else channel_username}")
-        except Exception as e:
-            print(f"  ✗ 채널 {channel_username}을 찾을 수 없습니다: {e}")
-            print(f"  💡 채널명이 정확한지 확인하세요. 또는 채널이 비공개일 수 있습니다.")
-            return pd.DataFrame()
+        while True:
+            await self._wait_flood()
+            try:
+                channel = await self.client.get_entity(channel_username)
+                print(f"  ✓ 채널 찾음: {channel.title if hasattr(channel, 'title') else channel_username}")
+                break
+            except FloodWaitError as e:
+                print(f"  ⏳ [{channel_username}] FloodWait {e.seconds}초 대기")
+                self._set_flood_wait(e.seconds)
+            except Exception as e:
+                print(f"  ✗ 채널 {channel_username}을 찾을 수 없습니다: {e}")
+                print(f"  💡 채널명이 정확한지 확인하세요. 또는 채널이 비공개일 수 있습니다.")
+                return pd.DataFrame()
         
-        messages_data = []
         message_count = 0
+        collected = 0
+        newest_id = min_id
+        oldest_id = None
         
-        print(f"  메시지 수집 시작... (기간: {start_date.date()} ~ {end_date.date()})")
+        # 시간대별 누적 집계와 원본 메시지 기록 파일 (최신순)
+        safe_name = channel_username.replace("@", "")
+        accumulator = HourlyAccumulator(channel_username, os.path.join(HOURLY_SPOOL_DIR, f'{safe_name}.csv'))
+        part_path = self.channel_store_path(channel_username) + '.part'
+        if os.path.exists(part_path):
+            os.remove(part_path)
+        
+        # 감정 분석 대기 중인 배치와 실행 중인 배치 (순서 유지, 동시 실행 수 제한)
+        batch = []
+        in_flight = deque()
+        
+        def submit(rows):
+            texts = [row.pop('text') for row in rows]
+            in_flight.append((rows, loop.run_in_executor(self.executor, self._score_texts, texts)))
+        
+        async def apply_oldest():
+            rows, future = in_flight.popleft()
+            for row, sentiment_score in zip(rows, await future):
+                row['sentiment_compound'] = sentiment_score['compound']
+                row['sentiment_positive'] = sentiment_score['pos']
+                row['sentiment_negative'] = sentiment_score['neg']
+                row['sentiment_neutral'] = sentiment_score['neu']
+                row['message_length'] = row.pop('message_length')
+                accumulator.add(row)
+            
+            first = not os.path.exists(part_path)
+            pd.DataFrame(rows).to_csv(
+                part_path, mode='a', header=first, index=False,
+                encoding='utf-8-sig' if first else 'utf-8'
+            )
+        
+        # FloodWait 후 이어서 받을 위치 (마지막으로 처리한 메시지 ID)
+        offset_id = 0
+        
+        if min_id:
+            print(f"  메시지 수집 시작... (message_id {min_id} 이후, 기간: {start_date.date()} ~ {end_date.date()})")
+        else:
+            print(f"  메시지 수집 시작... (기간: {start_date.date()} ~ {end_date.date()})")
         
         # 메시지 가져오기
-        try:
-            async for message in self.client.iter_messages(
-                channel,
-                limit=None  # 제한 없음 (전체 수집)
-            ):
-                message_count += 1
-                
-                # 진행 상황 표시
-                if message_count % 100 == 0:
-                    print(f"    처리 중: {message_count}개 메시지... (수집: {len(messages_data)}개)")
-                
-                # 날짜 범위 확인 (timezone aware)
-                msg_date = message.date
-                
-                # 너무 오래된 메시지는 건너뛰기
-                if msg_date < start_date:
-                    break  # 더 이상 수집 안 함
-                
-                # 미래 메시지는 건너뛰기 (일반적으로 없지만)
-                if msg_date > end_date:
-                    continue
+        while True:
+            await self._wait_flood()
+            try:
+                async for message in self.client.iter_messages(
+                    channel,
+                    limit=None,  # 제한 없음 (전체 수집)
+                    offset_id=offset_id,
+                    min_id=min_id
+                ):
+                    message_count += 1
+                    offset_id = message.id
                     
-                # 메시지 처리 (텍스트가 있든 없든 모두 수집)
-                if isinstance(message, Message):
-                    # 텍스트 메시지가 있으면 감정 분석
-                    if message.message:
-                        sentiment_score = sentiment_analyzer.polarity_scores(message.message)
-                        message_text = message.message
-                    else:
-                        # 텍스트 없는 메시지 (사진, 동영상 등)
-                        sentiment_score = {'compound': 0, 'pos': 0, 'neg': 0, 'neu': 1.0}
-                        message_text = ""
+                    # 진행 상황 표시 (다른 채널이 FloodWait에 걸렸으면 같이 대기)
+                    if message_count % 100 == 0:
+                        elapsed = time.perf_counter() - started
+                        print(f"    [{channel_username}] 처리 중: {message_count}개 메시지... "
+                              f"(수집: {collected}개, {message_count / elapsed:.1f} msg/s)")
+                        await self._wait_flood()
                     
-                    # 반응 수 계산
-                    reaction_count = 0
-                    if hasattr(message, 'reactions') and message.reactions:
-                        reaction_count = sum([r.count for r in message.reactions.results])
+                    # 날짜 범위 확인 (timezone aware)
+                    msg_date = message.date
                     
-                    messages_data.append({
-                        'timestamp': msg_date,
-                        'channel': channel_username,
-                        'message_id': message.id,
-                        'views': message.views if message.views else 0,
-                        'forwards': message.forwards if message.forwards else 0,
-                        'reactions': reaction_count,
-                        'sentiment_compound': sentiment_score['compound'],
-                        'sentiment_positive': sentiment_score['pos'],
-                        'sentiment_negative': sentiment_score['neg'],
-                        'sentiment_neutral': sentiment_score['neu'],
-                        'message_length': len(message_text)
-                    })
-        
-        except Exception as e:
-            print(f"  ✗ 메시지 수집 중 오류: {e}")
-            import traceback
-            traceback.print_exc()
-        
-        print(f"  ✓ 채널 {channel_username}에서 {len(messages_data)}개의 메시지를 수집했습니다.")
-        
-        # 채널별로 중간 저장 (데이터 손실 방지)
-        if messages_data:
-            temp_df = pd.DataFrame(messages_data)
-            temp_file = f'data/temp_{channel_username.replace("@", "")}_data.csv'
-            temp_df.to_csv(temp_file, index=False, encoding='utf-8-sig')
-            print(f"  💾 중간 저장: {temp_file}")
-        
-        return pd.DataFrame(messages_data)
-    
-    async def aggregate_hourly(self, df):
-        """
-        메시지 데이터를 시간당 집계합니다.
-        
-        Args:
-            df: 메시지 데이터프레임
+                    # 너무 오래된 메시지는 건너뛰기
+                    if msg_date < start_date:
+                        break  # 더 이상 수집 안 함
+                    
+                    # 미래 메시지는 건너뛰기 (일반적으로 없지만)
+                    if msg_date > end_date:
+                        continue
+                    
+                    # 메시지 처리 (텍스트가 있든 없든 모두 수집)
+                    if isinstance(message, Message):
+                        message_text = message.message or ""
+                        
+                        # 반응 수 계산
+                        reaction_count = 0
+                        if hasattr(message, 'reactions') and message.reactions:
+                            reaction_count = sum([r.count for r in message.reactions.results])
+                        
+                        batch.append({
+                            'timestamp': msg_date,
+                            'channel': channel_username,
+                            'message_id': message.id,
+                            'views': message.views if message.views else 0,
+                            'forwards': message.forwards if message.forwards else 0,
+                            'reactions': reaction_count,
+                            'message_length': len(message_text),
+                            'text': message_text
+                        })
+                        collected += 1
+                        newest_id = max(newest_id, message.id)
+                        oldest_id = message.id if oldest_id is None else min(oldest_id, message.id)
+                        
+                        # 감정 분석은 배치로 모아서 스레드 풀에서 실행
+                        if len(batch) >= self.score_batch_size:
+                            submit(batch)
+                            batch = []
+                            if len(in_flight) > self.score_workers:
+                                await apply_oldest()
+                break
             
-        Returns:
-            DataFrame: 시간당 집계 데이터
-        """
-        if df.empty:
-            return df
-        
-        # 시간 단위로 내림
-        df['hour'] = df['timestamp'].dt.floor('H')
-        
-        # 채널별, 시간별 집계
-        hourly_data = df.groupby(['channel', 'hour']).agg({
-            'message_id': 'count',  # 메시지 수
-            'views': 'mean',  # 평균 조회수
-            'forwards': 'sum',  # 총 전달 횟수
-            'reactions': 'sum',  # 총 반응 수
-            'sentiment_compound': 'mean',  # 평균 감정 점수
-            'sentiment_positive': 'mean',
-            'sentiment_negative': 'mean',
-            'sentiment_neutral': 'mean',
-            'message_length': 'mean'
-        }).reset_index()
-        
-        # 컬럼명 변경
-        hourly_data.columns = [
-            'channel', 'timestamp', 'message_count', 'avg_views',
-            'total_forwards', 'total_reactions', 'avg_sentiment',
-            'avg_positive', 'avg_negative', 'avg_neutral', 'avg_msg_length'
-        ]
+            except FloodWaitError as e:
+                print(f"  ⏳ [{channel_username}] FloodWait {e.seconds}초 대기 (메시지 ID {offset_id}부터 재개)")
+                self._set_flood_wait(e.seconds)
+            
+            except Exception as e:
+                print(f"  ✗ 메시지 수집 중 오류: {e}")
+                import traceback
+                traceback.print_exc()
+                break
+        
+        # 남은 배치 처리
+        if batch:
+            submit(batch)
+        while in_flight:
+            await apply_oldest()
+        
+        hourly_data = accumulator.finish()
+        
+        elapsed = time.perf_counter() - started
+        self.channel_stats[channel_username] = {
+            'messages': message_count,
+            'collected': collected,
+            'seconds': elapsed,
+            'messages_per_sec': message_count / elapsed if elapsed > 0 else 0.0
+        }
+        
+        print(f"  ✓ 채널 {channel_username}에서 {collected}개의 메시지를 수집했습니다. "
+              f"({elapsed:.1f}초, {self.channel_stats[channel_username]['messages_per_sec']:.1f} msg/s)")
+        
+        # 채널별 원본 저장소에 병합 (데이터 손실 방지)
+        if collected:
+            self.finalize_channel_store(channel_username, part_path, oldest_id)
+            self.state[channel_username] = newest_id
         
         return hourly_data
     
-    async def collect_all_channels(self, channels, start_date, end_date):
+    async def collect_all_channels(self, channels, start_date, end_date, incremental=False):
         """
         모든 채널의 데이터를 수집합니다.
         
@@ -188,32 +465,72 @@ class TelegramDataCollector:
             channels: 채널 리스트
             start_date: 수집 시작 날짜
             end_date: 수집 종료 날짜
-            
+            incremental: True면 채널별 마지막 message_id 이후만 수집
+        
         Returns:
-            DataFrame: 모든 채널의 집계 데이터
+            DataFrame: 모든 채널의 집계 데이터 (증분 수집 시 새 메시지의 집계만)
         """
-        all_data = []
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        started = time.perf_counter()
+        
+        async def collect_limited(channel):
+            min_id = self.last_message_id(channel) if incremental else 0
+            async with semaphore:
+                return channel, await self.collect_channel_data(channel, start_date, end_date, min_id)
+        
+        # 채널 데이터 동시 수집 (최대 max_concurrency개)
+        results = await asyncio.gather(*(collect_limited(channel.strip()) for channel in channels))
         
-        for channel in channels:
-            channel = channel.strip()
-            # 채널 데이터 수집
-            channel_df = await self.collect_channel_data(channel, start_date, end_date)
-            if not channel_df.empty:
-                all_data.append(channel_df)
+        all_data = [channel_df for channel, channel_df in results if not channel_df.empty]
+        
+        # 채널별 처리량
+        elapsed = time.perf_counter() - started
+        total_messages = sum(stats['messages'] for stats in self.channel_stats.values())
+        print("\n=== 채널별 처리량 ===")
+        for channel, stats in self.channel_stats.items():
+            print(f"  {channel}: {stats['messages']}개 메시지, {stats['seconds']:.1f}초, "
+                  f"{stats['messages_per_sec']:.1f} msg/s")
+        print(f"  전체: {total_messages}개 메시지, {elapsed:.1f}초, "
+              f"{total_messages / elapsed if elapsed > 0 else 0.0:.1f} msg/s")
         
         if not all_data:
             print("수집된 데이터가 없습니다.")
             return pd.DataFrame()
         
-        # 모든 채널 데이터 합치기
-        combined_df = pd.concat(all_data, ignore_index=True)
+        # 모든 채널 집계 합치기
+        hourly_df = pd.concat(all_data, ignore_index=True)
+        return hourly_df.sort_values(['channel', 'timestamp']).reset_index(drop=True)
+    
+    def merge_hourly_output(self, hourly_data, output_file):
+        """
+        새 메시지의 시간당 집계를 기존 출력 파일에 합침
+        
+        같은 채널/시간대는 메시지 수로 가중하여 평균을 다시 계산하고,
+        새 메시지가 없는 시간대는 그대로 둡니다.
+        
+        Returns:
+            DataFrame: 병합된 시간당 집계 데이터
+        """
+        if not os.path.exists(output_file):
+            return hourly_data
+        
+        existing = pd.read_csv(output_file)
+        existing['timestamp'] = pd.to_datetime(existing['timestamp'], utc=True, format='mixed')
+        
+        updated_keys = pd.MultiIndex.from_frame(hourly_data[['channel', 'timestamp']])
+        existing_keys = pd.MultiIndex.from_frame(existing[['channel', 'timestamp']])
+        affected = existing_keys.isin(updated_keys)
         
-        # 시간당 집계
-        hourly_df = await self.aggregate_hourly(combined_df)
+        # 평균 -> 합계로 바꿔 더한 뒤 다시 평균으로
+        combined = pd.concat([existing[affected], hourly_data], ignore_index=True)
+        combined[AVG_COLUMNS] = combined[AVG_COLUMNS].mul(combined['message_count'], axis=0)
+        combined = combined.groupby(['channel', 'timestamp'], as_index=False)[TOTAL_COLUMNS + AVG_COLUMNS].sum()
+        combined[AVG_COLUMNS] = combined[AVG_COLUMNS].div(combined['message_count'], axis=0)
         
-        return hourly_df
+        merged = pd.concat([existing[~affected], combined[HOURLY_COLUMNS]], ignore_index=True)
+        return merged.sort_values(['channel', 'timestamp']).reset_index(drop=True)
     
-    async def run(self, channels, start_date, end_date, output_file):
+    async def run(self, channels, start_date, end_date, output_file, incremental=False):
         """
         데이터 수집 실행
         
@@ -222,14 +539,19 @@ class TelegramDataCollector:
             start_date: 수집 시작 날짜
             end_date: 수집 종료 날짜
             output_file: 출력 파일 경로
+            incremental: 증분 수집 여부 (마지막 message_id 이후만 수집하여 출력 파일에 병합)
         """
         await self.client.start(phone=self.phone)
         print("Telegram 클라이언트에 연결되었습니다.")
         
         # 데이터 수집
-        hourly_data = await self.collect_all_channels(channels, start_date, end_date)
+        hourly_data = await self.collect_all_channels(channels, start_date, end_date, incremental)
         
         if not hourly_data.empty:
+            if incremental:
+                print(f"\n{len(hourly_data)}개 시간대를 다시 집계했습니다.")
+                hourly_data = self.merge_hourly_output(hourly_data, output_file)
+            
             # CSV로 저장
             hourly_data.to_csv(output_file, index=False)
             print(f"\n데이터가 {output_file}에 저장되었습니다.")
@@ -242,7 +564,11 @@ class TelegramDataCollector:
         else:
             print("수집된 데이터가 없습니다.")
         
+        # 출력 파일 저장 후 상태 갱신 (중간에 실패하면 다음 실행에서 다시 수집)
+        self.save_state()
+        
         await self.client.disconnect()
+        self.executor.shutdown()
 
 
 async def main():
@@ -258,7 +584,13 @@ async def main():
     start_date = datetime(2025, 1, 1, tzinfo=pytz.UTC)
     end_date = datetime.now(pytz.UTC)
     
-    print("📅 2025년 전체 데이터를 수집합니다. (시간이 걸릴 수 있습니다)")
+    # 증분 수집: python scripts/collect_telegram_data.py --incremental
+    incremental = '--incremental' in sys.argv
+    
+    if incremental:
+        print("📅 채널별 마지막 수집 이후의 새 메시지만 수집합니다.")
+    else:
+        print("📅 2025년 전체 데이터를 수집합니다. (시간이 걸릴 수 있습니다)")
     
     print("=== 텔레그램 데이터 수집 시작 ===")
     print(f"수집 기간: {start_date.strftime('%Y-%m-%d')} ~ {end_date.strftime('%Y-%m-%d')}")
@@ -272,7 +604,7 @@ async def main():
     output_file = '/Volumes/T7/class/2025-FALL/big_data/data/telegram_data.csv'
     
     # 데이터 수집 실행
-    await collector.run(CHANNELS, start_date, end_date, output_file)
+    await collector.run(CHANNELS, start_date, end_date, output_file, incremental)
     
     print("\n데이터 수집이 완료되었습니다!")
 
@@ -13,13 +13,59 @@ import os
 sys.path.append('/Volumes/T7/class/2025-FALL/big_data')
 
 from utils.data_loader import DataLoader
+from utils.feature_engine import RollingFeatureEngine
+from utils.asset_store import AssetHourlyStore
 
 
 class DataPreprocessor:
     """데이터 전처리 클래스"""
     
+    # 증분 처리 시 24시간 롤링 윈도우/변화율을 다시 채우기 위해 함께 읽는 과거 구간
+    WARMUP_HOURS = 48
+    
+    # 병합할 소스별 컬럼과 결측 처리 정책 ('ffill': 직전 값 유지, 숫자: 해당 값으로 채움)
+    MERGE_SOURCES = {
+        'eth_price': {
+            'columns': ['ETH_open', 'ETH_high', 'ETH_low', 'ETH_close', 'ETH_volume', 'ETH_trade_count'],
+            'fill': 'ffill'
+        },
+        'btc_price': {
+            'columns': ['BTC_open', 'BTC_high', 'BTC_low', 'BTC_close', 'BTC_volume', 'BTC_trade_count'],
+            'fill': 'ffill'
+        },
+        'telegram': {
+            'columns': ['message_count', 'avg_views', 'total_forwards', 'total_reactions',
+                        'avg_sentiment', 'avg_positive', 'avg_negative', 'avg_neutral'],
+            'fill': 0
+        },
+    }
+    
+    # 변화율(%) 파생 변수: {원본 컬럼: 출력 컬럼}
+    PCT_CHANGE_FEATURES = {
+        'ETH_close': 'ETH_price_change_pct',
+        'BTC_close': 'BTC_price_change_pct',
+        'ETH_volume': 'ETH_volume_change_pct',
+        'BTC_volume': 'BTC_volume_change_pct',
+        'tx_frequency': 'tx_frequency_change_pct',
+        'tx_amount': 'tx_amount_change_pct',
+        'message_count': 'message_count_change_pct',
+        'avg_views': 'avg_views_change_pct',
+        'total_reactions': 'total_reactions_change_pct',
+    }
+    
+    # 병합에 쓰지 않는 소스는 timestamp만 로드
+    LOAD_PROJECTIONS = {'twitter': [], 'coinness': []}
+    
+    # 24시간 롤링 통계(이동평균/표준편차/Z-score) 파생 변수
+    ROLLING_FEATURES = [
+        {'column': 'ETH_close', 'prefix': 'ETH_price', 'band_prefix': 'ETH'},
+        {'column': 'tx_frequency', 'prefix': 'tx_frequency'},
+        {'column': 'message_count', 'prefix': 'message_count'},
+    ]
+    
     def __init__(self):
         self.loader = DataLoader()
+        self.feature_engine = RollingFeatureEngine(window=24)
         
     def aggregate_telegram_by_hour(self, telegram_df):
         """
@@ -53,10 +99,33 @@ class DataPreprocessor:
         
         return hourly
     
+    def _to_hourly_frame(self, df, columns=None):
+        """
+        timestamp를 (타임존 없는 UTC) 인덱스로 하는 프레임으로 변환
+        
+        Args:
+            df: timestamp 컬럼을 가진 데이터프레임
+            columns: 선택할 컬럼 (None이면 전체)
+            
+        Returns:
+            DataFrame: 시간 인덱스 데이터프레임 (중복 시각은 마지막 값 사용)
+        """
+        index = pd.DatetimeIndex(df['timestamp'])
+        if index.tz is not None:
+            index = index.tz_convert(None)
+        
+        frame = df.drop(columns='timestamp') if columns is None else df[columns]
+        frame = frame.set_axis(index)
+        
+        return frame[~frame.index.duplicated(keep='last')]
+    
     def merge_all_data(self, whale_tx, eth_price, btc_price, telegram):
         """
         모든 데이터를 시간 기준으로 병합
         
+        고래 거래 데이터의 시간 인덱스를 기준으로 각 소스를 reindex한 뒤
+        한 번의 concat으로 합치고, MERGE_SOURCES에 선언된 정책으로 결측치를 채웁니다.
+        
         Args:
             whale_tx: 고래 거래 데이터
             eth_price: ETH 가격 데이터
@@ -66,37 +135,36 @@ class DataPreprocessor:
         Returns:
             DataFrame: 병합된 데이터
         """
-        # 1. 고래 거래 데이터를 기준으로 시작
-        merged = whale_tx.copy()
-        
-        # 2. ETH 가격 데이터 병합
-        eth_cols = ['timestamp', 'ETH_open', 'ETH_high', 'ETH_low', 'ETH_close', 'ETH_volume', 'ETH_trade_count']
-        eth_data = eth_price[eth_cols].copy()
-        merged = merged.merge(eth_data, on='timestamp', how='left')
-        
-        # 3. BTC 가격 데이터 병합
-        btc_cols = ['timestamp', 'BTC_open', 'BTC_high', 'BTC_low', 'BTC_close', 'BTC_volume', 'BTC_trade_count']
-        btc_data = btc_price[btc_cols].copy()
-        merged = merged.merge(btc_data, on='timestamp', how='left')
-        
-        # 4. 텔레그램 데이터 병합
+        # 1. 고래 거래 데이터의 시간을 공통 인덱스로 사용
+        base = self._to_hourly_frame(whale_tx)
+        index = base.index
+        
+        # DataLoader 가격 컬럼(ETH_close_price)을 MERGE_SOURCES 이름(ETH_close)으로
+        sources = {
+            name: price.rename(columns=lambda col: col.removesuffix('_price'))
+            for name, price in [('eth_price', eth_price), ('btc_price', btc_price)]
+        }
         if not telegram.empty:
-            telegram_agg = self.aggregate_telegram_by_hour(telegram)
-            merged = merged.merge(telegram_agg, on='timestamp', how='left')
-            
-            # 텔레그램 데이터가 없는 시간은 0으로 채우기
-            telegram_cols = ['message_count', 'avg_views', 'total_forwards', 'total_reactions',
-                           'avg_sentiment', 'avg_positive', 'avg_negative', 'avg_neutral']
-            for col in telegram_cols:
-                if col in merged.columns:
-                    merged[col] = merged[col].fillna(0)
+            sources['telegram'] = self.aggregate_telegram_by_hour(telegram)
+        
+        # 2. 각 소스를 공통 인덱스에 맞춰 한 번에 병합 (없는 소스는 빈 컬럼으로 두고 3에서 채움)
+        frames = [base]
+        for name, policy in self.MERGE_SOURCES.items():
+            if name in sources:
+                frames.append(self._to_hourly_frame(sources[name], policy['columns']).reindex(index))
+            else:
+                frames.append(pd.DataFrame(np.nan, index=index, columns=policy['columns']))
+        merged = pd.concat(frames, axis=1)
         
-        # 5. 가격 데이터 결측치 처리 (forward fill)
-        price_cols = [col for col in merged.columns if 'ETH_' in col or 'BTC_' in col]
-        for col in price_cols:
-            merged[col] = merged[col].fillna(method='ffill')
+        # 3. 소스별 결측치 처리
+        for policy in self.MERGE_SOURCES.values():
+            if policy['fill'] == 'ffill':
+                merged[policy['columns']] = merged[policy['columns']].ffill()
+            else:
+                merged[policy['columns']] = merged[policy['columns']].fillna(policy['fill'])
         
-        return merged
+        merged.index.name = 'timestamp'
+        return merged.reset_index()
     
     def create_derived_features(self, df):
         """
@@ -108,56 +176,21 @@ class DataPreprocessor:
         Returns:
             DataFrame: 파생 변수가 추가된 데이터프레임
         """
-        # 1. 가격 변화율 (%)
-        df['ETH_price_change_pct'] = df['ETH_close'].pct_change() * 100
-        df['BTC_price_change_pct'] = df['BTC_close'].pct_change() * 100
-        
-        # 2. 거래량 변화율 (%)
-        df['ETH_volume_change_pct'] = df['ETH_volume'].pct_change() * 100
-        df['BTC_volume_change_pct'] = df['BTC_volume'].pct_change() * 100
-        
-        # 3. 고래 거래 빈도 변화율
-        df['tx_frequency_change_pct'] = df['tx_frequency'].pct_change() * 100
-        df['tx_amount_change_pct'] = df['tx_amount'].pct_change() * 100
-        
-        # 4. 텔레그램 활동 변화율
-        if 'message_count' in df.columns:
-            df['message_count_change_pct'] = df['message_count'].pct_change() * 100
-            df['avg_views_change_pct'] = df['avg_views'].pct_change() * 100
-            df['total_reactions_change_pct'] = df['total_reactions'].pct_change() * 100
-        
-        # 5. 이동평균 (24시간)
-        df['ETH_price_ma24'] = df['ETH_close'].rolling(window=24, min_periods=1).mean()
-        df['tx_frequency_ma24'] = df['tx_frequency'].rolling(window=24, min_periods=1).mean()
-        
-        if 'message_count' in df.columns:
-            df['message_count_ma24'] = df['message_count'].rolling(window=24, min_periods=1).mean()
+        # 1. 변화율 / 이동평균 / 이동표준편차 / Z-score / 볼린저 밴드 (한 번에 계산)
+        features = self.feature_engine.compute(df, self.PCT_CHANGE_FEATURES, self.ROLLING_FEATURES)
+        band_cols = [col for col in features.columns if '_bb_' in col]
         
-        # 6. 이동 표준편차 (24시간) - 변동성 측정
-        df['ETH_price_std24'] = df['ETH_close'].rolling(window=24, min_periods=1).std()
-        df['tx_frequency_std24'] = df['tx_frequency'].rolling(window=24, min_periods=1).std()
+        # 2. 시간 특성
+        time_features = pd.DataFrame({
+            'hour': df['timestamp'].dt.hour,
+            'day_of_week': df['timestamp'].dt.dayofweek,
+            'day': df['timestamp'].dt.day,
+            'month': df['timestamp'].dt.month
+        }, index=df.index)
         
-        if 'message_count' in df.columns:
-            df['message_count_std24'] = df['message_count'].rolling(window=24, min_periods=1).std()
+        df = pd.concat([df, features.drop(columns=band_cols), time_features, features[band_cols]], axis=1)
         
-        # 7. Z-score (이상치 탐지용)
-        df['ETH_price_zscore'] = (df['ETH_close'] - df['ETH_price_ma24']) / (df['ETH_price_std24'] + 1e-10)
-        df['tx_frequency_zscore'] = (df['tx_frequency'] - df['tx_frequency_ma24']) / (df['tx_frequency_std24'] + 1e-10)
-        
-        if 'message_count' in df.columns:
-            df['message_count_zscore'] = (df['message_count'] - df['message_count_ma24']) / (df['message_count_std24'] + 1e-10)
-        
-        # 8. 시간 특성
-        df['hour'] = df['timestamp'].dt.hour
-        df['day_of_week'] = df['timestamp'].dt.dayofweek
-        df['day'] = df['timestamp'].dt.day
-        df['month'] = df['timestamp'].dt.month
-        
-        # 9. 볼린저 밴드 (ETH 가격)
-        df['ETH_bb_upper'] = df['ETH_price_ma24'] + (2 * df['ETH_price_std24'])
-        df['ETH_bb_lower'] = df['ETH_price_ma24'] - (2 * df['ETH_price_std24'])
-        
-        # 10. 무한대/NaN 값 처리
+        # 3. 무한대/NaN 값 처리
         df = df.replace([np.inf, -np.inf], np.nan)
         
         return df
@@ -185,7 +218,7 @@ class DataPreprocessor:
         
         # 1. 데이터 로드
         print("1. 데이터 로드 중...")
-        data = self.loader.load_all_data()
+        data = self.loader.load_all_data(projections=self.LOAD_PROJECTIONS)
         
         for name, df in data.items():
             if not df.empty:
@@ -228,10 +261,120 @@ class DataPreprocessor:
             print("\n결측치 없음!")
         
         return processed_df
+    
+    def get_last_processed_timestamp(self, output_path):
+        """
+        전처리 파일의 마지막 시각 조회 (파일 끝부분만 읽음)
+        
+        Args:
+            output_path: 전처리 파일 경로
+            
+        Returns:
+            Timestamp: 마지막 처리 시각 (파일이 없거나 비어 있으면 None)
+        """
+        if not os.path.exists(output_path):
+            return None
+        
+        with open(output_path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            f.seek(max(0, f.tell() - 4096))
+            lines = f.read().decode('utf-8', errors='ignore').strip().splitlines()
+        
+        if not lines or lines[-1].startswith('timestamp'):
+            return None
+        
+        last_ts = pd.to_datetime(lines[-1].split(',')[0], errors='coerce')
+        return None if pd.isna(last_ts) else last_ts
+    
+    def run_incremental(self, output_path='/Volumes/T7/class/2025-FALL/big_data/data/processed_data.csv'):
+        """
+        증분 전처리: 마지막 처리 시각 이후의 시간만 계산하여 파일 끝에 추가
+        
+        롤링 윈도우가 전체 재계산과 같은 값을 갖도록 WARMUP_HOURS 만큼의
+        과거 구간을 함께 병합/계산한 뒤, 새 시간만 잘라서 저장합니다.
+        기존 파일이 없으면 전체 전처리(run)를 수행합니다.
+        
+        Args:
+            output_path: 출력 파일 경로
+            
+        Returns:
+            DataFrame: 새로 추가된 행들
+        """
+        last_ts = self.get_last_processed_timestamp(output_path)
+        if last_ts is None:
+            print("기존 전처리 파일이 없어 전체 전처리를 실행합니다.\n")
+            return self.run(output_path)
+        
+        print(f"=== 증분 전처리 시작 (마지막 처리 시각: {last_ts}) ===\n")
+        
+        # 1. 워밍업 구간 이후의 원본 데이터만 로드 (캐시에서 그 앞쪽 행은 변환하지 않음)
+        warmup_start = last_ts - pd.Timedelta(hours=self.WARMUP_HOURS)
+        data = self.loader.load_all_data(
+            parallel=True, projections=self.LOAD_PROJECTIONS, since=warmup_start
+        )
+        
+        if data['whale_transactions'].empty:
+            print("새 데이터가 없습니다.")
+            return pd.DataFrame()
+        
+        # 2. 병합 및 파생 변수 생성 (워밍업 구간 포함)
+        merged_df = self.merge_all_data(
+            data['whale_transactions'],
+            data['eth_price'],
+            data['btc_price'],
+            data['telegram']
+        )
+        processed_df = self.create_derived_features(merged_df)
+        
+        # 3. 새 시간만 추출하여 기존 컬럼 순서대로 추가
+        new_rows = processed_df[processed_df['timestamp'] > last_ts]
+        if new_rows.empty:
+            print("새 데이터가 없습니다.")
+            return new_rows
+        
+        columns = pd.read_csv(output_path, nrows=0).columns
+        new_rows = new_rows.reindex(columns=columns)
+        new_rows.to_csv(output_path, mode='a', header=False, index=False)
+        
+        print(f"{len(new_rows)} 시간 추가: {new_rows['timestamp'].min()} ~ {new_rows['timestamp'].max()}")
+        
+        return new_rows
+    
+    def run_multi_asset(self, output_path='/Volumes/T7/class/2025-FALL/big_data/data/asset_hourly.csv'):
+        """
+        자산별 시간 단위 가격/언급/감성 테이블 생성 (long-format: asset, timestamp)
+        
+        Args:
+            output_path: 출력 파일 경로
+            
+        Returns:
+            AssetHourlyStore: 생성된 저장소
+        """
+        print("=== 멀티 자산 집계 시작 ===\n")
+        
+        store = AssetHourlyStore.from_loader(self.loader)
+        store.to_csv(output_path)
+        
+        print(f"자산 {len(store.assets)}개: {', '.join(store.assets)}")
+        print(f"총 {len(store.frame)} 행이 {output_path}에 저장되었습니다.")
+        
+        print("\n가격 수익률과의 상관계수:")
+        print(store.correlations().dropna(how='all'))
+        
+        return store
 
 
 if __name__ == '__main__':
     preprocessor = DataPreprocessor()
+    
+    if '--incremental' in sys.argv:
+        preprocessor.run_incremental()
+        sys.exit(0)
+    
+    if '--multi-asset' in sys.argv:
+        preprocessor.run_multi_asset()
+        sys.exit(0)
+    
     processed_data = preprocessor.run()
     
     print("\n처음 5행:")
@@ -239,4 +382,3 @@ if __name__ == '__main__':
     
     print("\n컬럼 목록:")
     print(processed_data.columns.tolist())
-
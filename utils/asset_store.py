@@ -0,0 +1,268 @@
+"""
+멀티 자산 시간별 저장소
+
+가격, 언급 수, 감성을 (asset, timestamp) 키의 long-format 한 테이블로 관리합니다.
+- 트위터 coin_name / 레딧 coin_name(coin_label=1)의 "BTC, ETH" 같은 다중 라벨은 자산별 행으로 분리
+- 소스별 집계는 자산 전체에 대해 groupby 한 번으로 처리
+- 점수/상관계수는 (시간 x 자산) 행렬에서 한 번에 계산 (자산 수만큼 파이프라인을 반복하지 않음)
+"""
+
+import numpy as np
+import pandas as pd
+
+from utils.composite_score import CompositeScoreCalculator, signal_level
+
+
+# 레딧 감성 라벨 -> 점수
+REDDIT_SENTIMENT = {'positive': 1.0, 'neutral': 0.0, 'negative': -1.0}
+
+
+def _hour(timestamps):
+    """타임스탬프를 타임존 없는 시간 단위로 내림"""
+    timestamps = pd.to_datetime(timestamps)
+    if timestamps.dt.tz is not None:
+        timestamps = timestamps.dt.tz_convert(None)
+    return timestamps.dt.floor('h')
+
+
+def _explode_assets(df, label_col='coin_name'):
+    """
+    다중 자산 라벨("BTC, ETH")을 자산별 행으로 분리
+    
+    Returns:
+        DataFrame: asset 컬럼이 추가된 데이터 (라벨 없는 행 제외)
+    """
+    labeled = df[df[label_col].notna()]
+    assets = labeled[label_col].astype(str).str.upper().str.split(',')
+    exploded = labeled.assign(asset=assets).explode('asset')
+    exploded['asset'] = exploded['asset'].str.strip()
+    return exploded[exploded['asset'] != '']
+
+
+class AssetHourlyStore:
+    """(asset, timestamp) 키의 시간별 가격/언급/감성 테이블"""
+    
+    def __init__(self, frame):
+        """
+        Args:
+            frame: asset, timestamp 컬럼을 가진 long-format 데이터
+        """
+        self.frame = frame.sort_values(['asset', 'timestamp']).reset_index(drop=True)
+    
+    @classmethod
+    def from_sources(cls, prices=None, twitter=None, reddit=None, assets=None):
+        """
+        소스 데이터로 저장소 생성
+        
+        Args:
+            prices: DataLoader.load_asset_prices() 결과 (asset, timestamp, close, volume, ...)
+            twitter: 트위터 데이터 (timestamp 또는 post_date, coin_name, sentiment_score, likes)
+            reddit: 레딧 데이터 (timestamp, coin_label, coin_name, sentiment, like_count)
+            assets: 포함할 자산 (None이면 소스에 나오는 전체 자산)
+        
+        Returns:
+            AssetHourlyStore
+        """
+        mention_rows = []
+        
+        if twitter is not None and not twitter.empty and 'coin_name' in twitter.columns:
+            time_col = 'post_date' if 'post_date' in twitter.columns else 'timestamp'
+            rows = _explode_assets(twitter)
+            mention_rows.append(pd.DataFrame({
+                'asset': rows['asset'],
+                'timestamp': _hour(rows[time_col]),
+                'sentiment': rows['sentiment_score'].astype(np.float64),
+                'likes': rows['likes'].fillna(0).astype(np.float64),
+                'twitter_mentions': 1,
+                'reddit_mentions': 0
+            }))
+        
+        if reddit is not None and not reddit.empty and 'coin_name' in reddit.columns:
+            rows = reddit[reddit['coin_label'] == 1] if 'coin_label' in reddit.columns else reddit
+            rows = _explode_assets(rows)
+            mention_rows.append(pd.DataFrame({
+                'asset': rows['asset'],
+                'timestamp': _hour(rows['timestamp']),
+                'sentiment': rows['sentiment'].map(REDDIT_SENTIMENT).astype(np.float64),
+                'likes': rows['like_count'].fillna(0).astype(np.float64),
+                'twitter_mentions': 0,
+                'reddit_mentions': 1
+            }))
+        
+        frames = []
+        
+        # 1. 언급: 자산 x 시간 groupby 한 번
+        if mention_rows:
+            mentions = pd.concat(mention_rows, ignore_index=True)
+            grouped = mentions.groupby(['asset', 'timestamp'])
+            frames.append(pd.DataFrame({
+                'mentions': grouped.size(),
+                'twitter_mentions': grouped['twitter_mentions'].sum(),
+                'reddit_mentions': grouped['reddit_mentions'].sum(),
+                'sentiment': grouped['sentiment'].mean(),
+                'likes': grouped['likes'].sum()
+            }))
+        
+        # 2. 가격: 자산 x 시간별 마지막 값 (거래량은 합계)
+        if prices is not None and not prices.empty:
+            prices = prices.assign(timestamp=_hour(prices['timestamp']))
+            grouped = prices.sort_values('timestamp').groupby(['asset', 'timestamp'])
+            price_frame = grouped[['close']].last()
+            if 'volume' in prices.columns:
+                price_frame['volume'] = grouped['volume'].sum()
+            frames.append(price_frame)
+        
+        if not frames:
+            return cls(pd.DataFrame(columns=['asset', 'timestamp']))
+        
+        frame = pd.concat(frames, axis=1).reset_index()
+        
+        # 언급이 없는 시간은 0건
+        for col in ['mentions', 'twitter_mentions', 'reddit_mentions', 'likes']:
+            if col in frame.columns:
+                frame[col] = frame[col].fillna(0)
+        
+        if assets is not None:
+            frame = frame[frame['asset'].isin([asset.upper() for asset in assets])]
+        
+        return cls(frame)
+    
+    @classmethod
+    def from_loader(cls, loader=None, assets=None):
+        """
+        DataLoader로 가격/트위터/레딧을 읽어 저장소 생성
+        
+        Args:
+            loader: DataLoader (기본: DataLoader())
+            assets: 포함할 자산 (None이면 전체)
+        """
+        if loader is None:
+            from utils.data_loader import DataLoader
+            loader = DataLoader()
+        
+        return cls.from_sources(
+            prices=loader.load_asset_prices(assets, projection=['close', 'volume']),
+            twitter=loader.load_twitter_data(projection=['coin_name', 'sentiment_score', 'likes']),
+            reddit=loader.load_reddit_data(projection=['coin_label', 'coin_name', 'sentiment', 'like_count']),
+            assets=assets
+        )
+    
+    @property
+    def assets(self):
+        """저장소의 자산 목록"""
+        return sorted(self.frame['asset'].unique())
+    
+    def wide(self, column, fill=None):
+        """
+        (시간 x 자산) 행렬
+        
+        Args:
+            column: 값 컬럼
+            fill: 결측 채울 값 (None이면 NaN 유지)
+        
+        Returns:
+            DataFrame: 연속된 시간 인덱스 x 자산 컬럼
+        """
+        if column not in self.frame.columns or self.frame.empty:
+            return pd.DataFrame()
+        
+        wide = self.frame.pivot(index='timestamp', columns='asset', values=column)
+        wide = wide.reindex(pd.date_range(wide.index.min(), wide.index.max(), freq='h'))
+        wide.index.name = 'timestamp'
+        wide.columns.name = None
+        
+        return wide if fill is None else wide.fillna(fill)
+    
+    def score(self, weights=None, window_hours=24):
+        """
+        자산별 점수를 한 번에 계산 (트위터 점수와 같은 식: 언급량 정규화 + 감성)
+        
+        Args:
+            weights: {'mentions', 'sentiment'} 가중치 (기본: 0.5, 0.5)
+            window_hours: 언급량 롤링 윈도우 (시간)
+        
+        Returns:
+            DataFrame: asset, timestamp, mention_score, sentiment_score, composite_score, signal_level
+        """
+        weights = weights or {'mentions': 0.5, 'sentiment': 0.5}
+        
+        mentions = self.wide('mentions', fill=0)
+        if mentions.empty:
+            return pd.DataFrame(columns=['asset', 'timestamp', 'mention_score', 'sentiment_score',
+                                         'composite_score', 'signal_level'])
+        
+        # 언급량: 자산별 롤링 평균 ± 롤링 평균의 전체 표준편차 (모든 자산 열을 한 번에)
+        rolling = mentions.rolling(window=window_hours, min_periods=1).mean()
+        band = rolling.std().to_numpy()
+        mention_score = CompositeScoreCalculator._normalize_band(
+            mentions.to_numpy(), rolling.to_numpy() - band, rolling.to_numpy() + band
+        )
+        
+        # 감성: -1~1 -> 0~1 (언급 없는 시간은 중립)
+        sentiment = self.wide('sentiment').reindex_like(mentions).to_numpy()
+        sentiment_score = np.where(np.isnan(sentiment), 0.5, (sentiment + 1) / 2)
+        
+        composite = (mention_score * weights['mentions'] + sentiment_score * weights['sentiment']) * 100
+        
+        shape = mentions.shape
+        return pd.DataFrame({
+            'asset': np.tile(mentions.columns.to_numpy(), shape[0]),
+            'timestamp': np.repeat(mentions.index.to_numpy(), shape[1]),
+            'mention_score': mention_score.ravel() * 100,
+            'sentiment_score': sentiment_score.ravel() * 100,
+            'composite_score': composite.ravel(),
+            'signal_level': signal_level(composite.ravel())
+        }).sort_values(['asset', 'timestamp'], ignore_index=True)
+    
+    def correlations(self, features=('mentions', 'sentiment', 'likes'), horizon=0):
+        """
+        자산별 특성과 가격 수익률의 상관계수 (모든 자산을 한 번에)
+        
+        Args:
+            features: 상관을 볼 컬럼
+            horizon: 0이면 같은 시간 수익률, n이면 n시간 뒤까지의 전방 수익률
+        
+        Returns:
+            DataFrame: 자산 x 특성 피어슨 상관계수 (쌍별 결측 제외, 유효 시간 2개 미만이면 NaN)
+        """
+        close = self.wide('close')
+        if close.empty:
+            return pd.DataFrame(columns=list(features))
+        
+        close = close.ffill()
+        if horizon:
+            returns = close.shift(-horizon) / close - 1
+        else:
+            returns = close.pct_change(fill_method=None)
+        y = returns.to_numpy()
+        
+        result = {}
+        for feature in features:
+            x = self.wide(feature).reindex(index=close.index, columns=close.columns).to_numpy()
+            if feature != 'sentiment':
+                x = np.nan_to_num(x)
+            
+            valid = ~np.isnan(x) & ~np.isnan(y)
+            n = valid.sum(axis=0)
+            xv = np.where(valid, x, 0.0)
+            yv = np.where(valid, y, 0.0)
+            
+            with np.errstate(invalid='ignore', divide='ignore'):
+                x_mean = xv.sum(axis=0) / n
+                y_mean = yv.sum(axis=0) / n
+                xc = np.where(valid, x - x_mean, 0.0)
+                yc = np.where(valid, y - y_mean, 0.0)
+                corr = (xc * yc).sum(axis=0) / np.sqrt((xc * xc).sum(axis=0) * (yc * yc).sum(axis=0))
+            
+            result[feature] = np.where(n >= 2, corr, np.nan)
+        
+        return pd.DataFrame(result, index=close.columns)
+    
+    def to_csv(self, path):
+        """long-format CSV로 저장"""
+        self.frame.to_csv(path, index=False)
+    
+    @classmethod
+    def read_csv(cls, path):
+        """to_csv로 저장한 파일 로드"""
+        return cls(pd.read_csv(path, parse_dates=['timestamp']))
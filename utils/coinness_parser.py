@@ -0,0 +1,227 @@
+"""
+코인니스 기사 파싱 파이프라인
+
+Selenium 수집기(collect_coinness_selenium, collect_coinness_infinite_scroll)가 공유합니다.
+- 브라우저에서 새로 추가된 기사 노드(outerHTML)만 가져와 파싱 (매번 전체 DOM을 다시 파싱하지 않음)
+- 기사 노드 묶음은 프로세스 풀에서 파싱하여 브라우저 대기 시간과 겹치게 실행
+- 수집한 기사와 진행 위치를 체크포인트 파일에 기록하여 중단 후 이어서 수집
+"""
+
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import pandas as pd
+from bs4 import BeautifulSoup
+
+
+# 기사 노드 선택자 (styled-components 해시가 바뀌어도 접두어로 찾음)
+ARTICLE_SELECTOR = 'a[class*="ArticleWrapper"]'
+
+# 현재 기사 노드 수
+COUNT_ARTICLES_JS = "return document.querySelectorAll(arguments[0]).length;"
+
+# arguments[1]번째 이후 기사 노드의 outerHTML (새로 추가된 노드만)
+NEW_ARTICLES_JS = (
+    "return Array.from(document.querySelectorAll(arguments[0]))"
+    ".slice(arguments[1]).map(function (node) { return node.outerHTML; });"
+)
+
+
+def parse_time_with_date(time_str, date_str):
+    """
+    시간과 날짜 문자열을 datetime으로 변환
+    
+    Args:
+        time_str: 시간 문자열 (예: "13:30")
+        date_str: 날짜 문자열 (예: "2025년 11월 30일 일요일")
+    
+    Returns:
+        datetime: 파싱된 시간 (실패 시 현재 시각)
+    """
+    now = datetime.now()
+    
+    try:
+        if '년' in date_str and '월' in date_str and '일' in date_str:
+            numbers = re.findall(r'\d+', date_str)
+            
+            if len(numbers) >= 3:
+                year = int(numbers[0])
+                month = int(numbers[1])
+                day = int(numbers[2])
+                
+                if ':' in time_str:
+                    time_parts = time_str.split(':')
+                    hour = int(time_parts[0])
+                    minute = int(time_parts[1]) if len(time_parts) > 1 else 0
+                else:
+                    hour = 0
+                    minute = 0
+                
+                return datetime(year, month, day, hour, minute)
+        
+        return now
+    
+    except Exception:
+        return now
+
+
+def parse_article_node(article):
+    """
+    기사 노드(a 태그) 하나를 파싱
+    
+    Returns:
+        dict: {'timestamp', 'title', 'content', 'link'} 또는 None (제목 없음)
+    """
+    link = article.get('href', '')
+    
+    title_elem = article.find('h3', class_=lambda x: x and 'ArticleTitle' in x)
+    if not title_elem:
+        return None
+    title = title_elem.get_text(strip=True)
+    
+    time_wrap = article.find('div', class_=lambda x: x and 'TimeWrap' in x)
+    if time_wrap:
+        time_badge = time_wrap.find('span', class_='time-badge')
+        time_str = time_badge.get_text(strip=True) if time_badge else ''
+        date_text = time_wrap.get_text(strip=True).replace(time_str, '').strip()
+    else:
+        time_str = ''
+        date_text = ''
+    
+    content_elem = article.find('p', class_=lambda x: x and 'ArticleDesc' in x)
+    content = content_elem.get_text(strip=True) if content_elem else ''
+    
+    return {
+        'timestamp': parse_time_with_date(time_str, date_text),
+        'title': title,
+        'content': content,
+        'link': link,
+    }
+
+
+def parse_article_fragments(fragments):
+    """
+    기사 노드 outerHTML 묶음 파싱 (프로세스 풀 워커)
+    
+    Args:
+        fragments: 기사 노드 outerHTML 리스트
+    
+    Returns:
+        list: 파싱된 기사 dict 리스트 (입력 순서 유지)
+    """
+    soup = BeautifulSoup(''.join(fragments), 'html.parser')
+    articles = []
+    
+    for node in soup.find_all('a', class_=lambda x: x and 'ArticleWrapper' in x):
+        try:
+            article = parse_article_node(node)
+        except Exception:
+            continue
+        if article:
+            articles.append(article)
+    
+    return articles
+
+
+class ArticleParserPool:
+    """기사 노드 묶음을 프로세스 풀에서 파싱"""
+    
+    def __init__(self, max_workers=None, chunk_size=50):
+        """
+        Args:
+            max_workers: 워커 프로세스 수 (None이면 CPU 수)
+            chunk_size: 워커 하나에 넘기는 최대 노드 수
+        """
+        self.executor = ProcessPoolExecutor(max_workers=max_workers)
+        self.chunk_size = chunk_size
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.executor.shutdown(cancel_futures=True)
+    
+    def submit(self, fragments):
+        """
+        노드 묶음 파싱 요청
+        
+        Returns:
+            list: chunk별 Future 리스트 (collect에 넘겨 결과를 순서대로 받음)
+        """
+        return [
+            self.executor.submit(parse_article_fragments, fragments[i:i + self.chunk_size])
+            for i in range(0, len(fragments), self.chunk_size)
+        ]
+    
+    @staticmethod
+    def collect(futures):
+        """submit 결과를 순서대로 합쳐서 반환"""
+        return [article for future in futures for article in future.result()]
+
+
+class ArticleCheckpoint:
+    """
+    수집 진행 체크포인트
+    
+    {path}.csv에 수집한 기사를 이어 쓰고, {path}.json에 진행 위치(페이지, 파싱한 노드 수 등)를 기록합니다.
+    """
+    
+    def __init__(self, path):
+        """
+        Args:
+            path: 체크포인트 파일 경로 (확장자 제외)
+        """
+        self.articles_path = f'{path}.csv'
+        self.state_path = f'{path}.json'
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    
+    def load(self):
+        """
+        이전 체크포인트 로드
+        
+        Returns:
+            tuple: (state dict, 기사 dict 리스트) - 없으면 ({}, [])
+        """
+        if not os.path.exists(self.state_path):
+            return {}, []
+        
+        with open(self.state_path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        
+        articles = []
+        if os.path.exists(self.articles_path):
+            df = pd.read_csv(self.articles_path, encoding='utf-8-sig', keep_default_na=False)
+            df['timestamp'] = pd.to_datetime(df['timestamp'])
+            articles = [
+                {**row, 'timestamp': row['timestamp'].to_pydatetime()}
+                for row in df.to_dict('records')
+            ]
+        
+        return state, articles
+    
+    def save(self, new_articles, **state):
+        """
+        새 기사를 이어 쓰고 진행 위치 갱신
+        
+        기사를 먼저 기록한 뒤 상태 파일을 교체하므로, 중간에 중단되어도 상태는 기록된 기사까지만 가리킵니다.
+        """
+        if new_articles:
+            first = not os.path.exists(self.articles_path)
+            pd.DataFrame(new_articles).to_csv(
+                self.articles_path, mode='a', header=first, index=False,
+                encoding='utf-8-sig' if first else 'utf-8'
+            )
+        
+        tmp_path = f'{self.state_path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(tmp_path, self.state_path)
+    
+    def clear(self):
+        """수집 완료 후 체크포인트 삭제"""
+        for path in [self.articles_path, self.state_path]:
+            if os.path.exists(path):
+                os.remove(path)
@@ -2,11 +2,37 @@
 종합 점수 계산 시스템
 
 텔레그램, 뉴스, 트위터 데이터를 통합하여 종합 시장 신호 점수 계산
+- CompositeScoreCalculator: 전체 기간 점수 계산
+- IncrementalCompositeScorer: 롤링 상태를 저장해 두고 새로 들어온 시간만 계산
+- WeightSweep: 소스별 점수를 한 번 계산해 두고 여러 가중치 조합을 한 번에 평가
 """
 
+import math
+import os
+import threading
+
 import pandas as pd
 import numpy as np
-from datetime import timedelta
+
+
+# 신호 레벨 경계 (이상이면 다음 레벨)
+SIGNAL_BINS = [25, 40, 60, 75]
+SIGNAL_LEVELS = np.array(['strong_bearish', 'bearish', 'neutral', 'bullish', 'strong_bullish'])
+
+
+def signal_level(score):
+    """
+    점수 -> 신호 레벨
+    
+    Args:
+        score: 종합 점수 (스칼라 또는 배열)
+    
+    Returns:
+        str 또는 ndarray: 신호 레벨 (NaN은 strong_bearish)
+    """
+    score = np.asarray(score, dtype=np.float64)
+    levels = SIGNAL_LEVELS[np.digitize(np.nan_to_num(score, nan=-np.inf), SIGNAL_BINS)]
+    return levels.item() if levels.ndim == 0 else levels
 
 
 class CompositeScoreCalculator:
@@ -36,6 +62,69 @@ class CompositeScoreCalculator:
             return 0.5
         return np.clip((value - min_val) / (max_val - min_val), 0, 1)
     
+    @staticmethod
+    def _normalize_band(value, lower, upper):
+        """normalize_score의 배열 버전 (NaN은 0.5, 0-1로 제한)"""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            result = (value - lower) / (upper - lower + 1e-10)
+        return np.clip(np.where(np.isnan(result), 0.5, result), 0, 1)
+    
+    @staticmethod
+    def _rolling_mean_std(values, window=24):
+        """rolling(window, min_periods=1)의 평균과 표준편차 (ndarray)"""
+        rolling = pd.Series(values).rolling(window=window, min_periods=1)
+        return rolling.mean().to_numpy(), rolling.std().to_numpy()
+    
+    @staticmethod
+    def _hours(timestamps):
+        """타임스탬프 -> 정수 시간 버킷 (epoch 기준 시간, floor('H')와 같음)"""
+        timestamps = pd.Series(timestamps)
+        if not pd.api.types.is_datetime64_any_dtype(timestamps):
+            timestamps = pd.to_datetime(timestamps)
+        return timestamps.to_numpy(dtype='datetime64[ns]').astype('datetime64[h]').astype(np.int64)
+    
+    def _bucket_hourly(self, timestamps, values=None):
+        """
+        소스 데이터를 시간 버킷으로 한 번에 집계
+        
+        Args:
+            timestamps: 소스 타임스탬프
+            values: {이름: 값 배열} (버킷별 합계와 유효 개수를 계산)
+        
+        Returns:
+            tuple: (정렬된 시간 버킷, 버킷별 행 수, {이름: (합계, 유효 개수)})
+        """
+        valid = pd.Series(timestamps).notna().to_numpy()
+        hours = self._hours(timestamps)[valid]
+        
+        buckets, inverse = np.unique(hours, return_inverse=True)
+        counts = np.bincount(inverse, minlength=len(buckets))
+        
+        sums = {}
+        for name, column in (values or {}).items():
+            column = np.asarray(column, dtype=np.float64)[valid]
+            present = ~np.isnan(column)
+            sums[name] = (
+                np.bincount(inverse, weights=np.where(present, column, 0.0), minlength=len(buckets)),
+                np.bincount(inverse, weights=present.astype(np.float64), minlength=len(buckets))
+            )
+        
+        return buckets, counts, sums
+    
+    @staticmethod
+    def _align(main_hours, buckets):
+        """
+        메인 데이터 시간에 해당하는 버킷 위치 (한 번의 searchsorted)
+        
+        Returns:
+            tuple: (버킷 위치, 해당 버킷 존재 여부)
+        """
+        if len(buckets) == 0:
+            return np.zeros(len(main_hours), dtype=np.int64), np.zeros(len(main_hours), dtype=bool)
+        
+        position = np.minimum(np.searchsorted(buckets, main_hours), len(buckets) - 1)
+        return position, buckets[position] == main_hours
+    
     def calculate_telegram_score(self, df, window_hours=24):
         """
         텔레그램 신호 점수 계산
@@ -43,167 +132,162 @@ class CompositeScoreCalculator:
         Args:
             df: 전처리된 데이터프레임
             window_hours: 평가 윈도우 (시간)
-            
+        
         Returns:
             Series: 텔레그램 점수 (0-100)
         """
         if 'message_count' not in df.columns:
-            return pd.Series(50, index=df.index)  # 중립
-        
-        # 1. 메시지 수 정규화
-        msg_rolling = df['message_count'].rolling(window=window_hours, min_periods=1).mean()
-        msg_score = self.normalize_score(
-            df['message_count'], 
-            msg_rolling - msg_rolling.std(), 
-            msg_rolling + msg_rolling.std()
-        )
+            return pd.Series(50.0, index=df.index)  # 중립
+        
+        messages = df['message_count'].to_numpy(dtype=np.float64)
+        
+        # 1. 메시지 수 정규화 (이동 평균 ± 이동 평균 전체의 표준편차)
+        msg_rolling, _ = self._rolling_mean_std(messages, window_hours)
+        msg_std = np.nanstd(msg_rolling, ddof=1) if np.count_nonzero(~np.isnan(msg_rolling)) > 1 else np.nan
+        msg_score = self._normalize_band(messages, msg_rolling - msg_std, msg_rolling + msg_std)
         
         # 2. 감정 점수 (있으면)
         if 'avg_sentiment' in df.columns:
-            sentiment_score = (df['avg_sentiment'] + 1) / 2  # -1~1 -> 0~1
+            sentiment_score = (df['avg_sentiment'].to_numpy(dtype=np.float64) + 1) / 2  # -1~1 -> 0~1
         else:
             sentiment_score = 0.5
         
-        # 3. 변화율
-        msg_change = df['message_count'].pct_change().fillna(0)
-        change_score = np.clip((msg_change + 1) / 2, 0, 1)
+        # 3. 변화율 (결측은 직전 값으로 채운 뒤 계산)
+        filled = pd.Series(messages).ffill().to_numpy()
+        previous = np.concatenate([[np.nan], filled[:-1]])
+        with np.errstate(invalid='ignore', divide='ignore'):
+            msg_change = filled / previous - 1
+        change_score = np.clip((np.where(np.isnan(msg_change), 0, msg_change) + 1) / 2, 0, 1)
         
         # 종합 (0-100)
         telegram_score = (msg_score * 0.4 + sentiment_score * 0.4 + change_score * 0.2) * 100
         
-        return telegram_score.fillna(50)
+        return pd.Series(telegram_score, index=df.index).fillna(50)
     
     def calculate_news_score(self, df_news, df_main):
         """
         뉴스 신호 점수 계산
         
         Args:
-            df_news: 코인니스 뉴스 데이터
+            df_news: 코인니스 뉴스 데이터 (변경하지 않음)
             df_main: 메인 데이터프레임 (시간 인덱스)
-            
+        
         Returns:
             Series: 뉴스 점수 (0-100)
         """
         if df_news.empty:
-            return pd.Series(50, index=df_main.index)
-        
-        # 시간당 뉴스 수 집계
-        df_news['hour'] = df_news['timestamp'].dt.floor('H')
-        news_count = df_news.groupby('hour').size().reset_index(name='news_count')
+            return pd.Series(50.0, index=df_main.index)
         
-        # 메인 데이터와 병합
-        df_temp = df_main[['timestamp']].copy()
-        df_temp['hour'] = df_temp['timestamp'].dt.floor('H')
-        df_temp = df_temp.merge(news_count, on='hour', how='left')
-        df_temp['news_count'] = df_temp['news_count'].fillna(0)
+        # 시간당 뉴스 수 -> 메인 데이터 시간에 정렬
+        buckets, counts, _ = self._bucket_hourly(df_news['timestamp'])
+        position, found = self._align(self._hours(df_main['timestamp']), buckets)
+        news_count = np.where(found, counts[position], 0).astype(np.float64)
         
         # 정규화
-        rolling_mean = df_temp['news_count'].rolling(window=24, min_periods=1).mean()
-        rolling_std = df_temp['news_count'].rolling(window=24, min_periods=1).std()
+        rolling_mean, rolling_std = self._rolling_mean_std(news_count)
+        news_score = self._normalize_band(news_count, rolling_mean - rolling_std, rolling_mean + rolling_std)
         
-        news_score = self.normalize_score(
-            df_temp['news_count'],
-            rolling_mean - rolling_std,
-            rolling_mean + rolling_std
-        )
-        
-        return (news_score * 100).fillna(50)
+        return pd.Series(news_score * 100, index=df_main.index).fillna(50)
     
     def calculate_twitter_score(self, df_twitter, df_main):
         """
         트위터 신호 점수 계산
         
         Args:
-            df_twitter: 트위터 데이터
+            df_twitter: 트위터 데이터 (post_date 또는 DataLoader의 timestamp 컬럼, 변경하지 않음)
             df_main: 메인 데이터프레임
-            
+        
         Returns:
             Series: 트위터 점수 (0-100)
         """
-        if df_twitter.empty or 'post_date' not in df_twitter.columns:
-            return pd.Series(50, index=df_main.index)
-        
-        # 시간당 트윗 수 집계
-        df_twitter['hour'] = df_twitter['post_date'].dt.floor('H')
-        twitter_agg = df_twitter.groupby('hour').agg({
-            'likes': 'sum',
-            'sentiment_score': 'mean'
-        }).reset_index()
-        
-        # 메인 데이터와 병합
-        df_temp = df_main[['timestamp']].copy()
-        df_temp['hour'] = df_temp['timestamp'].dt.floor('H')
-        df_temp = df_temp.merge(twitter_agg, on='hour', how='left')
-        df_temp['likes'] = df_temp['likes'].fillna(0)
-        df_temp['sentiment_score'] = df_temp['sentiment_score'].fillna(0)
+        time_col = 'post_date' if 'post_date' in df_twitter.columns else 'timestamp'
+        if df_twitter.empty or time_col not in df_twitter.columns:
+            return pd.Series(50.0, index=df_main.index)
+        
+        # 시간당 좋아요 합계 / 평균 감정 -> 메인 데이터 시간에 정렬
+        buckets, _, sums = self._bucket_hourly(df_twitter[time_col], {
+            'likes': df_twitter['likes'],
+            'sentiment_score': df_twitter['sentiment_score']
+        })
+        position, found = self._align(self._hours(df_main['timestamp']), buckets)
+        
+        likes_sum, _ = sums['likes']
+        sentiment_sum, sentiment_count = sums['sentiment_score']
+        likes = np.where(found, likes_sum[position], 0.0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            sentiment_mean = sentiment_sum / sentiment_count
+        sentiment = np.where(found, sentiment_mean[position], np.nan)
+        sentiment = np.where(np.isnan(sentiment), 0.0, sentiment)
         
         # 정규화
-        likes_rolling = df_temp['likes'].rolling(window=24, min_periods=1).mean()
-        likes_score = self.normalize_score(
-            df_temp['likes'],
-            likes_rolling - likes_rolling.std(),
-            likes_rolling + likes_rolling.std()
-        )
+        likes_rolling, _ = self._rolling_mean_std(likes)
+        likes_std = np.std(likes_rolling, ddof=1) if len(likes_rolling) > 1 else np.nan
+        likes_score = self._normalize_band(likes, likes_rolling - likes_std, likes_rolling + likes_std)
         
-        sentiment_score = (df_temp['sentiment_score'] + 1) / 2  # -1~1 -> 0~1
+        sentiment_score = (sentiment + 1) / 2  # -1~1 -> 0~1
         
         twitter_score = (likes_score * 0.5 + sentiment_score * 0.5) * 100
         
-        return twitter_score.fillna(50)
+        return pd.Series(twitter_score, index=df_main.index).fillna(50)
     
-    def calculate_composite_score(self, df, df_news=None, df_twitter=None):
+    def calculate_subscores(self, df, df_news=None, df_twitter=None):
         """
-        종합 점수 계산
+        소스별 점수 계산 (가중치와 무관한 기저 행렬)
         
         Args:
             df: 메인 전처리 데이터
             df_news: 코인니스 뉴스 데이터
             df_twitter: 트위터 데이터
-            
+        
         Returns:
-            DataFrame: 종합 점수가 추가된 데이터
+            DataFrame: telegram_score, news_score, twitter_score (df와 같은 인덱스)
         """
-        df_result = df.copy()
-        
         # None을 빈 DataFrame으로 변환
-        if df_news is None or (isinstance(df_news, pd.DataFrame) and df_news.empty):
+        if df_news is None:
             df_news = pd.DataFrame()
-        if df_twitter is None or (isinstance(df_twitter, pd.DataFrame) and df_twitter.empty):
+        if df_twitter is None:
             df_twitter = pd.DataFrame()
         
+        return pd.DataFrame({
+            'telegram_score': self.calculate_telegram_score(df).to_numpy(),
+            'news_score': self.calculate_news_score(df_news, df).to_numpy(),
+            'twitter_score': self.calculate_twitter_score(df_twitter, df).to_numpy()
+        }, index=df.index)
+    
+    def calculate_composite_score(self, df, df_news=None, df_twitter=None):
+        """
+        종합 점수 계산
+        
+        각 소스를 시간 버킷으로 한 번만 집계하고 메인 데이터 시간에 인덱스로 정렬합니다.
+        입력 데이터프레임은 변경하지 않습니다.
+        
+        Args:
+            df: 메인 전처리 데이터
+            df_news: 코인니스 뉴스 데이터
+            df_twitter: 트위터 데이터
+        
+        Returns:
+            DataFrame: 종합 점수가 추가된 데이터
+        """
         # 각 소스별 점수 계산
-        telegram_score = self.calculate_telegram_score(df_result)
-        news_score = self.calculate_news_score(df_news, df_result)
-        twitter_score = self.calculate_twitter_score(df_twitter, df_result)
+        scores = self.calculate_subscores(df, df_news, df_twitter)
         
         # 종합 점수 (가중 평균)
         composite_score = (
-            telegram_score * self.weights['telegram'] +
-            news_score * self.weights['news'] +
-            twitter_score * self.weights['twitter']
+            scores['telegram_score'] * self.weights['telegram'] +
+            scores['news_score'] * self.weights['news'] +
+            scores['twitter_score'] * self.weights['twitter']
         )
         
-        # 신호 레벨 결정
-        def get_signal_level(score):
-            if score >= 75:
-                return 'strong_bullish'
-            elif score >= 60:
-                return 'bullish'
-            elif score >= 40:
-                return 'neutral'
-            elif score >= 25:
-                return 'bearish'
-            else:
-                return 'strong_bearish'
+        # 결과 추가 (점수 컬럼을 한 번에 붙임)
+        scores['composite_score'] = composite_score
+        scores['signal_level'] = signal_level(composite_score.to_numpy())
         
-        # 결과 추가
-        df_result['telegram_score'] = telegram_score
-        df_result['news_score'] = news_score
-        df_result['twitter_score'] = twitter_score
-        df_result['composite_score'] = composite_score
-        df_result['signal_level'] = composite_score.apply(get_signal_level)
+        existing = df.columns.intersection(scores.columns)
+        if len(existing):
+            df = df.drop(columns=existing)
         
-        return df_result
+        return pd.concat([df, scores], axis=1)
     
     def get_signal_summary(self, df, recent_hours=24):
         """
@@ -212,7 +296,7 @@ class CompositeScoreCalculator:
         Args:
             df: 종합 점수가 계산된 데이터
             recent_hours: 최근 몇 시간
-            
+        
         Returns:
             dict: 신호 요약
         """
@@ -230,16 +314,7 @@ class CompositeScoreCalculator:
         
         # signal_level이 없으면 계산
         if 'signal_level' not in df.columns:
-            if current_score >= 75:
-                current_level = 'strong_bullish'
-            elif current_score >= 60:
-                current_level = 'bullish'
-            elif current_score >= 40:
-                current_level = 'neutral'
-            elif current_score >= 25:
-                current_level = 'bearish'
-            else:
-                current_level = 'strong_bearish'
+            current_level = signal_level(current_score)
         else:
             current_level = df['signal_level'].iloc[-1]
         
@@ -274,6 +349,547 @@ class CompositeScoreCalculator:
         }
 
 
+class IncrementalCompositeScorer:
+    """
+    새로 들어온 시간만 계산하는 종합 점수기
+    
+    소스별 롤링 상태(최근 window-1시간의 메시지 수/뉴스 수/좋아요 합계, 이동 평균의 누적 통계)와
+    지금까지 계산한 소스별 점수를 디스크에 저장해 두고, update()에서는 마지막으로 계산한 시간
+    이후의 행만 계산합니다.
+    - latest(): 마지막 점수와 24시간 변화량 (O(1))
+    - history(): 저장된 점수 시계열 (차트용, 재계산 없음)
+    
+    각 시간의 점수는 그 시간까지의 데이터만으로 계산합니다. 마지막 시간의 점수는
+    CompositeScoreCalculator로 전체를 다시 계산한 값과 같고, 과거 시간의 점수는 전체 재계산과
+    달리 이후 데이터의 영향을 받지 않습니다.
+    
+    이미 계산한 구간의 소스 데이터 지문(행 수, 최대 시각, 값 합계)도 함께 저장하여, 뒤늦게 들어온
+    뉴스/트윗(백필)이나 수정된 메인 데이터가 있으면 처음부터 다시 계산합니다.
+    """
+    
+    # 저장 형식/계산 방식 버전 (바뀌면 상태를 버리고 다시 계산)
+    STATE_VERSION = 2
+    
+    SOURCES = ['telegram', 'news', 'twitter']
+    
+    def __init__(self, weights=None, state_path=None, window_hours=24):
+        """
+        Args:
+            weights: 소스별 가중치 (기본: CompositeScoreCalculator 기본값)
+            state_path: 상태 파일 경로 (기본: data/.cache/composite_score.npz)
+            window_hours: 롤링 윈도우 (시간)
+        """
+        if state_path is None:
+            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            state_path = os.path.join(base_dir, 'data', '.cache', 'composite_score.npz')
+        
+        self.calculator = CompositeScoreCalculator(weights)
+        self.state_path = state_path
+        self.window = window_hours
+        self._lock = threading.Lock()
+        
+        self.reset()
+        self._load()
+    
+    @property
+    def weights(self):
+        return self.calculator.weights
+    
+    def reset(self):
+        """저장된 상태를 비우고 처음부터 계산하도록 초기화"""
+        self.hours = np.empty(0, dtype=np.int64)
+        self.scores = {source: np.empty(0) for source in self.SOURCES}
+        
+        # 롤링 윈도우에 이어 붙일 최근 원시 값 (최대 window-1개)
+        self.tails = {
+            'message_count': np.empty(0),
+            'news_count': np.empty(0),
+            'likes': np.empty(0)
+        }
+        # 이동 평균의 누적 (개수, 평균, M2) - 전체 기간 표준편차용
+        self.stats = {'message_count': (0, 0.0, 0.0), 'likes': (0, 0.0, 0.0)}
+        # 변화율 계산용 직전 메시지 수 (결측은 직전 값으로 채운 값)
+        self.last_message_count = np.nan
+        # 계산을 마친 구간의 소스별 데이터 지문
+        self.fingerprints = {source: '' for source in self.SOURCES}
+    
+    def _load(self):
+        """저장된 상태 로드 (없거나 버전/윈도우가 다르면 무시)"""
+        if not os.path.exists(self.state_path):
+            return
+        
+        try:
+            with np.load(self.state_path) as state:
+                if int(state['version']) != self.STATE_VERSION or int(state['window']) != self.window:
+                    return
+                
+                self.hours = state['hours']
+                self.scores = {source: state[f'score_{source}'] for source in self.SOURCES}
+                self.tails = {name: state[f'tail_{name}'] for name in self.tails}
+                self.stats = {name: tuple(state[f'stats_{name}'].tolist()) for name in self.stats}
+                self.last_message_count = float(state['last_message_count'])
+                self.fingerprints = {source: str(state[f'fingerprint_{source}']) for source in self.SOURCES}
+        except Exception as e:
+            print(f"경고: 종합 점수 상태 로드 실패, 처음부터 다시 계산합니다 - {e}")
+            self.reset()
+    
+    def save(self):
+        """상태 저장 (임시 파일에 쓰고 교체)"""
+        os.makedirs(os.path.dirname(os.path.abspath(self.state_path)), exist_ok=True)
+        
+        arrays = {
+            'version': np.int64(self.STATE_VERSION),
+            'window': np.int64(self.window),
+            'hours': self.hours,
+            'last_message_count': np.float64(self.last_message_count),
+        }
+        arrays.update({f'score_{source}': values for source, values in self.scores.items()})
+        arrays.update({f'tail_{name}': values for name, values in self.tails.items()})
+        arrays.update({f'stats_{name}': np.array(stats, dtype=np.float64) for name, stats in self.stats.items()})
+        arrays.update({f'fingerprint_{source}': np.str_(value) for source, value in self.fingerprints.items()})
+        
+        tmp_path = f'{self.state_path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_path, self.state_path)
+    
+    def _rolling(self, name, values):
+        """저장된 꼬리 + 새 값으로 롤링 평균/표준편차 (새 값 구간만) 계산 후 꼬리 갱신"""
+        extended = np.concatenate([self.tails[name], values])
+        mean, std = self.calculator._rolling_mean_std(extended, self.window)
+        self.tails[name] = extended[-(self.window - 1):] if self.window > 1 else extended[:0]
+        return mean[-len(values):], std[-len(values):]
+    
+    def _expanding_std(self, name, values):
+        """
+        저장된 누적 통계에 이어서 각 위치까지의 표본 표준편차 (NaN 제외) 계산 후 통계 갱신
+        
+        저장된 평균만큼 이동한 값의 누적합으로 계산하여 자릿수 손실을 줄입니다.
+        """
+        count, mean, m2 = self.stats[name]
+        valid = ~np.isnan(values)
+        shifted = np.where(valid, values - mean, 0.0)
+        
+        n = count + np.cumsum(valid)
+        s1 = np.cumsum(shifted)
+        s2 = m2 + np.cumsum(shifted * shifted)
+        
+        with np.errstate(invalid='ignore', divide='ignore'):
+            variance = (s2 - s1 * s1 / n) / (n - 1)
+        std = np.where(n > 1, np.sqrt(np.maximum(variance, 0)), np.nan)
+        
+        if n[-1] > 0:
+            self.stats[name] = (int(n[-1]), mean + s1[-1] / n[-1], s2[-1] - s1[-1] ** 2 / n[-1])
+        
+        return std
+    
+    def _telegram_scores(self, df_new):
+        """새 시간의 텔레그램 점수 (calculate_telegram_score와 같은 식)"""
+        if 'message_count' not in df_new.columns:
+            self._rolling('message_count', np.full(len(df_new), np.nan))
+            return np.full(len(df_new), 50.0)
+        
+        messages = df_new['message_count'].to_numpy(dtype=np.float64)
+        
+        msg_rolling, _ = self._rolling('message_count', messages)
+        msg_std = self._expanding_std('message_count', msg_rolling)
+        msg_score = self.calculator._normalize_band(messages, msg_rolling - msg_std, msg_rolling + msg_std)
+        
+        if 'avg_sentiment' in df_new.columns:
+            sentiment_score = (df_new['avg_sentiment'].to_numpy(dtype=np.float64) + 1) / 2
+        else:
+            sentiment_score = 0.5
+        
+        filled = pd.Series(np.concatenate([[self.last_message_count], messages])).ffill().to_numpy()
+        self.last_message_count = filled[-1]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            msg_change = filled[1:] / filled[:-1] - 1
+        change_score = np.clip((np.where(np.isnan(msg_change), 0, msg_change) + 1) / 2, 0, 1)
+        
+        score = (msg_score * 0.4 + sentiment_score * 0.4 + change_score * 0.2) * 100
+        return np.where(np.isnan(score), 50.0, score)
+    
+    def _news_scores(self, new_hours, df_news):
+        """
+        새 시간의 뉴스 점수 (calculate_news_score와 같은 식)
+        
+        Args:
+            new_hours: 새 시간 버킷
+            df_news: 새 시간 구간의 뉴스 (None이면 소스 자체가 없어 중립, 빈 DataFrame이면 0건)
+        """
+        if df_news is None:
+            self._rolling('news_count', np.zeros(len(new_hours)))
+            return np.full(len(new_hours), 50.0)
+        
+        news_count = np.zeros(len(new_hours))
+        if not df_news.empty:
+            buckets, counts, _ = self.calculator._bucket_hourly(df_news['timestamp'])
+            position, found = self.calculator._align(new_hours, buckets)
+            news_count = np.where(found, counts[position], 0).astype(np.float64)
+        
+        rolling_mean, rolling_std = self._rolling('news_count', news_count)
+        score = self.calculator._normalize_band(news_count, rolling_mean - rolling_std, rolling_mean + rolling_std) * 100
+        return np.where(np.isnan(score), 50.0, score)
+    
+    def _twitter_scores(self, new_hours, df_twitter):
+        """
+        새 시간의 트위터 점수 (calculate_twitter_score와 같은 식)
+        
+        Args:
+            new_hours: 새 시간 버킷
+            df_twitter: 새 시간 구간의 트윗 (None이면 소스 자체가 없어 중립, 빈 DataFrame이면 0건)
+        """
+        if df_twitter is None:
+            likes = np.zeros(len(new_hours))
+            self._expanding_std('likes', self._rolling('likes', likes)[0])
+            return np.full(len(new_hours), 50.0)
+        
+        likes = np.zeros(len(new_hours))
+        sentiment = np.zeros(len(new_hours))
+        if not df_twitter.empty:
+            time_col = 'post_date' if 'post_date' in df_twitter.columns else 'timestamp'
+            buckets, _, sums = self.calculator._bucket_hourly(df_twitter[time_col], {
+                'likes': df_twitter['likes'],
+                'sentiment_score': df_twitter['sentiment_score']
+            })
+            position, found = self.calculator._align(new_hours, buckets)
+            
+            likes_sum, _ = sums['likes']
+            sentiment_sum, sentiment_count = sums['sentiment_score']
+            likes = np.where(found, likes_sum[position], 0.0)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                sentiment_mean = sentiment_sum / sentiment_count
+            sentiment = np.where(found, sentiment_mean[position], np.nan)
+            sentiment = np.where(np.isnan(sentiment), 0.0, sentiment)
+        
+        likes_rolling, _ = self._rolling('likes', likes)
+        likes_std = self._expanding_std('likes', likes_rolling)
+        likes_score = self.calculator._normalize_band(likes, likes_rolling - likes_std, likes_rolling + likes_std)
+        
+        score = (likes_score * 0.5 + (sentiment + 1) / 2 * 0.5) * 100
+        return np.where(np.isnan(score), 50.0, score)
+    
+    @staticmethod
+    def _fingerprint(frame, time_col, value_cols, end):
+        """
+        end 이전 행의 지문 (행 수:최대 시각:값 합계)
+        
+        값 합계는 math.fsum으로 구해 행 순서와 무관하게 같은 데이터면 같은 값이 됩니다.
+        
+        Args:
+            frame: 소스 데이터 (None이면 소스 없음)
+            time_col: 시각 컬럼
+            value_cols: 합계에 넣을 값 컬럼 (없는 컬럼은 무시)
+            end: 이 시각 이전 행만 사용
+        """
+        if frame is None:
+            return 'none'
+        
+        scored = frame[frame[time_col] < end]
+        if scored.empty:
+            return '0'
+        
+        cols = [col for col in value_cols if col in scored.columns]
+        values = scored[cols].to_numpy(dtype=np.float64).ravel()
+        checksum = math.fsum(values[~np.isnan(values)])
+        
+        return f"{len(scored)}:{pd.Timestamp(scored[time_col].max()).value}:{checksum!r}"
+    
+    def _fingerprints(self, df, df_news, df_twitter, time_col):
+        """계산을 마친 구간(마지막 시간까지)의 소스별 지문"""
+        end = pd.Timestamp(np.datetime64(int(self.hours[-1]) + 1, 'h'))
+        
+        return {
+            'telegram': self._fingerprint(df, 'timestamp', ['message_count', 'avg_sentiment'], end),
+            'news': self._fingerprint(df_news, 'timestamp', [], end),
+            'twitter': self._fingerprint(df_twitter, time_col, ['likes', 'sentiment_score'], end)
+        }
+    
+    def update(self, df, df_news=None, df_twitter=None):
+        """
+        마지막으로 계산한 시간 이후의 행만 점수 계산
+        
+        메인 데이터의 시작 시간이 저장된 상태와 다르거나 마지막 시간이 저장된 시간보다 앞서면
+        (데이터를 새로 만든 경우), 또는 이미 계산한 구간의 소스 데이터 지문이 저장된 지문과 다르면
+        (늦게 들어온 뉴스/트윗, 수정된 메인 데이터) 처음부터 다시 계산합니다.
+        
+        Args:
+            df: 메인 전처리 데이터 (timestamp 컬럼)
+            df_news: 코인니스 뉴스 데이터
+            df_twitter: 트위터 데이터
+        
+        Returns:
+            int: 새로 계산한 시간 수
+        """
+        if df.empty:
+            return 0
+        
+        if not df['timestamp'].is_monotonic_increasing:
+            df = df.sort_values('timestamp')
+        main_hours = self.calculator._hours(df['timestamp'])
+        
+        # 소스가 없으면 (전체 계산과 같이) 중립 - 필터 전 데이터로 판단
+        if df_news is not None and df_news.empty:
+            df_news = None
+        time_col = 'timestamp'
+        if df_twitter is not None:
+            time_col = 'post_date' if 'post_date' in df_twitter.columns else 'timestamp'
+            if df_twitter.empty or time_col not in df_twitter.columns:
+                df_twitter = None
+        
+        with self._lock:
+            if len(self.hours) and (main_hours[0] != self.hours[0] or main_hours[-1] < self.hours[-1]):
+                print("ℹ️  메인 데이터가 바뀌어 종합 점수를 처음부터 다시 계산합니다.")
+                self.reset()
+            elif len(self.hours) and self._fingerprints(df, df_news, df_twitter, time_col) != self.fingerprints:
+                print("ℹ️  이미 계산한 구간에 늦게 들어온 데이터가 있어 종합 점수를 처음부터 다시 계산합니다.")
+                self.reset()
+            
+            start = np.searchsorted(main_hours, self.hours[-1], side='right') if len(self.hours) else 0
+            if start >= len(main_hours):
+                return 0
+            
+            df_new = df.iloc[start:]
+            new_hours = main_hours[start:]
+            
+            # 새 시간 구간의 소스 데이터만 집계 (구간에 행이 없으면 빈 DataFrame -> 0건)
+            first = pd.Timestamp(np.datetime64(int(new_hours[0]), 'h'))
+            news_new = df_news[df_news['timestamp'] >= first] if df_news is not None else None
+            twitter_new = df_twitter[df_twitter[time_col] >= first] if df_twitter is not None else None
+            
+            new_scores = {
+                'telegram': self._telegram_scores(df_new),
+                'news': self._news_scores(new_hours, news_new),
+                'twitter': self._twitter_scores(new_hours, twitter_new)
+            }
+            
+            self.hours = np.concatenate([self.hours, new_hours])
+            for source, values in new_scores.items():
+                self.scores[source] = np.concatenate([self.scores[source], values])
+            
+            self.fingerprints = self._fingerprints(df, df_news, df_twitter, time_col)
+            self.save()
+        
+        return len(new_hours)
+    
+    def _composite_at(self, i):
+        """i번째 시간의 종합 점수"""
+        return sum(self.scores[source][i] * self.weights[source] for source in self.SOURCES)
+    
+    def latest(self):
+        """
+        마지막 시간의 점수와 24시간 변화량 (O(1))
+        
+        Returns:
+            dict: timestamp, 소스별 점수, composite_score, signal_level, change_24h, change_24h_pct
+        """
+        if len(self.hours) == 0:
+            return {
+                'timestamp': None,
+                'telegram_score': 50.0,
+                'news_score': 50.0,
+                'twitter_score': 50.0,
+                'composite_score': 50.0,
+                'signal_level': 'neutral',
+                'change_24h': 0.0,
+                'change_24h_pct': 0.0
+            }
+        
+        current = self._composite_at(-1)
+        
+        if len(self.hours) > 24:
+            previous = self._composite_at(-25)
+            change = current - previous
+            change_pct = change / previous * 100 if previous != 0 else 0.0
+        else:
+            change = change_pct = 0.0
+        
+        return {
+            'timestamp': pd.Timestamp(np.datetime64(int(self.hours[-1]), 'h')),
+            'telegram_score': float(self.scores['telegram'][-1]),
+            'news_score': float(self.scores['news'][-1]),
+            'twitter_score': float(self.scores['twitter'][-1]),
+            'composite_score': float(current),
+            'signal_level': signal_level(current),
+            'change_24h': float(change),
+            'change_24h_pct': float(change_pct)
+        }
+    
+    def history(self):
+        """
+        저장된 점수 시계열
+        
+        Returns:
+            DataFrame: timestamp, telegram_score, news_score, twitter_score, composite_score, signal_level
+        """
+        composite = sum(self.scores[source] * self.weights[source] for source in self.SOURCES)
+        
+        return pd.DataFrame({
+            'timestamp': self.hours.astype('datetime64[h]').astype('datetime64[ns]'),
+            'telegram_score': self.scores['telegram'],
+            'news_score': self.scores['news'],
+            'twitter_score': self.scores['twitter'],
+            'composite_score': composite,
+            'signal_level': signal_level(composite) if len(composite) else np.empty(0, dtype=object)
+        })
+
+
+class WeightSweep:
+    """
+    가중치 조합 일괄 평가
+    
+    소스별 점수를 한 번만 계산해 (시간 수, 3) 기저 행렬로 쌓아 두고, 여러 가중치 조합의 종합 점수를
+    한 번의 행렬 곱으로 계산합니다. 가중치 최적화나 what-if 슬라이더에서 소스별 점수를 다시
+    계산하지 않습니다.
+    
+    적중률: 종합 점수가 bullish 이상(>= 60)이면 상승, bearish 이하(< 40)면 하락 신호로 보고
+    horizon 시간 뒤 가격 수익률의 부호와 비교합니다.
+    """
+    
+    SOURCES = ['telegram', 'news', 'twitter']
+    
+    # 한 번에 계산하는 가중치 조합 수 (시간 수 x 조합 수 행렬이 CPU 캐시에 들어가는 크기)
+    BLOCK_SIZE = 32
+    
+    def __init__(self, df, df_news=None, df_twitter=None, calculator=None,
+                 price_col='ETH_close', horizon=24):
+        """
+        Args:
+            df: 메인 전처리 데이터 (timestamp, price_col 컬럼)
+            df_news: 코인니스 뉴스 데이터
+            df_twitter: 트위터 데이터
+            calculator: 소스별 점수 계산기 (기본: CompositeScoreCalculator())
+            price_col: 수익률 기준 가격 컬럼
+            horizon: 전방 수익률 기간 (행 수 = 시간)
+        """
+        calculator = calculator or CompositeScoreCalculator()
+        subscores = calculator.calculate_subscores(df, df_news, df_twitter)
+        
+        self.timestamps = df['timestamp'].to_numpy()
+        self.basis = subscores[[f'{source}_score' for source in self.SOURCES]].to_numpy(dtype=np.float64)
+        self.horizon = horizon
+        
+        # 전방 수익률 (끝의 horizon개 시간은 NaN)
+        self.forward_return = np.full(len(df), np.nan)
+        if price_col in df.columns and len(df) > horizon:
+            price = df[price_col].to_numpy(dtype=np.float64)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                self.forward_return[:-horizon] = price[horizon:] / price[:-horizon] - 1
+    
+    @classmethod
+    def weight_matrix(cls, weights):
+        """
+        가중치 입력 -> (조합 수, 3) 행렬
+        
+        Args:
+            weights: {'telegram', 'news', 'twitter'} dict, dict 리스트, 또는 (조합 수, 3) 배열
+        """
+        if isinstance(weights, dict):
+            weights = [weights]
+        if len(weights) and isinstance(weights[0], dict):
+            weights = [[w[source] for source in cls.SOURCES] for w in weights]
+        return np.atleast_2d(np.asarray(weights, dtype=np.float64))
+    
+    @staticmethod
+    def grid(step=0.05):
+        """
+        합이 1인 가중치 조합 격자
+        
+        Args:
+            step: 가중치 간격
+        
+        Returns:
+            ndarray: (조합 수, 3) - 열 순서는 telegram, news, twitter
+        """
+        n = int(round(1 / step))
+        telegram, news = np.meshgrid(np.arange(n + 1), np.arange(n + 1), indexing='ij')
+        mask = telegram + news <= n
+        telegram, news = telegram[mask], news[mask]
+        return np.column_stack([telegram, news, n - telegram - news]) / n
+    
+    def composite(self, weights):
+        """
+        가중치 조합별 종합 점수
+        
+        Args:
+            weights: weight_matrix가 받는 형식
+        
+        Returns:
+            Series (가중치 dict 하나) 또는 ndarray (시간 수, 조합 수)
+        """
+        scores = self.basis @ self.weight_matrix(weights).T
+        
+        if isinstance(weights, dict):
+            return pd.Series(scores[:, 0], index=pd.DatetimeIndex(self.timestamps), name='composite_score')
+        return scores
+    
+    def evaluate(self, weights, lower=SIGNAL_BINS[1], upper=SIGNAL_BINS[2]):
+        """
+        가중치 조합별 신호 성과
+        
+        Args:
+            weights: weight_matrix가 받는 형식
+            lower: 이 점수 미만이면 하락 신호
+            upper: 이 점수 이상이면 상승 신호
+        
+        Returns:
+            DataFrame: 조합별 telegram, news, twitter 가중치와
+                hit_rate (신호 방향 적중률), signals (신호 수), coverage (신호 비율),
+                avg_return (신호 방향으로 본 평균 전방 수익률), ic (종합 점수와 전방 수익률의 상관계수)
+        """
+        matrix = self.weight_matrix(weights)
+        
+        usable = ~np.isnan(self.forward_return) & ~np.isnan(self.basis).any(axis=1)
+        basis = self.basis[usable]
+        returns = self.forward_return[usable]
+        
+        # 행별 [1, 상승 여부, 하락 여부] - 신호 행렬과 곱해 조합별 개수를 한 번에 계산
+        # (0/1 값만 곱하므로 float32 BLAS 행렬 곱으로도 개수는 정확, 수익률 합계는 float64로 계산)
+        outcome = np.column_stack([np.ones(len(returns)), returns > 0, returns < 0]).astype(np.float32)
+        
+        signals = np.zeros(len(matrix))
+        hits = np.zeros(len(matrix))
+        signed_return = np.zeros(len(matrix))
+        
+        buffer = np.empty((len(returns), min(self.BLOCK_SIZE, len(matrix))), dtype=np.float32)
+        
+        for start in range(0, len(matrix), self.BLOCK_SIZE):
+            block = slice(start, start + self.BLOCK_SIZE)
+            scores = basis @ matrix[block].T
+            indicator = buffer[:, :scores.shape[1]]
+            
+            np.greater_equal(scores, upper, out=indicator, casting='unsafe')
+            up = outcome.T @ indicator
+            up_return = returns @ indicator
+            np.less(scores, lower, out=indicator, casting='unsafe')
+            down = outcome.T @ indicator
+            down_return = returns @ indicator
+            
+            signals[block] = up[0] + down[0]
+            hits[block] = up[1] + down[2]
+            signed_return[block] = up_return - down_return
+        
+        # 상관계수는 선형이므로 기저의 공분산으로 계산 (시간 수 x 조합 수 행렬 없이)
+        centered = basis - basis.mean(axis=0)
+        returns_centered = returns - returns.mean() if len(returns) else returns
+        cov_basis = centered.T @ centered
+        cov_return = centered.T @ returns_centered
+        with np.errstate(invalid='ignore', divide='ignore'):
+            score_var = np.einsum('ij,jk,ik->i', matrix, cov_basis, matrix)
+            ic = (matrix @ cov_return) / np.sqrt(score_var * (returns_centered @ returns_centered))
+            hit_rate = hits / signals
+            avg_return = signed_return / signals
+        
+        result = pd.DataFrame(matrix, columns=self.SOURCES)
+        result['hit_rate'] = hit_rate
+        result['signals'] = signals.astype(np.int64)
+        result['coverage'] = signals / len(returns) if len(returns) else np.nan
+        result['avg_return'] = avg_return
+        result['ic'] = ic
+        
+        return result
+
+
 if __name__ == '__main__':
     # 테스트
     print("=== 종합 점수 계산 시스템 ===")
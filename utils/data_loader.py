@@ -3,21 +3,95 @@
 
 모든 데이터 파일을 로드하고 기본 전처리를 수행합니다.
 파일이 없으면 빈 DataFrame을 반환하여 앱이 중단되지 않도록 합니다.
+pyarrow가 설치되어 있으면 파싱 결과를 Feather 파일(data/.cache/)로 캐시하여
+다음 로드부터는 CSV 파싱 없이 메모리 매핑으로 읽습니다.
+소스별 스키마(SCHEMAS)에 선언한 컬럼만 정해진 dtype과 시간 형식으로 파싱하며,
+projection 인자로 필요한 컬럼만 요청할 수 있습니다.
 """
 
 import pandas as pd
 import numpy as np
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+import glob
+import hashlib
 import os
+import time
+
+try:
+    import pyarrow.feather as feather
+except ImportError:  # pyarrow가 없으면 캐시 없이 CSV만 사용
+    feather = None
 
 
 class DataLoader:
     """데이터 로더 클래스"""
     
-    def __init__(self, data_dir=None):
+    # 소스별 CSV 스키마
+    # - time: (원본 시간 컬럼, 정확한 strptime 형식) - 로드 후 timestamp로 이름 변경
+    # - dtypes: 함께 읽을 컬럼과 dtype (여기 없는 컬럼은 읽지 않음)
+    #   반복되는 문자열은 category, 감성 점수/비율/좋아요 수처럼 정밀도가 필요 없는 값은 float32
+    #   (가격/거래량/거래 금액/평균 조회 수는 float64 유지)
+    # - rename: 로드 후 컬럼 이름 변경
+    # - utc: True면 UTC 타임존 유지, 없으면 타임존 없는 UTC 시각
+    SCHEMAS = {
+        'whale_transactions': {
+            'time': ('Time', '%Y-%m-%d %H:%M'),
+            'dtypes': {'frequency': 'int32', 'sum_amount': 'float64', 'sum_amount_usd': 'float64'},
+            'rename': {'frequency': 'tx_frequency', 'sum_amount': 'tx_amount', 'sum_amount_usd': 'tx_amount_usd'}
+        },
+        'price': {
+            'time': ('timestamp', '%Y-%m-%d %H:%M:%S%z'),
+            'dtypes': {
+                'open_price': 'float64', 'high_price': 'float64', 'low_price': 'float64',
+                'close_price': 'float64', 'volume': 'float64', 'quote_volume': 'float64',
+                'trade_count': 'int64', 'taker_buy_volume': 'float64', 'taker_buy_quote_volume': 'float64'
+            },
+            'utc': True
+        },
+        'telegram': {
+            'time': ('timestamp', '%Y-%m-%d %H:%M:%S%z'),
+            'dtypes': {
+                'channel': 'category', 'message_count': 'int32', 'avg_views': 'float64',
+                'total_forwards': 'int32', 'total_reactions': 'int32', 'avg_sentiment': 'float32',
+                'avg_positive': 'float32', 'avg_negative': 'float32', 'avg_neutral': 'float32',
+                'avg_msg_length': 'float32'
+            }
+        },
+        'twitter': {
+            'time': ('post_date', '%Y-%m-%dT%H:%M:%S.%f%z'),
+            'dtypes': {
+                'post_url': 'object', 'user_name': 'category', 'profile_url': 'category',
+                'post_content': 'object', 'comments': 'float32', 'shares': 'float32', 'likes': 'float32',
+                'spc_coin_label': 'int8', 'coin_name': 'category', 'sentiment': 'category',
+                'sentiment_score': 'float32'
+            }
+        },
+        'coinness': {
+            'time': ('timestamp', '%Y-%m-%d %H:%M:%S'),
+            'dtypes': {
+                'title': 'object', 'content': 'object', 'link': 'object',
+                'sentiment_compound': 'float32', 'sentiment_positive': 'float32',
+                'sentiment_negative': 'float32', 'sentiment_neutral': 'float32'
+            }
+        },
+        'reddit': {
+            'time': ('created_utc', '%Y-%m-%d %H:%M:%S'),
+            'dtypes': {
+                'id': 'object', 'title': 'object', 'author': 'object', 'score': 'int32',
+                'num_comments': 'int32', 'text': 'object', 'url': 'object', 'like_count': 'int32',
+                'coin_label': 'int8', 'spc_coin_label': 'int8', 'coin_name': 'category',
+                'sentiment': 'category'
+            }
+        },
+    }
+    
+    def __init__(self, data_dir=None, cache_dir=None, use_cache=True):
         """
         Args:
             data_dir: 데이터 디렉토리 경로 (기본값: 프로젝트 루트의 data/)
+            cache_dir: 컬럼형(Feather) 캐시 디렉토리 (기본값: data_dir/.cache)
+            use_cache: 캐시 사용 여부 (pyarrow가 없으면 자동으로 비활성화)
         """
         if data_dir is None:
             # 상대 경로로 data 폴더 찾기
@@ -25,181 +99,377 @@ class DataLoader:
             project_root = os.path.dirname(current_dir)
             data_dir = os.path.join(project_root, 'data')
         self.data_dir = data_dir
+        self.cache_dir = cache_dir or os.path.join(data_dir, '.cache')
+        self.use_cache = use_cache and feather is not None
+        self.load_timings = {}
+    
+    def _cache_path(self, name, file_path, schema):
+        """
+        원본 파일의 mtime+size와 스키마를 키로 하는 캐시 파일 경로
         
-    def load_whale_transactions(self):
+        원본 CSV나 스키마가 바뀌면 키가 바뀌므로 이전 캐시는 자동으로 무효화됩니다.
         """
-        고래 지갑 거래 데이터 로드 (시간별 집계)
+        stat = os.stat(file_path)
+        schema_key = hashlib.sha1(repr(schema).encode('utf-8')).hexdigest()[:8]
+        return os.path.join(self.cache_dir, f'{name}-{schema_key}-{stat.st_mtime_ns}-{stat.st_size}.feather')
+    
+    def _read_cache(self, name, file_path, schema, columns=None, since=None):
+        """
+        캐시된 컬럼형 파일을 메모리 매핑으로 읽기
         
+        Args:
+            columns: 읽을 컬럼 (None이면 전체, 나머지 컬럼은 디스크에서 읽지 않음)
+            since: 이 시각 이후의 행만 변환 (캐시는 timestamp 기준 정렬되어 있음)
+            
         Returns:
-            DataFrame: 시간별 거래 데이터 (없으면 빈 DataFrame)
+            DataFrame 또는 None (캐시 미사용/없음/손상)
         """
-        file_path = os.path.join(self.data_dir, 'whale_transactions_rows_ETH_rev1.csv')
+        if not self.use_cache:
+            return None
         
-        if not os.path.exists(file_path):
-            print(f"경고: {file_path} 파일이 없습니다.")
-            return pd.DataFrame()
+        cache_path = self._cache_path(name, file_path, schema)
+        if not os.path.exists(cache_path):
+            return None
         
         try:
-            df = pd.read_csv(file_path)
-            df['Time'] = pd.to_datetime(df['Time'], errors='coerce')
-            df = df.dropna(subset=['Time'])
-            
-            if df['Time'].dt.tz is not None:
-                df['Time'] = df['Time'].dt.tz_localize(None)
+            table = feather.read_table(cache_path, columns=columns, memory_map=True)
+            if since is not None:
+                # timestamp 컬럼만 변환해 시작 위치를 찾고, 그 뒤쪽만 DataFrame으로 변환
+                timestamps = table.column('timestamp').to_pandas()
+                start = self._since_bound(since, timestamps.dt.tz)
+                table = table.slice(int(timestamps.searchsorted(start)))
+            return table.to_pandas()
+        except Exception as e:
+            print(f"경고: 캐시 읽기 실패, CSV를 다시 파싱합니다 - {e}")
+            return None
+    
+    def _write_cache(self, name, file_path, schema, df):
+        """파싱이 끝난 DataFrame을 Feather 캐시로 저장 (이전 버전 캐시는 삭제)"""
+        if not self.use_cache or df.empty:
+            return
+        
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            cache_path = self._cache_path(name, file_path, schema)
             
-            df = df.rename(columns={
-                'Time': 'timestamp',
-                'frequency': 'tx_frequency',
-                'sum_amount': 'tx_amount',
-                'sum_amount_usd': 'tx_amount_usd'
-            })
+            for old_path in glob.glob(os.path.join(self.cache_dir, f'{name}-*.feather')):
+                if old_path != cache_path:
+                    os.remove(old_path)
             
-            df = df.sort_values('timestamp').reset_index(drop=True)
-            return df
+            # 다른 프로세스가 반쯤 쓴 파일을 읽지 않도록 임시 파일에 쓰고 교체
+            tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+            feather.write_feather(df, tmp_path, compression='uncompressed')
+            os.replace(tmp_path, cache_path)
         except Exception as e:
-            print(f"경고: 고래 거래 데이터 로드 실패 - {e}")
-            return pd.DataFrame()
+            print(f"경고: 캐시 저장 실패 - {e}")
     
-    def load_price_data(self, coin='ETH'):
+    @staticmethod
+    def _parse_timestamps(values, time_format, utc=False, label=''):
         """
-        가격 데이터 로드
+        스키마의 정확한 형식으로 시간 파싱 (형식 추론 없음)
+        
+        형식과 다른 행(예: 소수점 초가 붙은 스냅샷 행, 엑셀 오류 값)은 NaT가 되며 개수를 경고합니다.
         
         Args:
-            coin: 'ETH' 또는 'BTC'
+            values: 시간 문자열 Series
+            time_format: strptime 형식
+            utc: True면 UTC 타임존 유지, False면 타임존 없는 UTC 시각
+            label: 경고 메시지에 쓸 데이터 이름
             
         Returns:
-            DataFrame: 가격 데이터 (없으면 빈 DataFrame)
+            Series: 파싱된 시간 (실패는 NaT)
         """
-        file_path = os.path.join(self.data_dir, f'price_history_{coin.lower()}_rows.csv')
+        parsed = pd.to_datetime(values, format=time_format, errors='coerce', utc=True)
         
-        if not os.path.exists(file_path):
-            print(f"경고: {file_path} 파일이 없습니다.")
-            return pd.DataFrame()
+        invalid = int((parsed.isna() & values.notna()).sum())
+        if invalid:
+            print(f"경고: {label} 시간 형식({time_format})과 다른 {invalid}개 행을 제외합니다.")
         
-        try:
-            df = pd.read_csv(file_path)
-            df['timestamp'] = pd.to_datetime(df['timestamp'], errors='coerce')
-            df = df.dropna(subset=['timestamp'])
-            
-            if df['timestamp'].dt.tz is None:
-                df['timestamp'] = df['timestamp'].dt.tz_localize('UTC')
-            else:
-                df['timestamp'] = df['timestamp'].dt.tz_convert('UTC')
-            
-            rename_dict = {col: f'{coin}_{col}' for col in df.columns if col != 'timestamp'}
-            df = df.rename(columns=rename_dict)
-            df = df.sort_values('timestamp').reset_index(drop=True)
-            
-            return df
-        except Exception as e:
-            print(f"경고: {coin} 가격 데이터 로드 실패 - {e}")
-            return pd.DataFrame()
+        return parsed if utc else parsed.dt.tz_convert(None)
     
-    def load_telegram_data(self):
+    @staticmethod
+    def _since_bound(since, tz):
         """
-        텔레그램 데이터 로드
+        since를 데이터의 timestamp와 비교할 수 있는 시각으로 변환 (타임존 없는 since는 UTC로 간주)
         
+        Args:
+            since: 기준 시각
+            tz: 데이터 timestamp의 타임존 (없으면 None)
+            
         Returns:
-            DataFrame: 텔레그램 데이터 (없으면 빈 DataFrame)
+            Timestamp: 기준 시각
         """
-        file_path = os.path.join(self.data_dir, 'telegram_data.csv')
+        since = pd.Timestamp(since)
+        if tz is None:
+            return since if since.tzinfo is None else since.tz_convert('UTC').tz_localize(None)
+        return since.tz_localize('UTC').tz_convert(tz) if since.tzinfo is None else since.tz_convert(tz)
+    
+    def _load_source(self, name, file_path, schema, label, projection=None, rename=None, since=None):
+        """
+        스키마대로 CSV를 읽어 캐시하고 반환 (모든 load_* 공통)
         
+        캐시에는 스키마의 전체 컬럼을 저장하고, projection이 있으면 캐시에서 그 컬럼만 읽습니다.
+        캐시를 쓰지 않으면 CSV에서도 projection 컬럼만 파싱합니다.
+        
+        Args:
+            name: 캐시 이름
+            file_path: CSV 경로
+            schema: SCHEMAS 항목
+            label: 경고 메시지에 쓸 데이터 이름
+            projection: 반환할 컬럼 (로드 후 이름 기준, timestamp는 항상 포함)
+            rename: 스키마 rename에 더할 컬럼 이름 변경 {원본: 새 이름}
+            since: 이 시각 이후의 행만 반환 (캐시가 있으면 그 앞쪽 행은 변환하지 않음)
+            
+        Returns:
+            DataFrame: timestamp 기준 정렬된 데이터 (없으면 빈 DataFrame)
+        """
         if not os.path.exists(file_path):
             print(f"경고: {file_path} 파일이 없습니다.")
             return pd.DataFrame()
         
+        time_col, time_format = schema['time']
+        rename = {time_col: 'timestamp', **schema.get('rename', {}), **(rename or {})}
+        all_columns = [rename.get(col, col) for col in [time_col, *schema['dtypes']]]
+        
+        columns = all_columns
+        if projection is not None:
+            unknown = [col for col in projection if col not in all_columns]
+            if unknown:
+                print(f"경고: {label} 스키마에 없는 컬럼은 제외합니다 - {unknown}")
+            columns = [col for col in all_columns if col == 'timestamp' or col in projection]
+        
+        cached = self._read_cache(name, file_path, schema, columns, since)
+        if cached is not None:
+            return cached
+        
         try:
-            df = pd.read_csv(file_path)
-            df['date'] = pd.to_datetime(df['date'], errors='coerce')
-            df = df.dropna(subset=['date'])
+            # 캐시를 만들 때는 전체 컬럼, 아니면 필요한 컬럼만 파싱
+            read_columns = all_columns if self.use_cache else columns
+            source_names = {new: old for old, new in rename.items()}
+            usecols = [source_names.get(col, col) for col in read_columns]
             
-            if df['date'].dt.tz is not None:
-                df['date'] = df['date'].dt.tz_localize(None)
+            df = pd.read_csv(
+                file_path,
+                usecols=usecols,
+                dtype={col: schema['dtypes'][col] for col in usecols if col != time_col}
+            )
+            df[time_col] = self._parse_timestamps(df[time_col], time_format, schema.get('utc', False), label)
+            df = df.dropna(subset=[time_col])
             
-            df = df.rename(columns={'date': 'timestamp'})
+            df = df.rename(columns=rename)[read_columns]
             df = df.sort_values('timestamp').reset_index(drop=True)
             
-            return df
+            self._write_cache(name, file_path, schema, df)
+            
+            if since is not None:
+                start = self._since_bound(since, df['timestamp'].dt.tz)
+                df = df.iloc[int(df['timestamp'].searchsorted(start)):].reset_index(drop=True)
+            return df[columns] if len(columns) < len(read_columns) else df
         except Exception as e:
-            print(f"경고: 텔레그램 데이터 로드 실패 - {e}")
+            print(f"경고: {label} 데이터 로드 실패 - {e}")
             return pd.DataFrame()
     
-    def load_twitter_data(self):
+    def load_whale_transactions(self, projection=None, since=None):
         """
-        트위터 인플루언서 데이터 로드
+        고래 지갑 거래 데이터 로드 (시간별 집계)
         
+        Args:
+            projection: 반환할 컬럼 리스트 (None이면 스키마 전체)
+            since: 이 시각 이후의 행만 반환 (None이면 전체)
+            
         Returns:
-            DataFrame: 트위터 데이터 (없으면 빈 DataFrame)
+            DataFrame: 시간별 거래 데이터 (없으면 빈 DataFrame)
         """
-        file_path = os.path.join(self.data_dir, 'twitter_influencer_labeled_rows.csv')
-        
-        if not os.path.exists(file_path):
-            print(f"경고: {file_path} 파일이 없습니다.")
-            return pd.DataFrame()
+        file_path = os.path.join(self.data_dir, 'whale_transactions_rows_ETH_rev1.csv')
+        return self._load_source(
+            'whale_transactions', file_path, self.SCHEMAS['whale_transactions'], '고래 거래',
+            projection=projection, since=since
+        )
+    
+    def load_price_data(self, coin='ETH', projection=None, since=None):
+        """
+        가격 데이터 로드
         
-        try:
-            df = pd.read_csv(file_path)
-            df['post_date'] = pd.to_datetime(df['post_date'], errors='coerce')
-            df = df.dropna(subset=['post_date'])
+        Args:
+            coin: 'ETH' 또는 'BTC'
+            projection: 반환할 컬럼 리스트 (예: ['ETH_close_price'], None이면 스키마 전체)
+            since: 이 시각 이후의 행만 반환 (None이면 전체)
             
-            if df['post_date'].dt.tz is not None:
-                df['post_date'] = df['post_date'].dt.tz_localize(None)
+        Returns:
+            DataFrame: 가격 데이터 (timestamp는 UTC, 나머지 컬럼은 {coin}_ 접두어, 없으면 빈 DataFrame)
+        """
+        file_path = os.path.join(self.data_dir, f'price_history_{coin.lower()}_rows.csv')
+        schema = self.SCHEMAS['price']
+        return self._load_source(
+            f'price_{coin.lower()}', file_path, schema, f'{coin} 가격',
+            projection=projection,
+            since=since,
+            rename={col: f'{coin}_{col}' for col in schema['dtypes']}
+        )
+    
+    def load_telegram_data(self, projection=None, since=None):
+        """
+        텔레그램 데이터 로드
+        
+        Args:
+            projection: 반환할 컬럼 리스트 (None이면 스키마 전체)
+            since: 이 시각 이후의 행만 반환 (None이면 전체)
             
-            df = df.rename(columns={'post_date': 'timestamp'})
-            df = df.sort_values('timestamp').reset_index(drop=True)
+        Returns:
+            DataFrame: 텔레그램 데이터 (없으면 빈 DataFrame)
+        """
+        file_path = os.path.join(self.data_dir, 'telegram_data.csv')
+        return self._load_source(
+            'telegram', file_path, self.SCHEMAS['telegram'], '텔레그램', projection=projection, since=since
+        )
+    
+    def load_twitter_data(self, projection=None, since=None):
+        """
+        트위터 인플루언서 데이터 로드
+        
+        Args:
+            projection: 반환할 컬럼 리스트 (예: 점수 계산은 ['likes', 'sentiment_score'], None이면 스키마 전체)
+            since: 이 시각 이후의 행만 반환 (None이면 전체)
             
-            return df
-        except Exception as e:
-            print(f"경고: 트위터 데이터 로드 실패 - {e}")
-            return pd.DataFrame()
+        Returns:
+            DataFrame: 트위터 데이터 (없으면 빈 DataFrame)
+        """
+        file_path = os.path.join(self.data_dir, 'twitter_influencer_labeled_rows.csv')
+        return self._load_source(
+            'twitter', file_path, self.SCHEMAS['twitter'], '트위터', projection=projection, since=since
+        )
     
-    def load_coinness_data(self):
+    def load_coinness_data(self, projection=None, since=None):
         """
         코인니스 뉴스 데이터 로드
         
+        Args:
+            projection: 반환할 컬럼 리스트 (None이면 스키마 전체)
+            since: 이 시각 이후의 행만 반환 (None이면 전체)
+            
         Returns:
             DataFrame: 코인니스 뉴스 데이터 (없으면 빈 DataFrame)
         """
         file_path = os.path.join(self.data_dir, 'coinness_data.csv')
+        return self._load_source(
+            'coinness', file_path, self.SCHEMAS['coinness'], '코인니스', projection=projection, since=since
+        )
+    
+    def load_reddit_data(self, projection=None, since=None):
+        """
+        레딧 게시글 데이터 로드 (코인 라벨링된 파일)
         
-        if not os.path.exists(file_path):
-            print(f"경고: {file_path} 파일이 없습니다.")
-            return pd.DataFrame()
+        Args:
+            projection: 반환할 컬럼 리스트 (None이면 스키마 전체)
+            since: 이 시각 이후의 행만 반환 (None이면 전체)
+            
+        Returns:
+            DataFrame: 레딧 데이터 (created_utc -> timestamp, 없으면 빈 DataFrame)
+        """
+        file_path = os.path.join(self.data_dir, 'reddit', 'reddit_cryptomarkets_F_labeled_v2.csv')
+        return self._load_source(
+            'reddit', file_path, self.SCHEMAS['reddit'], '레딧', projection=projection, since=since
+        )
+    
+    def list_price_assets(self):
+        """
+        가격 파일(price_history_{코인}_rows.csv)이 있는 자산 목록
         
-        try:
-            df = pd.read_csv(file_path)
-            df['timestamp'] = pd.to_datetime(df['timestamp'], errors='coerce')
-            df = df.dropna(subset=['timestamp'])
+        Returns:
+            list: 대문자 자산 심볼 (예: ['BTC', 'ETH'])
+        """
+        pattern = os.path.join(self.data_dir, 'price_history_*_rows.csv')
+        return sorted(
+            os.path.basename(path)[len('price_history_'):-len('_rows.csv')].upper()
+            for path in glob.glob(pattern)
+        )
+    
+    def load_asset_prices(self, assets=None, projection=None, since=None):
+        """
+        여러 자산의 가격 데이터를 long-format으로 로드
+        
+        Args:
+            assets: 자산 심볼 리스트 (None이면 가격 파일이 있는 전체 자산)
+            projection: 반환할 컬럼 리스트 (long-format 이름, 예: ['close', 'volume'])
+            since: 이 시각 이후의 행만 반환 (None이면 전체)
+            
+        Returns:
+            DataFrame: asset, timestamp (타임존 없는 UTC), open, high, low, close, volume 등
+        """
+        # close_price -> close
+        long_names = {col: col.removesuffix('_price') for col in self.SCHEMAS['price']['dtypes']}
+        frames = []
+        
+        for asset in [asset.upper() for asset in assets] if assets else self.list_price_assets():
+            prefix = f'{asset}_'
             
-            if df['timestamp'].dt.tz is not None:
-                df['timestamp'] = df['timestamp'].dt.tz_localize(None)
+            asset_projection = None
+            if projection is not None:
+                asset_projection = [
+                    prefix + col for col, long_name in long_names.items() if long_name in projection
+                ]
             
-            df = df.sort_values('timestamp').reset_index(drop=True)
+            df = self.load_price_data(asset, projection=asset_projection, since=since)
+            if df.empty:
+                continue
             
-            return df
-        except Exception as e:
-            print(f"경고: 코인니스 데이터 로드 실패 - {e}")
+            df = df.rename(columns=lambda c: long_names[c[len(prefix):]] if c.startswith(prefix) else c)
+            df['timestamp'] = df['timestamp'].dt.tz_convert(None)
+            frames.append(df.assign(asset=asset))
+        
+        if not frames:
             return pd.DataFrame()
+        
+        return pd.concat(frames, ignore_index=True)
+    
+    def _timed_load(self, name, load_fn, *args, **kwargs):
+        """로더를 실행하고 소요 시간(초)을 load_timings에 기록"""
+        start = time.perf_counter()
+        df = load_fn(*args, **kwargs)
+        self.load_timings[name] = time.perf_counter() - start
+        return df
     
-    def load_all_data(self):
+    def load_all_data(self, parallel=False, max_workers=None, projections=None, since=None):
         """
         모든 데이터를 로드하고 반환
         
+        Args:
+            parallel: True이면 스레드 풀에서 소스들을 동시에 로드
+            max_workers: 동시 로드 스레드 수 (기본값: 소스 개수)
+            projections: 소스별 반환할 컬럼 {소스 이름: 컬럼 리스트} (없는 소스는 스키마 전체)
+            since: 이 시각 이후의 행만 반환 (증분 처리용, None이면 전체)
+            
         Returns:
             dict: 각 데이터프레임을 담은 딕셔너리
+                  (소스별 로드 시간은 self.load_timings에 기록)
         """
-        data = {
-            'whale_transactions': self.load_whale_transactions(),
-            'eth_price': self.load_price_data('ETH'),
-            'btc_price': self.load_price_data('BTC'),
-            'telegram': self.load_telegram_data(),
-            'twitter': self.load_twitter_data(),
-            'coinness': self.load_coinness_data()
-        }
+        sources = [
+            ('whale_transactions', self.load_whale_transactions, ()),
+            ('eth_price', self.load_price_data, ('ETH',)),
+            ('btc_price', self.load_price_data, ('BTC',)),
+            ('telegram', self.load_telegram_data, ()),
+            ('twitter', self.load_twitter_data, ()),
+            ('coinness', self.load_coinness_data, ())
+        ]
+        projections = projections or {}
+        self.load_timings = {}
+        
+        if not parallel:
+            return {
+                name: self._timed_load(name, fn, *args, projection=projections.get(name), since=since)
+                for name, fn, args in sources
+            }
+        
+        # CSV 파싱/파일 I/O는 대부분 GIL을 놓기 때문에 스레드 풀로 충분
+        with ThreadPoolExecutor(max_workers=max_workers or len(sources)) as executor:
+            futures = {
+                name: executor.submit(self._timed_load, name, fn, *args, projection=projections.get(name), since=since)
+                for name, fn, args in sources
+            }
+            data = {name: future.result() for name, future in futures.items()}
         
         return data
 
-
 if __name__ == '__main__':
     # 테스트
     loader = DataLoader()
@@ -207,4 +477,4 @@ if __name__ == '__main__':
     
     print("=== 데이터 로드 결과 ===")
     for name, df in data.items():
-        print(f"{name}: {len(df)} 행")
+        print(f"{name}: {len(df)} 행 ({loader.load_timings[name]:.3f}초)")
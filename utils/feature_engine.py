@@ -0,0 +1,124 @@
+"""
+파생 변수 계산 엔진
+
+여러 컬럼의 변화율/이동평균/이동표준편차/Z-score/볼린저 밴드를
+하나의 float64 블록에 대한 NumPy 연산으로 한 번에 계산합니다.
+- 롤링 합계와 제곱합을 누적합(cumsum) 한 번으로 모든 컬럼에 대해 계산
+- 평균, 표준편차, Z-score, 밴드는 그 합계들로부터 유도
+"""
+
+import pandas as pd
+import numpy as np
+
+
+class RollingFeatureEngine:
+    """롤링 통계 기반 파생 변수 엔진"""
+
+    def __init__(self, window=24, band_width=2, eps=1e-10):
+        """
+        Args:
+            window: 롤링 윈도우 크기 (기본: 24시간)
+            band_width: 볼린저 밴드 폭 (표준편차 배수)
+            eps: 0으로 나누기 방지용 값
+        """
+        self.window = window
+        self.band_width = band_width
+        self.eps = eps
+
+    def rolling_moments(self, block):
+        """
+        (행 x 컬럼) 블록의 롤링 평균/표준편차 계산
+
+        pandas rolling(window, min_periods=1)과 같은 규칙을 따릅니다.
+        NaN은 건너뛰고, 표준편차는 표본 표준편차(ddof=1)이며 값이 1개면 NaN입니다.
+
+        Args:
+            block: 2차원 float64 배열
+
+        Returns:
+            tuple: (mean, std) 2차원 배열
+        """
+        block = np.ascontiguousarray(block, dtype=np.float64)
+        valid = ~np.isnan(block)
+
+        # 컬럼별로 중심화하여 누적합의 자릿수 손실을 줄임
+        center = np.zeros(block.shape[1])
+        has_values = valid.any(axis=0)
+        center[has_values] = np.nanmean(block[:, has_values], axis=0)
+        values = np.where(valid, block - center, 0.0)
+
+        # [개수, 합, 제곱합]을 한 번의 누적합으로 계산
+        stacked = np.stack([valid.astype(np.float64), values, values * values])
+        sums = np.cumsum(stacked, axis=1)
+        sums[:, self.window:] -= sums[:, :-self.window].copy()
+        count, total, total_sq = sums
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.where(count > 0, total / count, np.nan)
+            var = (total_sq - total * mean) / (count - 1)
+
+        var = np.where(count > 1, np.maximum(var, 0.0), np.nan)
+
+        return mean + center, np.sqrt(var)
+
+    def pct_change(self, block):
+        """
+        (행 x 컬럼) 블록의 1기간 변화율 (%)
+
+        Returns:
+            2차원 배열 (첫 행은 NaN)
+        """
+        block = np.asarray(block, dtype=np.float64)
+        result = np.full(block.shape, np.nan)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            result[1:] = (block[1:] / block[:-1] - 1) * 100
+
+        return result
+
+    def compute(self, df, pct_change_features, rolling_features):
+        """
+        선언된 파생 변수를 모두 계산
+
+        Args:
+            df: 원본 데이터프레임
+            pct_change_features: {원본 컬럼: 출력 컬럼} 변화율 정의
+            rolling_features: 롤링 통계 정의 리스트
+                {'column': 원본 컬럼, 'prefix': 출력 접두어,
+                 'band_prefix': 볼린저 밴드 접두어 (선택)}
+                -> {prefix}_ma{window}, {prefix}_std{window}, {prefix}_zscore,
+                   {band_prefix}_bb_upper, {band_prefix}_bb_lower
+
+        Returns:
+            DataFrame: 파생 변수만 담은 데이터프레임 (df와 같은 인덱스)
+        """
+        # 존재하는 컬럼만 사용
+        pct_change_features = {
+            col: name for col, name in pct_change_features.items() if col in df.columns
+        }
+        rolling_features = [spec for spec in rolling_features if spec['column'] in df.columns]
+
+        features = {}
+
+        # 1. 변화율
+        if pct_change_features:
+            changes = self.pct_change(df[list(pct_change_features)].to_numpy(dtype=np.float64))
+            for i, name in enumerate(pct_change_features.values()):
+                features[name] = changes[:, i]
+
+        # 2. 롤링 통계
+        if rolling_features:
+            block = df[[spec['column'] for spec in rolling_features]].to_numpy(dtype=np.float64)
+            mean, std = self.rolling_moments(block)
+            zscore = (block - mean) / (std + self.eps)
+
+            for stat, values in [(f'ma{self.window}', mean), (f'std{self.window}', std), ('zscore', zscore)]:
+                for i, spec in enumerate(rolling_features):
+                    features[f"{spec['prefix']}_{stat}"] = values[:, i]
+
+            for i, spec in enumerate(rolling_features):
+                if spec.get('band_prefix'):
+                    features[f"{spec['band_prefix']}_bb_upper"] = mean[:, i] + self.band_width * std[:, i]
+                    features[f"{spec['band_prefix']}_bb_lower"] = mean[:, i] - self.band_width * std[:, i]
+
+        return pd.DataFrame(features, index=df.index)
@@ -0,0 +1,239 @@
+"""
+비동기 HTTP 수집 계층
+
+코인니스/코인판 스크래퍼가 공유하는 aiohttp 기반 페이지 요청기입니다.
+- 연결 풀 크기 제한 (전체 동시 연결 수)
+- 호스트별 토큰 버킷 속도 제한 (초당 요청 수 + 순간 허용량)
+- 429/5xx/네트워크 오류 시 지터를 준 지수 백오프 재시도 (Retry-After 우선)
+- ETag / Last-Modified 저장 후 조건부 요청 (304면 저장된 본문 사용)
+"""
+
+import asyncio
+import os
+import random
+import sqlite3
+import time
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+import aiohttp
+
+
+@dataclass
+class FetchResult:
+    """페이지 요청 결과"""
+    url: str
+    status: int
+    text: str
+    from_cache: bool = False
+
+
+class TokenBucket:
+    """토큰 버킷 속도 제한기 (초당 rate개 충전, 최대 burst개 보관)"""
+    
+    def __init__(self, rate, burst=1):
+        """
+        Args:
+            rate: 초당 요청 수
+            burst: 연속으로 허용하는 최대 요청 수
+        """
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """토큰 하나를 얻을 때까지 대기"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+    
+    def pause(self, seconds):
+        """서버가 요청한 대기 시간만큼 토큰을 비움 (Retry-After)"""
+        self.tokens = min(self.tokens, 0.0) - seconds * self.rate
+
+
+class ValidatorCache:
+    """URL별 ETag/Last-Modified와 본문 저장소 (SQLite)"""
+    
+    def __init__(self, path):
+        """
+        Args:
+            path: SQLite 파일 경로
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS pages ('
+            'url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, body TEXT)'
+        )
+        self.conn.commit()
+    
+    def get(self, url):
+        """
+        Returns:
+            tuple: (etag, last_modified, body) 또는 None
+        """
+        return self.conn.execute(
+            'SELECT etag, last_modified, body FROM pages WHERE url = ?', (url,)
+        ).fetchone()
+    
+    def put(self, url, etag, last_modified, body):
+        """검증자와 본문 저장"""
+        self.conn.execute(
+            'INSERT OR REPLACE INTO pages (url, etag, last_modified, body) VALUES (?, ?, ?, ?)',
+            (url, etag, last_modified, body)
+        )
+        self.conn.commit()
+    
+    def close(self):
+        """연결 종료"""
+        self.conn.close()
+
+
+class AsyncFetcher:
+    """연결 풀 + 호스트별 속도 제한 + 재시도 + 조건부 요청을 갖춘 페이지 요청기"""
+    
+    # 재시도할 응답 코드
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+    
+    def __init__(self, max_connections=8, per_host_rate=0.5, burst=2, max_retries=3,
+                 backoff_base=2.0, backoff_max=30.0, timeout=15, headers=None,
+                 cache_path=None):
+        """
+        Args:
+            max_connections: 전체 동시 연결 수
+            per_host_rate: 호스트별 초당 요청 수
+            burst: 호스트별 연속 허용 요청 수
+            max_retries: 최대 시도 횟수
+            backoff_base: 백오프 기본 대기 시간 (초, 시도마다 2배)
+            backoff_max: 백오프 최대 대기 시간 (초)
+            timeout: 요청 타임아웃 (초)
+            headers: 요청 헤더 dict 또는 매 요청마다 헤더를 반환하는 함수
+            cache_path: ETag/Last-Modified 저장 파일 (None이면 조건부 요청 안 함)
+        """
+        self.max_connections = max_connections
+        self.per_host_rate = per_host_rate
+        self.burst = burst
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.headers = headers
+        self.cache = ValidatorCache(cache_path) if cache_path else None
+        
+        self.session = None
+        self._buckets = {}
+        self.stats = {'requests': 0, 'retries': 0, 'not_modified': 0, 'failed': 0}
+    
+    async def __aenter__(self):
+        connector = aiohttp.TCPConnector(limit=self.max_connections)
+        self.session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+        return self
+    
+    async def __aexit__(self, *exc):
+        await self.session.close()
+        if self.cache is not None:
+            self.cache.close()
+    
+    def _bucket(self, url):
+        """호스트별 토큰 버킷"""
+        host = urlsplit(url).netloc
+        if host not in self._buckets:
+            self._buckets[host] = TokenBucket(self.per_host_rate, self.burst)
+        return self._buckets[host]
+    
+    def _backoff(self, attempt):
+        """지터를 준 지수 백오프 대기 시간 (full jitter)"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+    
+    def _request_headers(self, url):
+        """요청 헤더 + 조건부 요청 헤더"""
+        headers = dict(self.headers() if callable(self.headers) else (self.headers or {}))
+        
+        cached = self.cache.get(url) if self.cache is not None else None
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+        
+        return headers, cached
+    
+    async def fetch(self, url):
+        """
+        페이지 요청 (재시도 포함)
+        
+        Args:
+            url: 요청할 URL
+        
+        Returns:
+            FetchResult 또는 None (모든 시도 실패)
+        """
+        bucket = self._bucket(url)
+        
+        for attempt in range(self.max_retries):
+            await bucket.acquire()
+            headers, cached = self._request_headers(url)
+            self.stats['requests'] += 1
+            
+            try:
+                async with self.session.get(url, headers=headers) as response:
+                    if response.status == 304 and cached:
+                        self.stats['not_modified'] += 1
+                        return FetchResult(url, 200, cached[2], from_cache=True)
+                    
+                    if response.status == 200:
+                        text = await response.text()
+                        if self.cache is not None:
+                            etag = response.headers.get('ETag')
+                            last_modified = response.headers.get('Last-Modified')
+                            if etag or last_modified:
+                                self.cache.put(url, etag, last_modified, text)
+                        return FetchResult(url, response.status, text)
+                    
+                    if response.status not in self.RETRY_STATUSES:
+                        print(f"  ⚠️  요청 실패: {url} ({response.status})")
+                        self.stats['failed'] += 1
+                        return None
+                    
+                    # Rate limit / 서버 오류 - Retry-After가 있으면 그만큼 호스트 전체 대기
+                    retry_after = response.headers.get('Retry-After', '')
+                    wait_time = float(retry_after) if retry_after.isdigit() else self._backoff(attempt)
+                    print(f"  ⚠️  {url} 응답 {response.status}. {wait_time:.1f}초 후 재시도 "
+                          f"({attempt + 1}/{self.max_retries})")
+                    if response.status == 429:
+                        # 다음 acquire에서 대기하므로 여기서는 따로 쉬지 않음
+                        bucket.pause(wait_time)
+                        wait_time = 0
+            
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                wait_time = self._backoff(attempt)
+                print(f"  ✗ {url} 요청 오류 (시도 {attempt + 1}/{self.max_retries}): {e}")
+            
+            if attempt < self.max_retries - 1:
+                self.stats['retries'] += 1
+                await asyncio.sleep(wait_time)
+        
+        self.stats['failed'] += 1
+        return None
+    
+    async def fetch_all(self, urls):
+        """
+        여러 페이지를 동시에 요청 (연결 풀과 호스트별 속도 제한 안에서)
+        
+        Returns:
+            list: FetchResult 또는 None (urls와 같은 순서)
+        """
+        return await asyncio.gather(*(self.fetch(url) for url in urls))
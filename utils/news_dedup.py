@@ -0,0 +1,204 @@
+"""
+뉴스 중복 제거 인덱스
+
+수집한 기사를 CSV에 추가할 때 이미 저장된 기사인지 확인하는 영구 인덱스입니다.
+CSV 옆 캐시 디렉토리(data/.cache/{파일명}.dedup.sqlite)에 (정규화 제목 해시, 시각)과 링크를 저장합니다.
+- 저장 시점에 중복을 걸러내므로 CSV 전체를 다시 읽는 정리 작업이 필요 없음
+- 같은 링크 또는 같은 제목 + 같은 시각이면 중복
+- near_minutes를 주면 같은 제목이 그 시간(분) 안에 다시 나온 경우도 중복 (유사 중복 모드)
+- CSV가 외부에서 수정되면 (크기/수정 시각 변경) 인덱스를 CSV에서 다시 생성
+"""
+
+import hashlib
+import os
+import sqlite3
+
+import pandas as pd
+
+from utils.sentiment_store import normalize_text
+
+
+# 유사 중복 모드 기본 허용 간격 (분)
+NEAR_DUPLICATE_MINUTES = 10
+
+
+def title_key(title):
+    """제목의 인덱스 키 (정규화 + 대소문자 무시 후 sha1 hex)"""
+    return hashlib.sha1(normalize_text(title).casefold().encode('utf-8')).hexdigest()
+
+
+class NewsDedupIndex:
+    """CSV 하나에 대한 기사 중복 제거 인덱스 (SQLite)"""
+    
+    def __init__(self, csv_path, near_minutes=None, index_path=None):
+        """
+        Args:
+            csv_path: 기사를 저장하는 CSV 경로
+            near_minutes: 유사 중복 허용 간격 (분, None이면 정확히 같은 시각만 중복)
+            index_path: 인덱스 파일 경로 (기본: CSV 폴더/.cache/{파일명}.dedup.sqlite)
+        """
+        if index_path is None:
+            data_dir, file_name = os.path.split(os.path.abspath(csv_path))
+            index_path = os.path.join(data_dir, '.cache', f'{file_name}.dedup.sqlite')
+        
+        self.csv_path = csv_path
+        self.window = int((near_minutes or 0) * 60)
+        os.makedirs(os.path.dirname(os.path.abspath(index_path)), exist_ok=True)
+        
+        self.conn = sqlite3.connect(index_path, timeout=30)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS articles (title_key TEXT, ts INTEGER, link TEXT)'
+        )
+        self.conn.execute('CREATE INDEX IF NOT EXISTS idx_title_ts ON articles (title_key, ts)')
+        self.conn.execute('CREATE INDEX IF NOT EXISTS idx_link ON articles (link)')
+        self.conn.execute('CREATE TABLE IF NOT EXISTS meta (size INTEGER, mtime_ns INTEGER)')
+        self.conn.commit()
+        
+        self._sync()
+    
+    def _csv_stat(self):
+        """CSV 크기와 수정 시각 (없으면 None)"""
+        if not os.path.exists(self.csv_path):
+            return None
+        stat = os.stat(self.csv_path)
+        return (stat.st_size, stat.st_mtime_ns)
+    
+    def _save_stat(self):
+        """인덱스가 반영한 CSV 상태 기록"""
+        self.conn.execute('DELETE FROM meta')
+        stat = self._csv_stat()
+        if stat is not None:
+            self.conn.execute('INSERT INTO meta (size, mtime_ns) VALUES (?, ?)', stat)
+    
+    def _sync(self):
+        """CSV가 인덱스 기록 이후 바뀌었으면 인덱스 재생성"""
+        recorded = self.conn.execute('SELECT size, mtime_ns FROM meta').fetchone()
+        if recorded == self._csv_stat():
+            return
+        
+        self.conn.execute('DELETE FROM articles')
+        
+        if os.path.exists(self.csv_path):
+            df = pd.read_csv(
+                self.csv_path, usecols=lambda c: c in ('title', 'timestamp', 'link'),
+                keep_default_na=False
+            )
+            print(f"🔄 중복 제거 인덱스 재생성: {self.csv_path} ({len(df):,}개 기사)")
+            self.conn.executemany(
+                'INSERT INTO articles (title_key, ts, link) VALUES (?, ?, ?)',
+                self._keys(df)
+            )
+        
+        self._save_stat()
+        self.conn.commit()
+    
+    @staticmethod
+    def _keys(df):
+        """기사 DataFrame -> [(title_key, ts 초, link), ...]"""
+        timestamps = pd.to_datetime(df['timestamp'], errors='coerce')
+        if timestamps.dt.tz is not None:
+            timestamps = timestamps.dt.tz_localize(None)
+        
+        seconds = [
+            None if pd.isna(ts) else int(ts.value // 1_000_000_000) for ts in timestamps
+        ]
+        links = df['link'].fillna('').astype(str) if 'link' in df.columns else [''] * len(df)
+        
+        return [
+            (title_key(title), ts, link or None)
+            for title, ts, link in zip(df['title'].fillna('').astype(str), seconds, links)
+        ]
+    
+    def _exists(self, key, ts, link):
+        """이미 인덱스에 있는 기사인지 확인"""
+        if link and self.conn.execute(
+            'SELECT 1 FROM articles WHERE link = ? LIMIT 1', (link,)
+        ).fetchone():
+            return True
+        
+        if ts is None:
+            return False
+        
+        return self.conn.execute(
+            'SELECT 1 FROM articles WHERE title_key = ? AND ts BETWEEN ? AND ? LIMIT 1',
+            (key, ts - self.window, ts + self.window)
+        ).fetchone() is not None
+    
+    def _register_new(self, df):
+        """
+        인덱스에 없는 행만 골라 인덱스에 추가 (커밋 전)
+        
+        같은 묶음 안의 중복도 먼저 나온 행만 남깁니다.
+        
+        Returns:
+            ndarray: 새 기사 여부 (bool, df 행 순서)
+        """
+        is_new = []
+        
+        for key, ts, link in self._keys(df):
+            if self._exists(key, ts, link):
+                is_new.append(False)
+                continue
+            
+            self.conn.execute(
+                'INSERT INTO articles (title_key, ts, link) VALUES (?, ?, ?)', (key, ts, link)
+            )
+            is_new.append(True)
+        
+        return pd.Series(is_new, index=df.index, dtype=bool).to_numpy()
+    
+    def filter_new(self, df):
+        """
+        인덱스에 없는 기사만 반환 (인덱스는 변경하지 않음)
+        
+        Args:
+            df: 기사 DataFrame (title, timestamp, link 컬럼)
+        
+        Returns:
+            DataFrame: 새 기사
+        """
+        try:
+            return df[self._register_new(df)]
+        finally:
+            self.conn.rollback()
+    
+    def append(self, df):
+        """
+        새 기사만 CSV에 추가하고 인덱스 갱신
+        
+        CSV 기록이 끝난 뒤에 인덱스를 커밋하므로, 기록 중 실패하면 인덱스도 변경되지 않습니다.
+        CSV가 이미 있으면 기존 컬럼 순서를 따릅니다.
+        
+        Args:
+            df: 수집한 기사 DataFrame
+        
+        Returns:
+            DataFrame: 실제로 추가된 기사
+        """
+        try:
+            new_rows = df[self._register_new(df)]
+            
+            if not new_rows.empty:
+                if os.path.exists(self.csv_path):
+                    columns = pd.read_csv(self.csv_path, nrows=0).columns
+                    new_rows.reindex(columns=columns).to_csv(
+                        self.csv_path, mode='a', header=False, index=False, encoding='utf-8'
+                    )
+                else:
+                    new_rows.to_csv(self.csv_path, index=False, encoding='utf-8-sig')
+            
+            self._save_stat()
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        
+        return new_rows
+    
+    def __len__(self):
+        return self.conn.execute('SELECT COUNT(*) FROM articles').fetchone()[0]
+    
+    def close(self):
+        """연결 종료"""
+        self.conn.close()
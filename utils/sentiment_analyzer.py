@@ -2,18 +2,77 @@
 감성 분석 유틸리티
 
 VADER를 사용한 텍스트 감성 분석
+- 같은 텍스트(포워딩, 재게시 뉴스)는 한 번만 분석
+- 점수는 수집 스크립트와 공유하는 디스크 캐시(SentimentStore)에 저장하여 재실행 시 새 텍스트만 분석
+- 캐시에 없는 텍스트가 많으면 프로세스 풀에서 나누어 분석
 """
 
+from concurrent.futures import ProcessPoolExecutor
+
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 import pandas as pd
+import numpy as np
+
+from .sentiment_store import SentimentStore, SCORE_COLUMNS, normalize_text
+
+# 빈 텍스트의 기본 점수
+NEUTRAL_SCORES = (0.0, 0.0, 1.0, 0.0)
+
+# 워커 프로세스별 VADER 분석기
+_worker_analyzer = None
+
+
+def _score_chunk(texts):
+    """
+    텍스트 묶음의 VADER 점수 계산 (프로세스 풀 워커)
+    
+    Returns:
+        list: [(compound, pos, neu, neg), ...]
+    """
+    global _worker_analyzer
+    if _worker_analyzer is None:
+        _worker_analyzer = SentimentIntensityAnalyzer()
+    
+    results = []
+    for text in texts:
+        scores = _worker_analyzer.polarity_scores(text)
+        results.append(tuple(scores[col] for col in SCORE_COLUMNS))
+    
+    return results
+
+
+def sentiment_label(compound):
+    """
+    compound 점수(스칼라 또는 배열)를 positive/negative/neutral 라벨로 변환
+    """
+    compound = np.asarray(compound, dtype=np.float64)
+    return np.select(
+        [compound >= 0.05, compound <= -0.05],
+        ['positive', 'negative'],
+        default='neutral'
+    )
 
 
 class SentimentAnalyzer:
     """감성 분석 클래스"""
     
-    def __init__(self):
-        """VADER 감성 분석기 초기화"""
+    def __init__(self, use_cache=True, cache_path=None, max_workers=None,
+                 parallel_threshold=5000, chunk_size=1000):
+        """
+        VADER 감성 분석기 초기화
+        
+        Args:
+            use_cache: 디스크 점수 캐시 사용 여부
+            cache_path: 캐시 파일 경로 (None이면 data/.cache/sentiment.sqlite)
+            max_workers: 프로세스 풀 워커 수 (None이면 CPU 수, 1이면 직렬)
+            parallel_threshold: 새로 분석할 텍스트가 이 개수 이상일 때만 프로세스 풀 사용
+            chunk_size: 워커 한 번에 넘기는 텍스트 수
+        """
         self.analyzer = SentimentIntensityAnalyzer()
+        self.store = SentimentStore(cache_path) if use_cache else None
+        self.max_workers = max_workers
+        self.parallel_threshold = parallel_threshold
+        self.chunk_size = chunk_size
     
     def analyze_text(self, text):
         """
@@ -34,19 +93,80 @@ class SentimentAnalyzer:
                 'label': 'neutral'
             }
         
-        scores = self.analyzer.polarity_scores(str(text))
-        
-        # 라벨 결정
-        if scores['compound'] >= 0.05:
-            label = 'positive'
-        elif scores['compound'] <= -0.05:
-            label = 'negative'
+        if self.store is not None:
+            scores = self.store.polarity_scores(text)
         else:
-            label = 'neutral'
+            scores = self.analyzer.polarity_scores(str(text))
         
-        scores['label'] = label
+        scores['label'] = str(sentiment_label(scores['compound']))
         return scores
     
+    def _score_texts(self, texts):
+        """
+        텍스트 리스트의 점수 계산 (많으면 프로세스 풀 사용)
+        
+        Returns:
+            list: [(compound, pos, neu, neg), ...]
+        """
+        if len(texts) < self.parallel_threshold or self.max_workers == 1:
+            return [
+                tuple(scores[col] for col in SCORE_COLUMNS)
+                for scores in map(self.analyzer.polarity_scores, texts)
+            ]
+        
+        chunks = [texts[i:i + self.chunk_size] for i in range(0, len(texts), self.chunk_size)]
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            return [scores for chunk in executor.map(_score_chunk, chunks) for scores in chunk]
+    
+    def analyze_texts(self, texts):
+        """
+        텍스트 묶음 감성 분석
+        
+        같은 텍스트는 한 번만 분석하고, 캐시에 있는 텍스트는 분석하지 않습니다.
+        
+        Args:
+            texts: 텍스트 Series 또는 리스트
+            
+        Returns:
+            DataFrame: ['compound', 'pos', 'neu', 'neg', 'label'] (입력과 같은 순서/인덱스)
+        """
+        texts = texts if isinstance(texts, pd.Series) else pd.Series(list(texts), dtype=object)
+        codes, uniques = pd.factorize(texts, use_na_sentinel=True)
+        
+        # 고유 텍스트별 점수 (빈 텍스트와 결측은 기본 점수)
+        unique_scores = np.empty((len(uniques) + 1, len(SCORE_COLUMNS)))
+        unique_scores[-1] = NEUTRAL_SCORES
+        
+        pending = {}
+        for i, value in enumerate(uniques):
+            if not value or pd.isna(value):
+                unique_scores[i] = NEUTRAL_SCORES
+            else:
+                pending[i] = normalize_text(value)
+        
+        # 캐시 조회
+        if self.store is not None and pending:
+            keys = {i: self.store.text_key(text) for i, text in pending.items()}
+            cached = self.store.get_many(set(keys.values()))
+            for i in list(pending):
+                if keys[i] in cached:
+                    unique_scores[i] = cached[keys[i]]
+                    del pending[i]
+        
+        # 새 텍스트만 분석
+        if pending:
+            scores = self._score_texts(list(pending.values()))
+            unique_scores[list(pending)] = scores
+            
+            if self.store is not None:
+                self.store.put_many(zip((keys[i] for i in pending), scores))
+        
+        values = unique_scores[codes]
+        result = pd.DataFrame(values, columns=SCORE_COLUMNS, index=texts.index)
+        result['label'] = sentiment_label(values[:, 0])
+        
+        return result
+    
     def analyze_dataframe(self, df, text_column='text'):
         """
         데이터프레임의 텍스트 컬럼 전체 분석
@@ -61,13 +181,10 @@ class SentimentAnalyzer:
         if df.empty or text_column not in df.columns:
             return df
         
-        results = df[text_column].apply(self.analyze_text)
+        results = self.analyze_texts(df[text_column])
         
-        df['sentiment_compound'] = results.apply(lambda x: x['compound'])
-        df['sentiment_pos'] = results.apply(lambda x: x['pos'])
-        df['sentiment_neu'] = results.apply(lambda x: x['neu'])
-        df['sentiment_neg'] = results.apply(lambda x: x['neg'])
-        df['sentiment_label'] = results.apply(lambda x: x['label'])
+        for col in SCORE_COLUMNS + ['label']:
+            df[f'sentiment_{col}'] = results[col]
         
         return df
     
@@ -0,0 +1,193 @@
+"""
+감성 점수 디스크 캐시
+
+정규화한 텍스트와 분석기 버전의 해시(sha1)를 키로 VADER 점수(compound, pos, neu, neg)를
+SQLite에 저장합니다. 수집 스크립트와 SentimentAnalyzer가 같은 파일을 공유합니다.
+- 이미 점수를 계산한 텍스트는 다시 계산하지 않음 (겹치는 기간 재수집 시 감성 분석 생략)
+- 공백 차이만 있는 텍스트는 같은 키 (VADER 결과도 같음)
+- vaderSentiment 버전이 바뀌면 키가 달라져 자동으로 다시 계산
+- 여러 프로세스/스크립트가 같은 파일을 공유 (WAL 모드)
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import unicodedata
+import weakref
+from importlib.metadata import version, PackageNotFoundError
+
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+
+def _analyzer_version():
+    """vaderSentiment 패키지 버전 (캐시 키에 포함)"""
+    try:
+        return f"vader-{version('vaderSentiment')}"
+    except PackageNotFoundError:
+        return 'vader-unknown'
+
+
+ANALYZER_VERSION = _analyzer_version()
+
+SCORE_COLUMNS = ['compound', 'pos', 'neu', 'neg']
+
+_INSERT_SQL = 'INSERT OR REPLACE INTO scores (key, compound, pos, neu, neg) VALUES (?, ?, ?, ?, ?)'
+
+
+def _flush_pending(conn, lock, pending):
+    """
+    저장 대기 중인 점수를 디스크에 저장하고 대기열 비우기
+    
+    저장소 객체를 참조하지 않으므로 weakref.finalize 콜백으로 쓸 수 있습니다.
+    """
+    with lock:
+        if pending:
+            conn.executemany(_INSERT_SQL, [(key, *scores) for key, scores in pending.items()])
+            conn.commit()
+            pending.clear()
+
+
+def normalize_text(text):
+    """
+    캐시 키용 텍스트 정규화 (유니코드 NFC + 연속 공백을 하나로 + 앞뒤 공백 제거)
+    
+    VADER는 공백으로 토큰을 나누므로 정규화 전후의 점수가 같습니다.
+    """
+    return ' '.join(unicodedata.normalize('NFC', str(text)).split())
+
+
+class SentimentStore:
+    """텍스트 해시 기반 감성 점수 저장소"""
+    
+    # SQLite 바인딩 변수 개수 제한을 넘지 않도록 조회를 나누는 크기
+    QUERY_CHUNK = 500
+    
+    def __init__(self, path=None, flush_size=500):
+        """
+        Args:
+            path: SQLite 파일 경로 (기본: data/.cache/sentiment.sqlite)
+            flush_size: polarity_scores로 새로 계산한 점수를 모아서 저장하는 개수
+        """
+        if path is None:
+            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            path = os.path.join(base_dir, 'data', '.cache', 'sentiment.sqlite')
+        
+        self.path = path
+        self.flush_size = flush_size
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        
+        self.conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS scores ('
+            'key TEXT PRIMARY KEY, compound REAL, pos REAL, neu REAL, neg REAL)'
+        )
+        self.conn.commit()
+        
+        self._lock = threading.RLock()
+        self._pending = {}
+        self._analyzer = None
+        self.hits = 0
+        self.misses = 0
+        
+        # 저장소가 회수되거나 스크립트가 종료될 때 남은 점수 저장
+        # (finalize는 저장소를 참조하지 않아 저장소를 살려 두지 않음)
+        self._finalizer = weakref.finalize(self, _flush_pending, self.conn, self._lock, self._pending)
+    
+    @staticmethod
+    def text_key(text):
+        """텍스트의 캐시 키 (정규화 텍스트 + 분석기 버전의 sha1 hex)"""
+        payload = f"{ANALYZER_VERSION}\n{normalize_text(text)}"
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+    
+    def get_many(self, keys):
+        """
+        여러 키의 점수 조회
+        
+        Args:
+            keys: 캐시 키 리스트
+        
+        Returns:
+            dict: {key: (compound, pos, neu, neg)} - 저장된 키만 포함
+        """
+        keys = list(keys)
+        
+        with self._lock:
+            found = {key: self._pending[key] for key in keys if key in self._pending}
+            
+            for i in range(0, len(keys), self.QUERY_CHUNK):
+                chunk = keys[i:i + self.QUERY_CHUNK]
+                placeholders = ','.join('?' * len(chunk))
+                rows = self.conn.execute(
+                    f'SELECT key, compound, pos, neu, neg FROM scores WHERE key IN ({placeholders})',
+                    chunk
+                )
+                for key, *scores in rows:
+                    found[key] = tuple(scores)
+        
+        return found
+    
+    def put_many(self, items):
+        """
+        여러 점수 저장
+        
+        Args:
+            items: [(key, (compound, pos, neu, neg)), ...]
+        """
+        with self._lock:
+            self.conn.executemany(_INSERT_SQL, [(key, *scores) for key, scores in items])
+            self.conn.commit()
+    
+    def polarity_scores(self, text):
+        """
+        캐시를 먼저 확인하는 VADER polarity_scores
+        
+        SentimentIntensityAnalyzer.polarity_scores 대신 그대로 쓸 수 있습니다.
+        새로 계산한 점수는 flush_size개씩 모아서 저장합니다.
+        잠금은 캐시 조회와 저장 대기열 갱신에만 걸고 VADER 계산은 잠금 밖에서 실행하므로
+        여러 스레드가 동시에 다른 텍스트를 분석할 수 있습니다.
+        
+        Args:
+            text: 분석할 텍스트
+        
+        Returns:
+            dict: {'neg', 'neu', 'pos', 'compound'}
+        """
+        key = self.text_key(text)
+        cached = self.get_many([key]).get(key)
+        
+        if cached is not None:
+            with self._lock:
+                self.hits += 1
+            return dict(zip(SCORE_COLUMNS, cached))
+        
+        with self._lock:
+            if self._analyzer is None:
+                self._analyzer = SentimentIntensityAnalyzer()
+            analyzer = self._analyzer
+        
+        scores = analyzer.polarity_scores(normalize_text(text))
+        cached = tuple(scores[col] for col in SCORE_COLUMNS)
+        
+        with self._lock:
+            self.misses += 1
+            self._pending[key] = cached
+            
+            if len(self._pending) >= self.flush_size:
+                self.flush()
+        
+        return dict(zip(SCORE_COLUMNS, cached))
+    
+    def flush(self):
+        """모아 둔 점수를 디스크에 저장"""
+        _flush_pending(self.conn, self._lock, self._pending)
+    
+    def __len__(self):
+        self.flush()
+        return self.conn.execute('SELECT COUNT(*) FROM scores').fetchone()[0]
+    
+    def close(self):
+        """남은 점수 저장 후 연결 종료"""
+        self._finalizer()
+        self.conn.close()